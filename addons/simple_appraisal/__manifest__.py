@@ -10,7 +10,7 @@
     'website': '',
     'category': 'Human Resources',
     'license': 'LGPL-3',
-    'depends': ['hr', 'base'],
+    'depends': ['hr', 'base', 'simple_hr_profiling'],
     'data': [
         'security/ir.model.access.csv',
         'views/hr_appraisal_views.xml',
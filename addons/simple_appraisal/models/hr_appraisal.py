@@ -1,9 +1,35 @@
-from odoo import models, fields, api
+import copy
+
+from odoo import models, fields, api, tools
+from odoo.exceptions import UserError
 from datetime import datetime, date, timedelta
 
+SCORE_FIELDS = ['technical_skills', 'communication', 'teamwork', 'leadership', 'problem_solving']
+
+# lower bound of each rating bucket, best first
+RATING_THRESHOLDS = [
+    (4.5, 'excellent'),
+    (3.5, 'good'),
+    (2.5, 'satisfactory'),
+    (1.5, 'needs_improvement'),
+]
+
+RATINGS = [rating for __, rating in RATING_THRESHOLDS] + ['unsatisfactory']
+
+PERCENTILES = [0.25, 0.5, 0.75, 0.9]
+
+# target state -> (states it can be reached from, action method performing the transition)
+STATE_TRANSITIONS = {
+    'pending': (['new'], 'action_start_appraisal'),
+    'done': (['pending'], 'action_complete_appraisal'),
+    'cancel': (['new', 'pending'], 'action_cancel_appraisal'),
+    'new': (['done', 'cancel'], 'action_reset_to_draft'),
+}
+
 
 class HrAppraisal(models.Model):
     _name = 'hr.appraisal'
+    _inherit = ['simple.profiling.mixin']
     _description = 'Employee Appraisal'
     _order = 'date_close desc'
 
@@ -31,14 +57,14 @@ class HrAppraisal(models.Model):
     problem_solving = fields.Float(string='Problem Solving', default=0.0, help="Score out of 5")
     
     # Overall rating
-    final_score = fields.Float(string='Final Score', compute='_compute_final_score', store=True)
+    final_score = fields.Float(string='Final Score', compute='_compute_scores', store=True)
     overall_rating = fields.Selection([
         ('excellent', 'Excellent (4.5-5.0)'),
         ('good', 'Good (3.5-4.4)'),
         ('satisfactory', 'Satisfactory (2.5-3.4)'),
         ('needs_improvement', 'Needs Improvement (1.5-2.4)'),
         ('unsatisfactory', 'Unsatisfactory (0.0-1.4)')
-    ], string='Overall Rating', compute='_compute_overall_rating', store=True)
+    ], string='Overall Rating', compute='_compute_scores', store=True)
     
     # Comments and feedback
     manager_feedback = fields.Text(string='Manager Feedback')
@@ -51,50 +77,276 @@ class HrAppraisal(models.Model):
     next_appraisal_date = fields.Date(string='Next Appraisal Date', 
                                      default=lambda self: date.today() + timedelta(days=365))
     
+    def init(self):
+        # open appraisal lookups per employee and period
+        tools.create_index(self._cr, 'hr_appraisal_employee_id_date_close_index',
+                           self._table, ['employee_id', 'date_close'])
+    
     @api.depends('technical_skills', 'communication', 'teamwork', 'leadership', 'problem_solving')
-    def _compute_final_score(self):
+    def _compute_scores(self):
+        # final score and rating in one pass, so both are flushed in the same UPDATE
         for record in self:
             scores = [record.technical_skills, record.communication, record.teamwork, 
                      record.leadership, record.problem_solving]
             valid_scores = [score for score in scores if score > 0]
             record.final_score = sum(valid_scores) / len(valid_scores) if valid_scores else 0.0
+            record.overall_rating = self._get_rating(record.final_score)
     
-    @api.depends('final_score')
-    def _compute_overall_rating(self):
-        for record in self:
-            score = record.final_score
-            if score >= 4.5:
-                record.overall_rating = 'excellent'
-            elif score >= 3.5:
-                record.overall_rating = 'good'
-            elif score >= 2.5:
-                record.overall_rating = 'satisfactory'
-            elif score >= 1.5:
-                record.overall_rating = 'needs_improvement'
-            else:
-                record.overall_rating = 'unsatisfactory'
+    @api.model
+    def _get_rating(self, score):
+        for threshold, rating in RATING_THRESHOLDS:
+            if score >= threshold:
+                return rating
+        return 'unsatisfactory'
+    
+    @api.model
+    def _recompute_scores_sql(self, domain=None):
+        """Recompute final score and rating for every appraisal matching ``domain``.
+
+        Set-based equivalent of :meth:`_compute_scores` for whole cycles: one
+        UPDATE with CASE expressions. Zero scores are ignored and the valid
+        scores are added left to right in double precision, so the results
+        are identical to the Python computation. Like :meth:`write`, it
+        stamps ``write_uid``/``write_date``, which also makes the cached
+        analytics of these appraisals stale.
+        Returns the number of updated appraisals.
+        """
+        self.flush_model(SCORE_FIELDS + ['final_score', 'overall_rating'])
+        query = self._where_calc(domain or [])
+        self._apply_ir_rules(query, 'write')
+        from_clause, where_clause, where_params = query.get_sql()
+        valid = lambda name: f'CASE WHEN {name} > 0 THEN {name} ELSE 0.0 END'
+        count = lambda name: f'CASE WHEN {name} > 0 THEN 1 ELSE 0 END'
+        score_sum = ' + '.join(valid(f'"hr_appraisal"."{name}"') for name in SCORE_FIELDS)
+        score_count = ' + '.join(count(f'"hr_appraisal"."{name}"') for name in SCORE_FIELDS)
+        rating_cases = ' '.join(
+            f"WHEN scores.final_score >= {threshold} THEN '{rating}'" for threshold, rating in RATING_THRESHOLDS
+        )
+        self.env.cr.execute(f"""
+            WITH scores AS (
+                SELECT "hr_appraisal".id,
+                       CASE WHEN ({score_count}) > 0
+                            THEN ({score_sum}) / ({score_count})
+                            ELSE 0.0
+                       END AS final_score
+                  FROM {from_clause}
+                 WHERE {where_clause or 'TRUE'}
+            )
+            UPDATE hr_appraisal AS appraisal
+               SET final_score = scores.final_score,
+                   overall_rating = CASE {rating_cases} ELSE 'unsatisfactory' END,
+                   write_uid = %s,
+                   write_date = now() at time zone 'UTC'
+              FROM scores
+             WHERE appraisal.id = scores.id
+        """, where_params + [self.env.uid])
+        updated = self.env.cr.rowcount
+        self.invalidate_model(['final_score', 'overall_rating', 'write_uid', 'write_date'])
+        return updated
+    
+    @api.model
+    def get_score_analytics(self, date_from=None, date_to=None, department_ids=None, states=('done',), use_cache=True):
+        """Score analytics computed in the database.
+
+        Returns, per department, the appraisal count, final score average
+        and percentiles, per-skill averages and the rating histogram, and
+        the same figures per closing year. Skill averages ignore zero
+        (unrated) scores like the final score does. Appraisals are filtered
+        on closing date, department and state.
+
+        Results are cached per user and companies, keyed on a stamp of the
+        matching appraisals (see :meth:`_score_analytics_stamp`): a cheap
+        query revalidates them on every call, so any committed change in
+        the requested scope is seen by every worker.
+        """
+        args = (
+            fields.Date.to_string(fields.Date.to_date(date_from)) if date_from else None,
+            fields.Date.to_string(fields.Date.to_date(date_to)) if date_to else None,
+            tuple(sorted(department_ids or [])),
+            tuple(states or ()),
+        )
+        if not use_cache:
+            return self._compute_score_analytics(*args)
+        stamp = self._score_analytics_stamp(*args)
+        # the cached dict is shared by every caller of this worker
+        return copy.deepcopy(self._get_score_analytics_cached(*args, stamp))
+    
+    @api.model
+    @tools.ormcache('self.env.uid', 'tuple(self.env.companies.ids)',
+                    'date_from', 'date_to', 'department_ids', 'states', 'stamp')
+    def _get_score_analytics_cached(self, date_from, date_to, department_ids, states, stamp):
+        return self._compute_score_analytics(date_from, date_to, department_ids, states)
+    
+    @api.model
+    def _score_analytics_stamp(self, date_from, date_to, department_ids, states):
+        """Count and latest change of the appraisals, employees and departments the analytics read.
+
+        Creating or deleting an appraisal changes the count, writing one
+        (including :meth:`_recompute_scores_sql`) its ``write_date``; moving
+        an employee changes the count of the departments involved and the
+        employee's ``write_date``, renaming a department the departments'.
+        """
+        from_clause, where_clause, where_params = self._score_analytics_query(date_from, date_to, department_ids, states)
+        self.env.cr.execute(f"""
+            SELECT COUNT(*), MAX("hr_appraisal".write_date), MAX(employee.write_date),
+                   (SELECT MAX(write_date) FROM hr_department)
+              FROM {from_clause}
+         LEFT JOIN hr_employee AS employee ON employee.id = "hr_appraisal".employee_id
+             WHERE {where_clause or 'TRUE'}
+        """, where_params)
+        return self.env.cr.fetchone()
+    
+    @api.model
+    def _score_analytics_query(self, date_from, date_to, department_ids, states):
+        domain = []
+        if date_from:
+            domain.append(('date_close', '>=', date_from))
+        if date_to:
+            domain.append(('date_close', '<=', date_to))
+        if department_ids:
+            domain.append(('employee_id.department_id', 'in', department_ids))
+        if states:
+            domain.append(('state', 'in', list(states)))
+        self.flush_model()
+        self.env['hr.employee'].flush_model(['department_id'])
+        self.env['hr.department'].flush_model(['name', 'parent_id'])
+        query = self._where_calc(domain)
+        self._apply_ir_rules(query, 'read')
+        return query.get_sql()
+    
+    @api.model
+    def _compute_score_analytics(self, date_from, date_to, department_ids, states):
+        from_clause, where_clause, where_params = self._score_analytics_query(date_from, date_to, department_ids, states)
+        
+        measures = ', '.join([
+            'COUNT(*)',
+            'AVG("hr_appraisal".final_score)',
+            'percentile_cont(%s::float8[]) WITHIN GROUP (ORDER BY "hr_appraisal".final_score)',
+        ] + [
+            f'AVG(NULLIF("hr_appraisal".{name}, 0))' for name in SCORE_FIELDS
+        ] + [
+            f"""COUNT(*) FILTER (WHERE "hr_appraisal".overall_rating = '{rating}')""" for rating in RATINGS
+        ])
+        
+        def grouped(group_expression):
+            self.env.cr.execute(f"""
+                SELECT {group_expression}, {measures}
+                  FROM {from_clause}
+             LEFT JOIN hr_employee AS employee ON employee.id = "hr_appraisal".employee_id
+                 WHERE {where_clause or 'TRUE'}
+              GROUP BY 1
+              ORDER BY 1
+            """, [PERCENTILES] + where_params)
+            for row in self.env.cr.fetchall():
+                count, average, percentiles = row[1:4]
+                skills = row[4:4 + len(SCORE_FIELDS)]
+                histogram = row[4 + len(SCORE_FIELDS):]
+                yield row[0], {
+                    'count': count,
+                    'final_score_avg': average or 0.0,
+                    'final_score_percentiles': dict(zip(map(str, PERCENTILES), percentiles or [])),
+                    'skill_avg': {name: value or 0.0 for name, value in zip(SCORE_FIELDS, skills)},
+                    'rating_histogram': dict(zip(RATINGS, histogram)),
+                }
+        
+        departments = list(grouped('employee.department_id'))
+        department_names = {
+            department.id: department.display_name
+            for department in self.env['hr.department'].browse([key for key, __ in departments if key])
+        }
+        return {
+            'departments': [dict(figures, department_id=key, department_name=department_names.get(key, False))
+                            for key, figures in departments],
+            'years': [dict(figures, year=int(key))
+                      for key, figures in grouped('EXTRACT(YEAR FROM "hr_appraisal".date_close)') if key],
+        }
+    
+    @api.model
+    def launch_cycle(self, date_start, date_close, department_ids=None, employee_domain=None, name=None):
+        """Create the appraisals of a cycle for every matching employee.
+
+        Employees come from ``employee_domain`` and/or ``department_ids``
+        (including sub-departments). The employee and manager hierarchy is
+        read once, employees who already have an open appraisal overlapping
+        the period are skipped with one indexed lookup, and all appraisals
+        are created with one multi-create.
+        Returns the created and skipped employee counts and the appraisal ids.
+        """
+        date_start = fields.Date.to_date(date_start)
+        date_close = fields.Date.to_date(date_close)
+        domain = list(employee_domain or [])
+        if department_ids:
+            domain.append(('department_id', 'child_of', department_ids))
+        employees = self.env['hr.employee'].search(domain, order='id')
+        if not employees:
+            return {'created': 0, 'skipped': 0, 'appraisal_ids': []}
+        # prefetch employees and managers so manager_id resolves from cache
+        employees.read(['name', 'parent_id'])
+        employees.parent_id.read(['name'])
+        
+        self.flush_model(['employee_id', 'state', 'date_start', 'date_close'])
+        self.env.cr.execute("""
+            SELECT DISTINCT employee_id
+              FROM hr_appraisal
+             WHERE employee_id = ANY(%s)
+               AND state IN ('new', 'pending')
+               AND date_close >= %s
+               AND date_start <= %s
+        """, [employees.ids, date_start, date_close])
+        open_employee_ids = {row[0] for row in self.env.cr.fetchall()}
+        
+        name = name or f'{date_start.year} Annual Appraisal'
+        appraisals = self.create([{
+            'name': f'{name} - {employee.name}',
+            'employee_id': employee.id,
+            'date_start': date_start,
+            'date_close': date_close,
+        } for employee in employees if employee.id not in open_employee_ids])
+        return {
+            'created': len(appraisals),
+            'skipped': len(open_employee_ids),
+            'appraisal_ids': appraisals.ids,
+        }
+    
+    @api.model
+    def transition_cycle(self, domain, state):
+        """Move every appraisal matching ``domain`` to ``state`` with one batched write.
+
+        Only appraisals in a state the transition is allowed from are
+        touched. Returns the number of transitioned appraisals.
+        """
+        if state not in STATE_TRANSITIONS:
+            raise UserError(f"Unknown appraisal state: {state}")
+        from_states, method = STATE_TRANSITIONS[state]
+        appraisals = self.search(list(domain) + [('state', 'in', from_states)])
+        getattr(appraisals, method)()
+        return len(appraisals)
+    
+    def _filter_state(self, target_state):
+        from_states = STATE_TRANSITIONS[target_state][0]
+        return self.filtered(lambda appraisal: appraisal.state in from_states)
     
     def action_start_appraisal(self):
         """Start the appraisal process"""
-        self.write({
+        self._filter_state('pending').write({
             'state': 'pending',
             'meeting_date': fields.Datetime.now()
         })
     
     def action_complete_appraisal(self):
         """Complete the appraisal"""
-        self.write({
+        self._filter_state('done').write({
             'state': 'done'
         })
     
     def action_cancel_appraisal(self):
         """Cancel the appraisal"""
-        self.write({
+        self._filter_state('cancel').write({
             'state': 'cancel'
         })
     
     def action_reset_to_draft(self):
         """Reset to draft"""
-        self.write({
+        self._filter_state('new').write({
             'state': 'new'
         })
@@ -0,0 +1,2 @@
+from . import test_appraisal_performance
+from . import test_appraisal_scores
@@ -0,0 +1,115 @@
+from datetime import date
+
+from odoo.tests import TransactionCase, tagged
+
+BATCH_SIZE = 50
+
+SCORES = {
+    'technical_skills': 4.0,
+    'communication': 3.5,
+    'teamwork': 4.5,
+    'leadership': 3.0,
+    'problem_solving': 4.0,
+}
+
+
+@tagged('post_install', '-at_install')
+class TestAppraisalQueryCount(TransactionCase):
+    """Cycles and score recomputations run in a constant number of queries per batch of employees"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.department = cls.env['hr.department'].create({'name': 'Appraisal Department'})
+        cls.manager = cls.env['hr.employee'].create({'name': 'Appraisal Manager'})
+        cls.employees = cls.env['hr.employee'].create([{
+            'name': f'Appraisal Employee {index}',
+            'department_id': cls.department.id,
+            'parent_id': cls.manager.id,
+        } for index in range(BATCH_SIZE)])
+        cls.date_start = date(2030, 1, 1)
+        cls.date_close = date(2030, 12, 31)
+        cls.cycle_domain = [('employee_id', 'in', cls.employees.ids), ('date_close', '=', cls.date_close)]
+
+    def _launch(self):
+        result = self.env['hr.appraisal'].launch_cycle(
+            self.date_start, self.date_close, department_ids=self.department.ids)
+        return self.env['hr.appraisal'].browse(result['appraisal_ids'])
+
+    def test_create(self):
+        vals_list = [dict(SCORES, employee_id=employee.id, date_start=self.date_start, date_close=self.date_close)
+                     for employee in self.employees]
+        with self.assertQueryCount(6):
+            appraisals = self.env['hr.appraisal'].create(vals_list)
+        self.assertEqual(set(appraisals.mapped('overall_rating')), {'good'})
+
+    def test_launch_cycle(self):
+        with self.assertQueryCount(12):
+            result = self.env['hr.appraisal'].launch_cycle(
+                self.date_start, self.date_close, department_ids=self.department.ids)
+        self.assertEqual(result['created'], BATCH_SIZE)
+        # a second launch skips the employees with an open appraisal
+        with self.assertQueryCount(8):
+            result = self.env['hr.appraisal'].launch_cycle(
+                self.date_start, self.date_close, department_ids=self.department.ids)
+        self.assertEqual((result['created'], result['skipped']), (0, BATCH_SIZE))
+
+    def test_transition_cycle(self):
+        self._launch()
+        with self.assertQueryCount(5):
+            count = self.env['hr.appraisal'].transition_cycle(self.cycle_domain, 'pending')
+        self.assertEqual(count, BATCH_SIZE)
+        with self.assertQueryCount(5):
+            count = self.env['hr.appraisal'].transition_cycle(self.cycle_domain, 'done')
+        self.assertEqual(count, BATCH_SIZE)
+
+    def test_score_write(self):
+        appraisals = self._launch()
+        with self.assertQueryCount(3):
+            appraisals.write(SCORES)
+        self.assertEqual(set(appraisals.mapped('final_score')), {3.8})
+
+    def test_recompute_scores_sql(self):
+        appraisals = self._launch()
+        appraisals.write(SCORES)
+        with self.assertQueryCount(2):
+            count = self.env['hr.appraisal']._recompute_scores_sql(self.cycle_domain)
+        self.assertEqual(count, BATCH_SIZE)
+        # the raw UPDATE is stamped like an ORM write
+        user = self.env['res.users'].create({'name': 'Appraisal Recompute User', 'login': 'appraisal_recompute'})
+        self.env.cr.execute("UPDATE hr_appraisal SET write_date = '2000-01-01' WHERE id IN %s", [tuple(appraisals.ids)])
+        self.env['hr.appraisal'].with_user(user).sudo()._recompute_scores_sql(self.cycle_domain)
+        self.assertEqual(appraisals.write_uid, user)
+        self.assertGreater(min(appraisals.mapped('write_date')).year, 2000)
+
+    def test_score_analytics(self):
+        appraisals = self._launch()
+        appraisals.write(SCORES)
+        appraisals.action_start_appraisal()
+        appraisals.action_complete_appraisal()
+        with self.assertQueryCount(6):
+            analytics = self.env['hr.appraisal'].get_score_analytics(
+                date_from=self.date_start, department_ids=self.department.ids, use_cache=False)
+        self.assertEqual(analytics['departments'][0]['count'], BATCH_SIZE)
+        self.assertEqual(analytics['years'][0]['year'], 2030)
+        self.assertAlmostEqual(analytics['years'][0]['final_score_avg'], 3.8)
+
+    def test_score_analytics_cache(self):
+        appraisals = self._launch()
+        appraisals.write(dict(SCORES, state='done'))
+        Appraisal = self.env['hr.appraisal']
+        analytics = Appraisal.get_score_analytics(department_ids=self.department.ids)
+        # only the stamp is read on a cache hit
+        with self.assertQueryCount(1):
+            cached = Appraisal.get_score_analytics(department_ids=self.department.ids)
+        self.assertEqual(cached, analytics)
+        # callers get their own copy of the cached result
+        cached['departments'].clear()
+        self.assertEqual(Appraisal.get_score_analytics(department_ids=self.department.ids), analytics)
+        # moving employees regroups their appraisals without touching them
+        other = self.env['hr.department'].create({'name': 'Other Appraisal Department'})
+        self.assertFalse(Appraisal.get_score_analytics(department_ids=other.ids)['departments'])
+        self.employees[:10].write({'department_id': other.id})
+        for department, count in ((self.department, BATCH_SIZE - 10), (other, 10)):
+            analytics = Appraisal.get_score_analytics(department_ids=department.ids)
+            self.assertEqual([group['count'] for group in analytics['departments']], [count])
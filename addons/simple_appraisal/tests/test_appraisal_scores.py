@@ -0,0 +1,44 @@
+import random
+from datetime import date
+
+from odoo.tests import TransactionCase, tagged
+
+from odoo.addons.simple_appraisal.models.hr_appraisal import SCORE_FIELDS
+
+
+@tagged('post_install', '-at_install')
+class TestAppraisalScores(TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.employee = cls.env['hr.employee'].create({'name': 'Scored Employee'})
+
+    def test_rating_thresholds(self):
+        Appraisal = self.env['hr.appraisal']
+        for score, rating in [(5.0, 'excellent'), (4.5, 'excellent'), (4.49, 'good'), (3.5, 'good'),
+                              (2.5, 'satisfactory'), (1.5, 'needs_improvement'), (1.49, 'unsatisfactory'),
+                              (0.0, 'unsatisfactory')]:
+            self.assertEqual(Appraisal._get_rating(score), rating)
+
+    def test_sql_recompute_matches_orm_compute(self):
+        """The SQL bulk path must give the exact same scores and ratings as the ORM compute"""
+        rng = random.Random(10)
+        # quarter steps, decimals, and zeros for unrated skills
+        values = [0.0, 0.0, 1.0, 1.25, 2.5, 3.3, 3.75, 4.1, 4.5, 5.0]
+        appraisals = self.env['hr.appraisal'].create([dict(
+            {name: rng.choice(values) for name in SCORE_FIELDS},
+            employee_id=self.employee.id,
+            date_start=date(2031, 1, 1),
+            date_close=date(2031, 12, 31),
+        ) for __ in range(500)])
+        expected = {appraisal.id: (appraisal.final_score, appraisal.overall_rating) for appraisal in appraisals}
+
+        self.env.cr.execute("UPDATE hr_appraisal SET final_score = -1, overall_rating = NULL WHERE id IN %s",
+                            [tuple(appraisals.ids)])
+        appraisals.invalidate_recordset(['final_score', 'overall_rating'])
+        count = self.env['hr.appraisal']._recompute_scores_sql([('id', 'in', appraisals.ids)])
+
+        self.assertEqual(count, len(appraisals))
+        self.assertEqual({appraisal.id: (appraisal.final_score, appraisal.overall_rating)
+                          for appraisal in appraisals}, expected)
@@ -1,6 +1,6 @@
 {
     'name': 'Simple Approvals',
-    'version': '16.0.1.0.0',
+    'version': '16.0.1.2.0',
     'summary': 'Simple Approval Workflow Management for Community Edition',
     'description': '''
         Simple Approvals module compatible with Odoo 16.0 Community Edition.
@@ -10,7 +10,7 @@
     'website': '',
     'category': 'Human Resources',
     'license': 'LGPL-3',
-    'depends': ['hr', 'base'],
+    'depends': ['hr', 'base', 'simple_hr_profiling'],
     'data': [
         'security/ir.model.access.csv',
         'views/approval_request_views.xml',
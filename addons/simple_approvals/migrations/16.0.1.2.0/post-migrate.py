@@ -0,0 +1,12 @@
+def migrate(cr, version):
+    """Start each category counter after the requests that already exist"""
+    cr.execute("""
+        UPDATE approval_category AS category
+           SET request_sequence = existing.total
+          FROM (
+                SELECT category_id, COUNT(*) AS total
+                  FROM approval_request
+              GROUP BY category_id
+          ) AS existing
+         WHERE category.id = existing.category_id
+    """)
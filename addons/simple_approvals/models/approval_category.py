@@ -3,6 +3,7 @@ from odoo import models, fields, api
 
 class ApprovalCategory(models.Model):
     _name = 'approval.category'
+    _inherit = ['simple.profiling.mixin']
     _description = 'Approval Category'
     _order = 'sequence, name'
 
@@ -32,15 +33,48 @@ class ApprovalCategory(models.Model):
     has_period = fields.Boolean(string='Has Period Field', default=False)
     
     # Statistics
-    request_count = fields.Integer(string='Request Count', compute='_compute_request_count')
+    request_ids = fields.One2many('approval.request', 'category_id', string='Requests')
+    request_count = fields.Integer(string='Request Count', compute='_compute_request_count', store=True)
+    request_sequence = fields.Integer(string='Last Request Number', default=0, readonly=True, copy=False)
     
-    @api.depends('name')
+    @api.depends('request_ids')
     def _compute_request_count(self):
+        """Count requests for the whole recordset with a single grouped query"""
+        counts = {}
+        if self.ids:
+            groups = self.env['approval.request']._read_group(
+                [('category_id', 'in', self.ids)], ['category_id'], ['category_id'])
+            counts = {group['category_id'][0]: group['category_id_count'] for group in groups}
         for record in self:
-            record.request_count = self.env['approval.request'].search_count([
-                ('category_id', '=', record.id)
-            ])
+            record.request_count = counts.get(record.id, 0)
     
+    def _reserve_request_numbers(self, counts):
+        """Reserve consecutive request numbers per category.
+
+        ``counts`` maps category ids to the amount of numbers to reserve.
+        The category rows are locked for the rest of the transaction, so
+        concurrent submissions never receive the same number.
+        Returns a dict mapping category ids to their first reserved number.
+        """
+        if not counts:
+            return {}
+        category_ids = sorted(counts)
+        self.flush_model(['request_sequence'])
+        # lock in a stable order to avoid deadlocks between concurrent batches
+        self.env.cr.execute("""
+            SELECT id FROM approval_category WHERE id IN %s ORDER BY id FOR UPDATE
+        """, [tuple(category_ids)])
+        self.env.cr.execute("""
+            UPDATE approval_category AS category
+               SET request_sequence = COALESCE(category.request_sequence, 0) + reserved.amount
+              FROM unnest(%s, %s) AS reserved(id, amount)
+             WHERE category.id = reserved.id
+         RETURNING category.id, category.request_sequence - reserved.amount + 1
+        """, [category_ids, [counts[category_id] for category_id in category_ids]])
+        first_numbers = dict(self.env.cr.fetchall())
+        self.invalidate_model(['request_sequence'])
+        return first_numbers
+
     def action_view_requests(self):
         """View requests for this category"""
         return {
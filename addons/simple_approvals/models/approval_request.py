@@ -1,14 +1,18 @@
-from odoo import models, fields, api
+from odoo import models, fields, api, tools
+from odoo.exceptions import UserError
+from collections import Counter
 from datetime import datetime, date
 
 
 class ApprovalRequest(models.Model):
     _name = 'approval.request'
+    _inherit = ['simple.profiling.mixin']
     _description = 'Approval Request'
-    _order = 'create_date desc'
+    _order = 'create_date desc, id desc'
 
     name = fields.Char(string='Request Subject', required=True)
-    category_id = fields.Many2one('approval.category', string='Category', required=True)
+    # request_count is recomputed per category on every create, see approval.category._compute_request_count
+    category_id = fields.Many2one('approval.category', string='Category', required=True, index=True)
     request_owner_id = fields.Many2one('res.users', string='Request Owner', 
                                       default=lambda self: self.env.user, required=True)
     employee_id = fields.Many2one('hr.employee', string='Employee', 
@@ -53,7 +57,18 @@ class ApprovalRequest(models.Model):
     
     # Computed fields
     duration_days = fields.Integer(string='Duration (Days)', compute='_compute_duration')
-    can_approve = fields.Boolean(string='Can Approve', compute='_compute_can_approve')
+    can_approve = fields.Boolean(string='Can Approve', compute='_compute_can_approve',
+                                 search='_search_can_approve')
+    
+    def init(self):
+        # approver inbox and per-owner lists filter on these pairs
+        tools.create_index(self._cr, 'approval_request_state_category_id_index',
+                           self._table, ['state', 'category_id'])
+        tools.create_index(self._cr, 'approval_request_request_owner_id_state_index',
+                           self._table, ['request_owner_id', 'state'])
+        # keyset pagination on _order, see base.search_page in simple_hr_api
+        tools.create_index(self._cr, 'approval_request_create_date_id_index',
+                           self._table, ['create_date DESC', 'id DESC'])
     
     @api.depends('date_start', 'date_end')
     def _compute_duration(self):
@@ -72,6 +87,18 @@ class ApprovalRequest(models.Model):
                 self.env.user in record.approver_ids
             )
     
+    def _search_can_approve(self, operator, value):
+        """Pending requests of a category the current user approves, as one SQL join"""
+        if operator not in ('=', '!=') or not isinstance(value, bool):
+            raise UserError("Unsupported search on Can Approve.")
+        domain = [
+            ('state', '=', 'pending'),
+            ('category_id.approver_ids', 'in', self.env.user.ids),
+        ]
+        if (operator == '=') != value:
+            domain = ['!', '&'] + domain
+        return domain
+    
     def action_submit(self):
         """Submit the request for approval"""
         self.write({
@@ -80,36 +107,106 @@ class ApprovalRequest(models.Model):
         })
     
     def action_approve(self):
-        """Approve the request"""
-        if not self.can_approve:
+        """Approve the requests"""
+        allowed, denied = self._split_by_approval_right()
+        if denied:
             raise UserError("You don't have permission to approve this request.")
-        
-        self.write({
-            'state': 'approved',
-            'approved_by': self.env.user.id,
-            'approval_date': fields.Datetime.now()
-        })
+        allowed._review('approved')
     
     def action_refuse(self):
-        """Refuse the request"""
-        if not self.can_approve:
+        """Refuse the requests"""
+        allowed, denied = self._split_by_approval_right()
+        if denied:
             raise UserError("You don't have permission to refuse this request.")
-        
-        self.write({
-            'state': 'refused',
-            'refused_by': self.env.user.id,
-            'approval_date': fields.Datetime.now()
-        })
+        allowed._review('refused')
     
     def action_cancel(self):
-        """Cancel the request"""
-        if self.request_owner_id != self.env.user:
+        """Cancel the requests"""
+        if self.filtered(lambda record: record.request_owner_id != self.env.user):
             raise UserError("Only the request owner can cancel this request.")
         
         self.write({
             'state': 'cancel'
         })
     
+    def action_approve_selected(self):
+        """Approve the selected requests the user may approve and report the others"""
+        return self._review_notification(self.bulk_approve(), 'approved')
+    
+    def action_refuse_selected(self):
+        """Refuse the selected requests the user may refuse and report the others"""
+        return self._review_notification(self.bulk_refuse(), 'refused')
+    
+    def bulk_approve(self, comment=None):
+        """Approve every request of the recordset the current user may approve.
+
+        Requests that are not pending or not approvable by the user are
+        skipped instead of failing the whole batch.
+        Returns a summary with the processed and denied ids and a result per request.
+        """
+        return self._bulk_review('approved', comment)
+    
+    def bulk_refuse(self, reason=None):
+        """Refuse every request of the recordset the current user may refuse.
+
+        Same contract as :meth:`bulk_approve`.
+        """
+        return self._bulk_review('refused', reason)
+    
+    def _split_by_approval_right(self):
+        """Partition the recordset into (allowed, denied) with one query"""
+        if not self:
+            return self, self
+        allowed = self.search([('id', 'in', self.ids), ('can_approve', '=', True)])
+        return allowed, self - allowed
+    
+    def _review(self, state, comment=None):
+        """Write the approval decision for the whole recordset in one write"""
+        if not self:
+            return
+        vals = {
+            'state': state,
+            'approval_date': fields.Datetime.now(),
+        }
+        if state == 'approved':
+            vals['approved_by'] = self.env.user.id
+            if comment:
+                vals['approval_comment'] = comment
+        else:
+            vals['refused_by'] = self.env.user.id
+            if comment:
+                vals['refusal_reason'] = comment
+        self.write(vals)
+    
+    def _bulk_review(self, state, comment=None):
+        allowed, denied = self._split_by_approval_right()
+        allowed._review(state, comment)
+        results = [{'id': record.id, 'result': state} for record in allowed]
+        results += [
+            {'id': record.id, 'result': 'denied' if record.state == 'pending' else 'invalid_state'}
+            for record in denied
+        ]
+        return {
+            'processed_ids': allowed.ids,
+            'denied_ids': denied.ids,
+            'results': results,
+        }
+    
+    def _review_notification(self, summary, state):
+        processed = len(summary['processed_ids'])
+        skipped = len(summary['denied_ids'])
+        message = f"{processed} request(s) {state}."
+        if skipped:
+            message += f" {skipped} request(s) skipped: not pending or no permission."
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'display_notification',
+            'params': {
+                'message': message,
+                'type': 'warning' if skipped else 'success',
+            },
+        }
+    
     def action_draft(self):
         """Reset to draft"""
         self.write({
@@ -121,11 +218,18 @@ class ApprovalRequest(models.Model):
             'refusal_reason': ''
         })
     
-    @api.model
-    def create(self, vals):
-        """Auto-generate request name if not provided"""
-        if not vals.get('name') and vals.get('category_id'):
-            category = self.env['approval.category'].browse(vals['category_id'])
-            sequence = self.search_count([('category_id', '=', vals['category_id'])]) + 1
-            vals['name'] = f"{category.name} #{sequence:03d}"
-        return super().create(vals)
+    @api.model_create_multi
+    def create(self, vals_list):
+        """Auto-generate request names if not provided"""
+        unnamed = [vals for vals in vals_list if not vals.get('name') and vals.get('category_id')]
+        if unnamed:
+            counts = Counter(vals['category_id'] for vals in unnamed)
+            categories = self.env['approval.category'].browse(list(counts))
+            next_numbers = categories._reserve_request_numbers(counts)
+            category_names = {category.id: category.name for category in categories}
+            for vals in unnamed:
+                category_id = vals['category_id']
+                sequence = next_numbers[category_id]
+                next_numbers[category_id] += 1
+                vals['name'] = f"{category_names[category_id]} #{sequence:03d}"
+        return super().create(vals_list)
@@ -0,0 +1,83 @@
+from odoo.tests import TransactionCase, tagged
+
+from odoo.addons.simple_hr_profiling.profiler import PROFILER
+
+BATCH_SIZE = 50
+
+LIST_FIELDS = [
+    'name', 'category_id', 'request_owner_id', 'employee_id',
+    'date_start', 'date_end', 'reason', 'amount', 'state', 'create_date',
+]
+
+
+@tagged('post_install', '-at_install')
+class TestApprovalQueryCount(TransactionCase):
+    """Sequence numbers, approver checks and category counters are resolved once per batch of requests"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.categories = cls.env['approval.category'].create([{
+            'name': f'Category {index}',
+            'approver_ids': [(6, 0, [cls.env.uid])],
+        } for index in range(5)])
+        cls.requests = cls.env['approval.request'].create([{
+            'category_id': cls.categories[index % 5].id,
+            'reason': 'Query count test',
+        } for index in range(BATCH_SIZE)])
+
+    def test_create(self):
+        vals_list = [{
+            'category_id': self.categories[index % 5].id,
+            'reason': 'Query count test',
+        } for index in range(BATCH_SIZE)]
+        with self.assertQueryCount(15):
+            requests = self.env['approval.request'].create(vals_list)
+        self.assertEqual(len(set(requests.mapped('name'))), BATCH_SIZE)
+        self.assertEqual(self.categories.mapped('request_count'), [2 * BATCH_SIZE // 5] * 5)
+
+    def test_list_read(self):
+        self.env.invalidate_all()
+        with self.assertQueryCount(8):
+            records = self.env['approval.request'].search_read([('id', 'in', self.requests.ids)], LIST_FIELDS)
+        self.assertEqual(len(records), BATCH_SIZE)
+
+    def test_compute_request_count(self):
+        self.categories.invalidate_recordset(['request_count'])
+        with self.assertQueryCount(2):
+            self.categories._compute_request_count()
+        self.assertEqual(self.categories.mapped('request_count'), [BATCH_SIZE // 5] * 5)
+
+    def test_search_can_approve(self):
+        self.requests.action_submit()
+        with self.assertQueryCount(2):
+            requests = self.env['approval.request'].search([('can_approve', '=', True)])
+        self.assertEqual(requests & self.requests, self.requests)
+
+    def test_bulk_approve(self):
+        self.requests[:-5].action_submit()
+        with self.assertQueryCount(8):
+            summary = self.requests.bulk_approve(comment='Approved in bulk')
+        self.assertEqual(set(summary['processed_ids']), set(self.requests[:-5].ids))
+        self.assertEqual(set(summary['denied_ids']), set(self.requests[-5:].ids))
+        self.assertEqual(set(self.requests[:-5].mapped('state')), {'approved'})
+
+    def test_bulk_refuse(self):
+        self.requests.action_submit()
+        with self.assertQueryCount(8):
+            self.requests.bulk_refuse(reason='Refused in bulk')
+        self.assertEqual(set(self.requests.mapped('state')), {'refused'})
+
+    def test_profiling(self):
+        self.addCleanup(PROFILER.configure, enabled=PROFILER.enabled, sample_rate=PROFILER.sample_rate)
+        PROFILER.configure(enabled=True, sample_rate=1)
+        PROFILER.reset()
+        self.requests.action_submit()
+        self.requests.bulk_approve()
+        self.categories._compute_request_count()
+        stats = {(entry['model'], entry['method']): entry for entry in PROFILER.to_dict()['methods']}
+        self.assertEqual(stats[('approval.request', 'bulk_approve')]['records']['sum'], BATCH_SIZE)
+        self.assertEqual(stats[('approval.request', 'bulk_approve')]['duration_seconds']['count'], 1)
+        self.assertGreater(stats[('approval.request', 'write')]['duration_seconds']['count'], 0)
+        # the compute ran once for all the categories
+        self.assertEqual(stats[('approval.category', '_compute_request_count')]['records']['sum'], 5)
@@ -0,0 +1,10 @@
+from odoo import http
+from odoo.http import request
+
+
+class ElearningProgressController(http.Controller):
+
+    @http.route('/simple_elearning/progress', type='json', auth='user', methods=['POST'])
+    def ingest_progress(self, events):
+        """Batch endpoint for LMS player progress events"""
+        return request.env['elearning.enrollment'].ingest_progress_events(events)
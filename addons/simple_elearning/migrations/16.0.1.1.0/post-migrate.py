@@ -0,0 +1,7 @@
+from odoo import api, SUPERUSER_ID
+
+
+def migrate(cr, version):
+    """Fill the new stored course counters from the existing enrollments"""
+    env = api.Environment(cr, SUPERUSER_ID, {})
+    env['elearning.course']._backfill_enrollment_statistics()
@@ -4,6 +4,7 @@ from datetime import datetime, date
 
 class ElearningCourse(models.Model):
     _name = 'elearning.course'
+    _inherit = ['simple.profiling.mixin']
     _description = 'E-Learning Course'
     _order = 'create_date desc'
 
@@ -15,7 +16,9 @@ class ElearningCourse(models.Model):
     # Course statistics
     slide_ids = fields.One2many('elearning.enrollment', 'course_id', string='Enrollments')
     total_slides = fields.Integer(string='Total Slides', default=10)
-    slide_count = fields.Integer(string='Slide Count', compute='_compute_slide_count')
+    # maintained incrementally by elearning.enrollment, see _apply_enrollment_deltas
+    slide_count = fields.Integer(string='Slide Count', default=0, readonly=True, copy=False)
+    completed_count = fields.Integer(string='Completed Enrollments', default=0, readonly=True, copy=False)
     
     # Course details
     enroll = fields.Selection([
@@ -31,21 +34,65 @@ class ElearningCourse(models.Model):
     ], string='Visibility', default='public', required=True)
     
     # Progress tracking
-    completion_rate = fields.Float(string='Completion Rate', compute='_compute_completion_rate')
+    completion_rate = fields.Float(string='Completion Rate', default=0.0, readonly=True, copy=False)
     
-    @api.depends('slide_ids')
-    def _compute_slide_count(self):
-        for record in self:
-            record.slide_count = len(record.slide_ids)
+    @api.model
+    def _apply_enrollment_deltas(self, deltas):
+        """Shift the enrollment counters of several courses in one UPDATE.
+
+        ``deltas`` maps course ids to ``[enrolled, completed]`` increments,
+        which may be negative. The completion rate is derived from the new
+        counters in the same statement.
+        """
+        deltas = {course_id: delta for course_id, delta in deltas.items() if course_id and any(delta)}
+        if not deltas:
+            return
+        course_ids = list(deltas)
+        self.flush_model(['slide_count', 'completed_count', 'completion_rate'])
+        self.env.cr.execute("""
+            UPDATE elearning_course AS course
+               SET slide_count = course.slide_count + delta.enrolled,
+                   completed_count = course.completed_count + delta.completed,
+                   completion_rate = CASE
+                       WHEN course.slide_count + delta.enrolled > 0
+                       THEN (course.completed_count + delta.completed)::float8
+                            / (course.slide_count + delta.enrolled) * 100
+                       ELSE 0.0
+                   END
+              FROM unnest(%s, %s, %s) AS delta(id, enrolled, completed)
+             WHERE course.id = delta.id
+        """, [
+            course_ids,
+            [deltas[course_id][0] for course_id in course_ids],
+            [deltas[course_id][1] for course_id in course_ids],
+        ])
+        self.browse(course_ids).invalidate_recordset(['slide_count', 'completed_count', 'completion_rate'])
     
-    @api.depends('slide_ids', 'slide_ids.completion')
-    def _compute_completion_rate(self):
-        for record in self:
-            if record.slide_ids:
-                completed = len(record.slide_ids.filtered(lambda x: x.completion >= 100))
-                record.completion_rate = (completed / len(record.slide_ids)) * 100
-            else:
-                record.completion_rate = 0.0
+    @api.model
+    def _backfill_enrollment_statistics(self):
+        """Recompute the enrollment counters of every course from scratch in one query"""
+        self.env['elearning.enrollment'].flush_model(['course_id', 'completion'])
+        self.flush_model(['slide_count', 'completed_count', 'completion_rate'])
+        self.env.cr.execute("""
+            UPDATE elearning_course AS course
+               SET slide_count = COALESCE(stats.enrolled, 0),
+                   completed_count = COALESCE(stats.completed, 0),
+                   completion_rate = CASE
+                       WHEN stats.enrolled > 0
+                       THEN stats.completed::float8 / stats.enrolled * 100
+                       ELSE 0.0
+                   END
+              FROM elearning_course AS target
+         LEFT JOIN (
+                    SELECT course_id,
+                           COUNT(*) AS enrolled,
+                           COUNT(*) FILTER (WHERE completion >= 100) AS completed
+                      FROM elearning_enrollment
+                  GROUP BY course_id
+              ) AS stats ON stats.course_id = target.id
+             WHERE course.id = target.id
+        """)
+        self.invalidate_model(['slide_count', 'completed_count', 'completion_rate'])
     
     def action_view_enrollments(self):
         """View course enrollments"""
@@ -1,18 +1,37 @@
-from odoo import models, fields, api
-from datetime import datetime, date
+from odoo import models, fields, api, tools
+from collections import defaultdict
+from datetime import datetime, date, timezone
+
+
+def parse_event_timestamp(value):
+    """Naive UTC datetime of an event timestamp, None when missing.
+
+    Accepts datetimes, Odoo's ``YYYY-MM-DD HH:MM:SS`` and the ISO 8601
+    forms sent by LMS/xAPI players (``T`` separator, ``Z`` or an offset).
+    Raises ValueError on anything else.
+    """
+    if not value:
+        return None
+    if not isinstance(value, datetime):
+        value = str(value)
+        value = datetime.fromisoformat(value[:-1] + '+00:00' if value.endswith(('Z', 'z')) else value)
+    if value.tzinfo:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
 
 
 class ElearningEnrollment(models.Model):
     _name = 'elearning.enrollment'
+    _inherit = ['simple.profiling.mixin']
     _description = 'Course Enrollment'
-    _order = 'create_date desc'
+    _order = 'create_date desc, id desc'
 
     course_id = fields.Many2one('elearning.course', string='Course', required=True, ondelete='cascade')
     partner_id = fields.Many2one('res.partner', string='Student', required=True)
     employee_id = fields.Many2one('hr.employee', string='Employee')
     
     # Enrollment details
-    completed = fields.Boolean(string='Completed', default=False)
+    completed = fields.Boolean(string='Completed', compute='_compute_completed', store=True, readonly=False)
     completion = fields.Float(string='Completion %', default=0.0)
     completion_date = fields.Datetime(string='Completion Date')
     
@@ -33,11 +52,168 @@ class ElearningEnrollment(models.Model):
     enrollment_date = fields.Datetime(string='Enrollment Date', default=fields.Datetime.now)
     last_activity_date = fields.Datetime(string='Last Activity')
     
+    def init(self):
+        # keyset pagination on _order, see base.search_page in simple_hr_api
+        tools.create_index(self._cr, 'elearning_enrollment_create_date_id_index',
+                           self._table, ['create_date DESC', 'id DESC'])
+    
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        records._update_course_statistics(1)
+        return records
+    
+    def write(self, vals):
+        if not {'course_id', 'completion'} & set(vals):
+            return super().write(vals)
+        # move the records out of their current counters and back in afterwards
+        self._update_course_statistics(-1)
+        result = super().write(vals)
+        self._update_course_statistics(1)
+        return result
+    
+    def unlink(self):
+        self._update_course_statistics(-1)
+        return super().unlink()
+    
+    def _update_course_statistics(self, sign):
+        """Add (sign=1) or remove (sign=-1) the enrollments from their course counters"""
+        deltas = defaultdict(lambda: [0, 0])
+        for record in self:
+            delta = deltas[record.course_id.id]
+            delta[0] += sign
+            if record.completion >= 100:
+                delta[1] += sign
+        self.env['elearning.course']._apply_enrollment_deltas(deltas)
+    
     @api.depends('completion')
     def _compute_completed(self):
         for record in self:
             record.completed = record.completion >= 100
     
+    @api.model
+    def ingest_progress_events(self, events):
+        """Apply a batch of learner progress events.
+
+        Each event is a dict with ``enrollment_id`` and optionally
+        ``slide_views`` (views since the previous event), ``quiz_score``
+        (one quiz attempt and its result) and ``timestamp`` (ISO 8601,
+        naive values are UTC, defaults to now). Events are coalesced per
+        enrollment and written with one multi-row UPDATE that also derives
+        completion, completion date and state. Cancelled or unknown
+        enrollments are ignored, malformed events are skipped without
+        failing the batch. Counters left NULL by raw SQL loads are treated
+        as 0.
+        Returns the updated, completed and ignored enrollment ids, and the
+        positions of the malformed events in ``events``.
+        """
+        now = fields.Datetime.now()
+        batch = {}
+        invalid_events = []
+        for index, event in enumerate(events):
+            try:
+                enrollment_id = int(event['enrollment_id'])
+                views = int(event.get('slide_views') or 0)
+                score = int(event['quiz_score']) if event.get('quiz_score') is not None else None
+                timestamp = parse_event_timestamp(event.get('timestamp')) or now
+            except (KeyError, TypeError, ValueError):
+                invalid_events.append(index)
+                continue
+            entry = batch.setdefault(enrollment_id, {
+                'views': 0,
+                'attempts': 0,
+                'karma': 0,
+                'last_activity': None,
+            })
+            entry['views'] += views
+            if score is not None:
+                entry['attempts'] += 1
+                entry['karma'] = max(entry['karma'], score)
+            if not entry['last_activity'] or timestamp > entry['last_activity']:
+                entry['last_activity'] = timestamp
+        if not batch:
+            return {'updated_ids': [], 'completed_ids': [], 'ignored_ids': [], 'invalid_events': invalid_events}
+        
+        enrollment_ids = list(batch)
+        enrollments = self.browse(enrollment_ids)
+        enrollments.check_access_rights('write')
+        enrollments.check_access_rule('write')
+        self.flush_model()
+        self.env['elearning.course'].flush_model(['total_slides'])
+        self.env.cr.execute("""
+            WITH batch AS (
+                SELECT *
+                  FROM unnest(%s::int[], %s::int[], %s::int[], %s::int[], %s::timestamp[])
+                       AS batch(id, views, attempts, karma, last_activity)
+            ), previous AS (
+                SELECT enrollment.id,
+                       COALESCE(enrollment.completion, 0.0) AS completion,
+                       LEAST(100.0, GREATEST(
+                           COALESCE(enrollment.completion, 0.0),
+                           (COALESCE(enrollment.slide_views, 0) + batch.views)::float8
+                               / GREATEST(course.total_slides, 1) * 100
+                       )) AS new_completion
+                  FROM elearning_enrollment AS enrollment
+                  JOIN batch ON batch.id = enrollment.id
+                  JOIN elearning_course AS course ON course.id = enrollment.course_id
+                 WHERE enrollment.state != 'cancelled'
+                   FOR UPDATE OF enrollment
+            )
+            UPDATE elearning_enrollment AS enrollment
+               SET slide_views = COALESCE(enrollment.slide_views, 0) + batch.views,
+                   quiz_attempts = COALESCE(enrollment.quiz_attempts, 0) + batch.attempts,
+                   quiz_karma = GREATEST(COALESCE(enrollment.quiz_karma, 0), batch.karma),
+                   last_activity_date = GREATEST(enrollment.last_activity_date, batch.last_activity),
+                   completion = previous.new_completion,
+                   completed = previous.new_completion >= 100,
+                   completion_date = CASE
+                       WHEN previous.new_completion >= 100
+                       THEN COALESCE(enrollment.completion_date, batch.last_activity)
+                       ELSE enrollment.completion_date
+                   END,
+                   state = CASE
+                       WHEN previous.new_completion >= 100 THEN 'completed'
+                       WHEN enrollment.state = 'enrolled' THEN 'in_progress'
+                       ELSE enrollment.state
+                   END,
+                   write_uid = %s,
+                   write_date = %s
+              FROM batch, previous
+             WHERE enrollment.id = batch.id
+               AND previous.id = batch.id
+         RETURNING enrollment.id, enrollment.course_id, previous.completion, enrollment.completion
+        """, [
+            enrollment_ids,
+            [batch[enrollment_id]['views'] for enrollment_id in enrollment_ids],
+            [batch[enrollment_id]['attempts'] for enrollment_id in enrollment_ids],
+            [batch[enrollment_id]['karma'] for enrollment_id in enrollment_ids],
+            [batch[enrollment_id]['last_activity'] for enrollment_id in enrollment_ids],
+            self.env.uid,
+            now,
+        ])
+        rows = self.env.cr.fetchall()
+        self.invalidate_model([
+            'slide_views', 'quiz_attempts', 'quiz_karma', 'last_activity_date', 'completion',
+            'completed', 'completion_date', 'state', 'write_uid', 'write_date',
+        ])
+        
+        # one counter update for all courses touched by the batch
+        deltas = defaultdict(lambda: [0, 0])
+        completed_ids = []
+        for enrollment_id, course_id, old_completion, new_completion in rows:
+            if old_completion < 100 <= new_completion:
+                deltas[course_id][1] += 1
+                completed_ids.append(enrollment_id)
+        self.env['elearning.course']._apply_enrollment_deltas(deltas)
+        
+        updated_ids = [row[0] for row in rows]
+        return {
+            'updated_ids': updated_ids,
+            'completed_ids': completed_ids,
+            'ignored_ids': sorted(set(enrollment_ids) - set(updated_ids)),
+            'invalid_events': invalid_events,
+        }
+    
     def action_mark_completed(self):
         """Mark enrollment as completed"""
         self.write({
@@ -0,0 +1,118 @@
+from datetime import datetime
+
+from odoo.tests import TransactionCase, tagged
+
+BATCH_SIZE = 50
+
+COURSE_LIST_FIELDS = ['name', 'user_id', 'total_slides', 'slide_count', 'completed_count', 'completion_rate']
+
+
+@tagged('post_install', '-at_install')
+class TestElearningQueryCount(TransactionCase):
+    """Course counters move by one statement per batch of enrollments, whatever the course count"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.courses = cls.env['elearning.course'].create([{
+            'name': f'Course {index}',
+            'total_slides': 10,
+        } for index in range(5)])
+        cls.partners = cls.env['res.partner'].create([{
+            'name': f'Learner {index}',
+        } for index in range(BATCH_SIZE)])
+        cls.enrollments = cls.env['elearning.enrollment'].create([{
+            'course_id': cls.courses[index % 5].id,
+            'partner_id': partner.id,
+        } for index, partner in enumerate(cls.partners)])
+
+    def assertCourseCounters(self, enrolled, completed):
+        for course in self.courses:
+            enrollments = self.env['elearning.enrollment'].search([('course_id', '=', course.id)])
+            self.assertEqual(course.slide_count, len(enrollments))
+            self.assertEqual(course.completed_count, len(enrollments.filtered('completed')))
+        self.assertEqual(sum(self.courses.mapped('slide_count')), enrolled)
+        self.assertEqual(sum(self.courses.mapped('completed_count')), completed)
+
+    def test_create(self):
+        vals_list = [{
+            'course_id': self.courses[index % 5].id,
+            'partner_id': partner.id,
+            'completion': 100.0,
+        } for index, partner in enumerate(self.partners)]
+        with self.assertQueryCount(8):
+            self.env['elearning.enrollment'].create(vals_list)
+        self.assertCourseCounters(2 * BATCH_SIZE, BATCH_SIZE)
+
+    def test_write_completion(self):
+        with self.assertQueryCount(8):
+            self.enrollments.write({'completion': 100.0})
+        self.assertCourseCounters(BATCH_SIZE, BATCH_SIZE)
+
+    def test_write_untracked_field(self):
+        # fields the counters do not depend on skip the statistics update
+        with self.assertQueryCount(2):
+            self.enrollments.write({'quiz_karma': 10})
+
+    def test_unlink(self):
+        with self.assertQueryCount(15):
+            self.enrollments[:10].unlink()
+        self.assertCourseCounters(BATCH_SIZE - 10, 0)
+
+    def test_ingest_progress_events(self):
+        events = [{'enrollment_id': enrollment.id, 'slide_views': 10} for enrollment in self.enrollments]
+        events += [{'enrollment_id': enrollment.id, 'quiz_score': 80} for enrollment in self.enrollments]
+        with self.assertQueryCount(6):
+            result = self.env['elearning.enrollment'].ingest_progress_events(events)
+        self.assertEqual(sorted(result['completed_ids']), sorted(self.enrollments.ids))
+        self.assertCourseCounters(BATCH_SIZE, BATCH_SIZE)
+
+    def test_ingest_progress_events_from_null_counters(self):
+        # rows loaded without the ORM defaults (e.g. by COPY) have NULL counters
+        enrollment = self.enrollments[0]
+        self.env.cr.execute("""
+            UPDATE elearning_enrollment
+               SET slide_views = NULL, quiz_attempts = NULL, quiz_karma = NULL, completion = NULL
+             WHERE id = %s
+        """, [enrollment.id])
+        enrollment.invalidate_recordset()
+        self.env['elearning.enrollment'].ingest_progress_events([
+            {'enrollment_id': enrollment.id, 'slide_views': 4, 'quiz_score': 70},
+        ])
+        self.assertEqual(enrollment.slide_views, 4)
+        self.assertEqual(enrollment.quiz_attempts, 1)
+        self.assertEqual(enrollment.quiz_karma, 70)
+        self.assertAlmostEqual(enrollment.completion, 40.0)
+        self.assertEqual(enrollment.state, 'in_progress')
+        self.env['elearning.enrollment'].ingest_progress_events([
+            {'enrollment_id': enrollment.id, 'slide_views': 6},
+        ])
+        self.assertEqual(enrollment.slide_views, 10)
+        self.assertTrue(enrollment.completed)
+
+    def test_ingest_progress_events_timestamps(self):
+        first, second = self.enrollments[:2]
+        result = self.env['elearning.enrollment'].ingest_progress_events([
+            {'enrollment_id': first.id, 'slide_views': 1, 'timestamp': '2026-10-18T10:00:00Z'},
+            {'enrollment_id': first.id, 'slide_views': 1, 'timestamp': '2026-10-18T20:30:00+09:00'},
+            {'enrollment_id': second.id, 'slide_views': 1, 'timestamp': 'yesterday'},
+            {'slide_views': 1},
+        ])
+        # malformed events are reported, the rest of the batch is applied
+        self.assertEqual(result['invalid_events'], [2, 3])
+        self.assertEqual(result['updated_ids'], first.ids)
+        self.assertEqual(first.slide_views, 2)
+        self.assertEqual(first.last_activity_date, datetime(2026, 10, 18, 11, 30))
+        self.assertEqual(second.slide_views, 0)
+
+    def test_course_list_read(self):
+        # the counters are stored: reading them does not touch the enrollments
+        self.env.invalidate_all()
+        with self.assertQueryCount(4):
+            courses = self.env['elearning.course'].search_read([('id', 'in', self.courses.ids)], COURSE_LIST_FIELDS)
+        self.assertEqual({course['slide_count'] for course in courses}, {BATCH_SIZE // 5})
+
+    def test_backfill_enrollment_statistics(self):
+        with self.assertQueryCount(1):
+            self.env['elearning.course']._backfill_enrollment_statistics()
+        self.assertCourseCounters(BATCH_SIZE, 0)
@@ -0,0 +1,29 @@
+{
+    'name': 'Simple HR API',
+    'version': '16.0.1.0.0',
+    'summary': 'Server-side endpoints for the HR React frontend',
+    'description': '''
+        Simple HR API module compatible with Odoo 16.0 Community Edition.
+        Provides aggregated endpoints used by the React frontend, such as the
+        dashboard KPIs computed in one JSON-RPC call and a route
+        running several call_kw calls in one request, and streaming CSV/XLSX
+        exports of payslips, approval requests and enrollments.
+    ''',
+    'author': 'Custom Development',
+    'website': '',
+    'category': 'Human Resources',
+    'license': 'LGPL-3',
+    'depends': [
+        'hr',
+        'base',
+        'simple_payroll',
+        'simple_approvals',
+        'simple_appraisal',
+        'simple_elearning',
+    ],
+    'data': [],
+    'demo': [],
+    'installable': True,
+    'auto_install': False,
+    'application': False,
+}
@@ -0,0 +1,362 @@
+import argparse
+import csv
+import io
+import itertools
+import logging
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import odoo
+from odoo import api, SUPERUSER_ID
+from odoo.cli import Command
+from odoo.tools import config
+
+_logger = logging.getLogger(__name__)
+
+APPROVAL_STATES = ['new', 'pending', 'pending', 'approved', 'approved', 'approved', 'refused', 'cancel']
+APPRAISAL_STATES = ['new', 'pending', 'done', 'done', 'done', 'cancel']
+
+
+def check_options(opts):
+    """Raise ValueError when the requested volumes cannot be generated together"""
+    counts = ['employees', 'payslip_months', 'approval_categories', 'approval_requests', 'courses', 'enrollments']
+    for name in counts + ['appraisals']:
+        if (getattr(opts, name) or 0) < 0:
+            raise ValueError(f"--{name.replace('_', '-')} must not be negative")
+    if opts.batch_size < 1:
+        raise ValueError("--batch-size must be positive")
+    # the dependent rows pick their references among the generated ones
+    if opts.approval_requests and not opts.approval_categories:
+        raise ValueError("--approval-requests needs at least one approval category")
+    if opts.enrollments and not (opts.employees and opts.courses):
+        raise ValueError("--enrollments needs at least one employee and one course")
+    if opts.appraisals and not opts.employees:
+        raise ValueError("--appraisals needs at least one employee")
+
+
+class HrPopulate(Command):
+    """Fill a database with a generated, reproducible HR dataset for load testing"""
+    name = 'hr_populate'
+
+    def run(self, cmdargs):
+        parser = argparse.ArgumentParser(
+            prog=f'{Path(sys.argv[0]).name} {self.name}',
+            description=self.__doc__,
+            epilog="Other arguments are Odoo server options, e.g. -c odoo.conf -d odoo_hr",
+        )
+        parser.add_argument('--employees', type=int, default=1000)
+        parser.add_argument('--payslip-months', type=int, default=12,
+                            help="payslips per employee, one per month going back from the current one")
+        parser.add_argument('--approval-categories', type=int, default=10)
+        parser.add_argument('--approval-requests', type=int, default=10000)
+        parser.add_argument('--appraisals', type=int, default=None,
+                            help="defaults to one per employee")
+        parser.add_argument('--courses', type=int, default=100)
+        parser.add_argument('--enrollments', type=int, default=50000)
+        parser.add_argument('--batch-size', type=int, default=10000,
+                            help="rows per COPY and per recompute batch")
+        parser.add_argument('--seed', type=int, default=42)
+        opts, server_args = parser.parse_known_args(cmdargs)
+        try:
+            check_options(opts)
+        except ValueError as error:
+            parser.error(str(error))
+        config.parse_config(server_args)
+        dbname = config['db_name']
+        if not dbname or ',' in dbname:
+            sys.exit("Select a single database with -d")
+
+        with odoo.registry(dbname).cursor() as cr:
+            env = api.Environment(cr, SUPERUSER_ID, {})
+            HrDataLoader(env, opts).load()
+
+
+class HrDataLoader:
+    """Bulk insert generated records with COPY, then recompute the stored fields.
+
+    Rows are produced lazily and copied ``batch_size`` at a time, so memory
+    does not depend on the requested volumes. Records referenced by others
+    get ids reserved upfront as a contiguous range, which lets the dependent
+    rows compute their foreign keys instead of looking them up.
+    """
+
+    def __init__(self, env, opts, commit=True):
+        check_options(opts)
+        self.env = env
+        # disabled when loading inside a test transaction
+        self.commit = commit
+        self.cr = env.cr
+        self.opts = opts
+        self.random = random.Random(opts.seed)
+        self.now = datetime.now().replace(microsecond=0)
+        self.company_id = env.company.id
+
+    def load(self):
+        opts = self.opts
+        steps = [
+            ('employees', self._load_employees),
+            ('payslips', self._load_payslips),
+            ('approval requests', self._load_approvals),
+            ('appraisals', self._load_appraisals),
+            ('enrollments', self._load_elearning),
+        ]
+        for label, step in steps:
+            start = time.monotonic()
+            step()
+            self._commit()
+            _logger.info("Loaded %s in %.1fs", label, time.monotonic() - start)
+        self.env.invalidate_all()
+        _logger.info("Dataset ready: %d employees, seed %d", opts.employees, opts.seed)
+
+    # helpers
+
+    def _commit(self):
+        if self.commit:
+            self.cr.commit()
+
+    def _reserve_ids(self, table, count):
+        """Reserve ``count`` consecutive ids of ``table``; returns the first one (0 when nothing is reserved)"""
+        if count <= 0:
+            return 0
+        sequence = f'{table}_id_seq'
+        self.cr.execute("SELECT setval(%s, nextval(%s) + %s - 1)", [sequence, sequence, count])
+        return self.cr.fetchone()[0] - count + 1
+
+    def _max_id(self, table):
+        self.cr.execute(f"SELECT COALESCE(MAX(id), 0) FROM {table}")
+        return self.cr.fetchone()[0]
+
+    def _copy(self, table, columns, rows):
+        """COPY ``rows`` into ``table`` in batches, filling the audit columns not given"""
+        audit_values = {
+            'create_uid': SUPERUSER_ID, 'create_date': self.now,
+            'write_uid': SUPERUSER_ID, 'write_date': self.now,
+        }
+        audit = [value for name, value in audit_values.items() if name not in columns]
+        columns = list(columns) + [name for name in audit_values if name not in columns]
+        rows = iter(rows)
+        total = 0
+        while True:
+            batch = list(itertools.islice(rows, self.opts.batch_size))
+            if not batch:
+                return total
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            for row in batch:
+                writer.writerow(list(row) + audit)
+            buffer.seek(0)
+            self.cr.copy_expert(
+                f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", buffer)
+            total += len(batch)
+
+    def _update_in_batches(self, table, first_id, query, params=()):
+        """Run ``query`` over id ranges of ``table`` starting at ``first_id``.
+
+        ``query`` restricts itself to ``{table}.id BETWEEN %s AND %s``, the
+        two last parameters. Each range is committed on its own.
+        """
+        last_id = self._max_id(table)
+        for start in range(first_id, last_id + 1, self.opts.batch_size):
+            self.cr.execute(query, list(params) + [start, start + self.opts.batch_size - 1])
+            self._commit()
+
+    def _random_datetime(self, days):
+        return self.now - timedelta(seconds=self.random.randrange(days * 86400))
+
+    # steps
+
+    def _load_employees(self):
+        count = self.opts.employees
+        departments = self.env['hr.department'].create([
+            {'name': f'Department {index + 1:03d}'} for index in range(max(count // 200, 1))
+        ])
+        department_ids = departments.ids
+        calendar_id = self.env.company.resource_calendar_id.id
+
+        self.partner_start = self._reserve_ids('res_partner', count)
+        self.resource_start = self._reserve_ids('resource_resource', count)
+        self.employee_start = self._reserve_ids('hr_employee', count)
+        names = [f'Employee {index + 1:06d}' for index in range(count)]
+
+        self._copy('res_partner', [
+            'id', 'name', 'display_name', 'commercial_partner_id', 'type', 'active', 'is_company', 'partner_share',
+        ], (
+            # partner_share: stored compute, True for partners without internal users
+            (self.partner_start + index, name, name, self.partner_start + index, 'contact', True, False, True)
+            for index, name in enumerate(names)
+        ))
+        self._copy('resource_resource', [
+            'id', 'name', 'resource_type', 'time_efficiency', 'tz', 'calendar_id', 'company_id', 'active',
+        ], (
+            (self.resource_start + index, name, 'user', 100, 'UTC', calendar_id, self.company_id, True)
+            for index, name in enumerate(names)
+        ))
+        self._copy('hr_employee', [
+            'id', 'name', 'resource_id', 'resource_calendar_id', 'work_contact_id', 'company_id',
+            'department_id', 'job_title', 'employee_type', 'marital', 'active',
+        ], (
+            (self.employee_start + index, name, self.resource_start + index, calendar_id,
+             self.partner_start + index, self.company_id, self.random.choice(department_ids),
+             self.random.choice(['Engineer', 'Analyst', 'Manager', 'Designer', 'Specialist']),
+             'employee', 'single', True)
+            for index, name in enumerate(names)
+        ))
+
+    def _employee_ids(self):
+        return range(self.employee_start, self.employee_start + self.opts.employees)
+
+    def _load_payslips(self):
+        first_id = self._max_id('hr_payslip') + 1
+        month = date.today().replace(day=1)
+        periods = []
+        for __ in range(self.opts.payslip_months):
+            periods.append((month, (month + timedelta(days=32)).replace(day=1) - timedelta(days=1)))
+            month = (month - timedelta(days=1)).replace(day=1)
+
+        def rows():
+            for date_from, date_to in periods:
+                # only the current month is still being processed
+                states = ['draft', 'verify', 'done'] if date_from == periods[0][0] else ['done']
+                for employee_id in self._employee_ids():
+                    yield (
+                        f'Salary Slip - Employee {employee_id - self.employee_start + 1:06d} - {date_from:%Y/%m}',
+                        employee_id, date_from, date_to, self.random.choice(states),
+                        self.random.randrange(2500, 6000) * 1000, self.random.randrange(0, 1000) * 1000,
+                        self.random.randrange(200, 800) * 1000, self.company_id,
+                    )
+
+        self._copy('hr_payslip', [
+            'name', 'employee_id', 'date_from', 'date_to', 'state',
+            'basic_wage', 'allowances', 'deductions', 'company_id',
+        ], rows())
+        # hr.payslip._compute_net_wage
+        self._update_in_batches('hr_payslip', first_id, """
+            UPDATE hr_payslip
+               SET net_wage = COALESCE(basic_wage, 0) + COALESCE(allowances, 0) - COALESCE(deductions, 0)
+             WHERE hr_payslip.id BETWEEN %s AND %s
+        """)
+        self.env['hr.payslip.summary']._refresh()
+
+    def _load_approvals(self):
+        categories = self.env['approval.category'].create([{
+            'name': f'Request Type {index + 1:02d}',
+            'approval_type': self.random.choice(['manager', 'hr', 'finance']),
+            'approver_ids': [(6, 0, [self.env.ref('base.user_admin').id])],
+            'has_amount': index % 3 == 0,
+        } for index in range(self.opts.approval_categories)])
+        category_ids = categories.ids
+        user_ids = self.env['res.users'].search([('share', '=', False)]).ids
+        first_id = self._max_id('approval_request') + 1
+
+        def rows():
+            for index in range(self.opts.approval_requests):
+                created = self._random_datetime(365)
+                state = self.random.choice(APPROVAL_STATES)
+                date_start = created.date() + timedelta(days=self.random.randrange(30))
+                yield (
+                    f'Request {index + 1:07d}', self.random.choice(category_ids), self.random.choice(user_ids),
+                    'Generated request', state, self.random.choice('0123'), created, date_start,
+                    date_start + timedelta(days=self.random.randrange(5)),
+                    self.random.randrange(0, 500) * 10000,
+                    SUPERUSER_ID if state == 'approved' else None,
+                    created + timedelta(days=1) if state == 'approved' else None,
+                    created,
+                )
+
+        self._copy('approval_request', [
+            'name', 'category_id', 'request_owner_id', 'reason', 'state', 'priority', 'request_date',
+            'date_start', 'date_end', 'amount', 'approved_by', 'approval_date', 'create_date',
+        ], rows())
+        # related employee_id, stored
+        self._update_in_batches('approval_request', first_id, """
+            UPDATE approval_request
+               SET employee_id = employee.id
+              FROM hr_employee AS employee
+             WHERE employee.user_id = approval_request.request_owner_id
+               AND employee.company_id = %s
+               AND approval_request.id BETWEEN %s AND %s
+        """, [self.company_id])
+        # stored request_count and the numbering counter, see simple_approvals' migration
+        self.cr.execute("""
+            UPDATE approval_category AS category
+               SET request_count = existing.total,
+                   request_sequence = GREATEST(category.request_sequence, existing.total)
+              FROM (
+                    SELECT category_id, COUNT(*) AS total
+                      FROM approval_request
+                  GROUP BY category_id
+              ) AS existing
+             WHERE category.id = existing.category_id
+        """)
+
+    def _load_appraisals(self):
+        count = self.opts.employees if self.opts.appraisals is None else self.opts.appraisals
+        first_id = self._max_id('hr_appraisal') + 1
+        year = date.today().year
+
+        def score():
+            return round(self.random.uniform(1, 5), 1)
+
+        def rows():
+            for index in range(count):
+                employee_id = self.employee_start + index % self.opts.employees
+                cycle = year - index // self.opts.employees
+                state = self.random.choice(APPRAISAL_STATES) if cycle == year else 'done'
+                yield (
+                    f'Appraisal {cycle} - Employee {employee_id - self.employee_start + 1:06d}',
+                    employee_id, date(cycle, 1, 1), date(cycle, 12, 31), state,
+                    score(), score(), score(), score(), score(), date(cycle + 1, 12, 31),
+                )
+
+        self._copy('hr_appraisal', [
+            'name', 'employee_id', 'date_start', 'date_close', 'state', 'technical_skills',
+            'communication', 'teamwork', 'leadership', 'problem_solving', 'next_appraisal_date',
+        ], rows())
+        Appraisal = self.env['hr.appraisal']
+        last_id = self._max_id('hr_appraisal')
+        for start in range(first_id, last_id + 1, self.opts.batch_size):
+            Appraisal._recompute_scores_sql([('id', '>=', start), ('id', '<', start + self.opts.batch_size)])
+            self._commit()
+
+    def _load_elearning(self):
+        count = self.opts.courses
+        course_start = self._reserve_ids('elearning_course', count)
+        self._copy('elearning_course', [
+            'id', 'name', 'user_id', 'active', 'total_slides', 'slide_count', 'completed_count',
+            'completion_rate', 'enroll', 'visibility',
+        ], (
+            (course_start + index, f'Course {index + 1:04d}', SUPERUSER_ID, True,
+             self.random.randrange(5, 40), 0, 0, 0.0, 'public', 'public')
+            for index in range(count)
+        ))
+        first_id = self._max_id('elearning_enrollment') + 1
+
+        def rows():
+            for index in range(self.opts.enrollments):
+                offset = index % self.opts.employees
+                enrolled = self._random_datetime(365)
+                completion = self.random.choice([0.0, 0.0, 25.0, 50.0, 75.0, 100.0, 100.0])
+                state = 'completed' if completion >= 100 else 'in_progress' if completion else 'enrolled'
+                yield (
+                    course_start + self.random.randrange(count), self.partner_start + offset,
+                    self.employee_start + offset, completion, state, enrolled,
+                    enrolled + timedelta(days=self.random.randrange(1, 60)) if completion >= 100 else None,
+                    enrolled + timedelta(days=self.random.randrange(60)), enrolled, 0, 0, 0,
+                )
+
+        # COPY does not apply the ORM defaults: the integer counters are given as 0, not left NULL
+        self._copy('elearning_enrollment', [
+            'course_id', 'partner_id', 'employee_id', 'completion', 'state',
+            'enrollment_date', 'completion_date', 'last_activity_date', 'create_date',
+            'slide_views', 'quiz_attempts', 'quiz_karma',
+        ], rows())
+        # elearning.enrollment._compute_completed
+        self._update_in_batches('elearning_enrollment', first_id, """
+            UPDATE elearning_enrollment
+               SET completed = completion >= 100
+             WHERE elearning_enrollment.id BETWEEN %s AND %s
+        """)
+        self.env['elearning.course']._backfill_enrollment_statistics()
@@ -0,0 +1,148 @@
+import csv
+import io
+import json
+import tempfile
+
+from werkzeug.exceptions import BadRequest
+
+from odoo import http, api
+from odoo.http import request, content_disposition
+
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
+
+# rows read and written per iteration; memory use depends on this, not on the row count
+EXPORT_CHUNK_SIZE = 2000
+
+EXPORT_FIELDS = {
+    'hr.payslip': [
+        'name', 'employee_id', 'date_from', 'date_to', 'state',
+        'basic_wage', 'allowances', 'deductions', 'net_wage', 'company_id',
+    ],
+    'approval.request': [
+        'name', 'category_id', 'request_owner_id', 'employee_id', 'state', 'priority',
+        'request_date', 'date_start', 'date_end', 'amount', 'approved_by', 'approval_date',
+    ],
+    'elearning.enrollment': [
+        'course_id', 'partner_id', 'employee_id', 'state', 'completion', 'completed',
+        'enrollment_date', 'completion_date', 'last_activity_date',
+    ],
+}
+
+
+class SimpleHrExportController(http.Controller):
+
+    @http.route('/simple_hr_api/export/<string:model>', type='http', auth='user', methods=['GET', 'POST'])
+    def export(self, model, domain='[]', fields=None, format='csv', **kw):
+        """Stream the records of ``model`` matching ``domain`` as CSV or XLSX.
+
+        ``domain`` is a JSON domain, as used by the list views and the
+        frontend; ``fields`` is a comma separated subset of EXPORT_FIELDS.
+        """
+        if model not in EXPORT_FIELDS:
+            raise BadRequest(f"{model} cannot be exported")
+        field_names = fields.split(',') if fields else EXPORT_FIELDS[model]
+        if not set(field_names) <= set(EXPORT_FIELDS[model]):
+            raise BadRequest("Unknown export fields")
+        if format not in ('csv', 'xlsx'):
+            raise BadRequest(f"Unsupported export format {format}")
+        if format == 'xlsx' and not xlsxwriter:
+            raise BadRequest("XLSX export requires the xlsxwriter library")
+        domain = json.loads(domain)
+
+        Model = request.env[model]
+        Model.check_access_rights('read')
+        headers = [Model._fields[name].string for name in field_names]
+        rows = self._iter_rows(model, domain, field_names)
+        filename = f"{model.replace('.', '_')}.{format}"
+        if format == 'xlsx':
+            content = self._stream_xlsx(headers, rows)
+            content_type = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+        else:
+            content = self._stream_csv(headers, rows)
+            content_type = 'text/csv;charset=utf-8'
+        return request.make_response(content, headers=[
+            ('Content-Type', content_type),
+            ('Content-Disposition', content_disposition(filename)),
+        ])
+
+    def _iter_rows(self, model, domain, field_names):
+        """Yield the export rows chunk by chunk, using keyset pagination.
+
+        The response body is consumed after the request cursor is closed, so
+        the rows are read on a cursor of their own. It keeps one snapshot for
+        the whole export.
+        """
+        registry, uid, context = request.env.registry, request.env.uid, dict(request.env.context)
+
+        def generate():
+            with registry.cursor() as cr:
+                yield from self._read_rows(api.Environment(cr, uid, context), model, domain, field_names)
+        return generate()
+
+    def _read_rows(self, env, model, domain, field_names):
+        Model = env[model]
+        formatters = [self._get_formatter(Model._fields[name], env) for name in field_names]
+        cursor = None
+        while True:
+            page = Model.search_page(domain, field_names, limit=EXPORT_CHUNK_SIZE, cursor=cursor)
+            for record in page['records']:
+                yield [format_value(record[name]) for name, format_value in zip(field_names, formatters)]
+            cursor = page['next_cursor']
+            if not cursor:
+                break
+            # drop the chunk from the cache so memory stays flat
+            env.invalidate_all()
+
+    def _get_formatter(self, field, env):
+        if field.type == 'many2one':
+            return lambda value: value[1] if value else ''
+        if field.type == 'selection':
+            labels = dict(field._description_selection(env))
+            return lambda value: labels.get(value, '')
+        if field.type == 'boolean':
+            return lambda value: value
+        return lambda value: '' if value is False else value
+
+    def _stream_csv(self, headers, rows):
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        # BOM so that spreadsheet applications detect UTF-8
+        yield '\ufeff'.encode()
+        writer.writerow(headers)
+        count = 0
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+            if count % EXPORT_CHUNK_SIZE == 0:
+                yield buffer.getvalue().encode()
+                buffer.seek(0)
+                buffer.truncate()
+        yield buffer.getvalue().encode()
+
+    def _stream_xlsx(self, headers, rows):
+        """XLSX files are zip archives that can only be sent once complete.
+
+        constant_memory makes xlsxwriter flush every finished row to a
+        temporary file, so memory stays flat; the archive is then sent in
+        blocks.
+        """
+        with tempfile.TemporaryFile() as output:
+            workbook = xlsxwriter.Workbook(output, {
+                'constant_memory': True,
+                'default_date_format': 'yyyy-mm-dd',
+                'remove_timezone': True,
+            })
+            worksheet = workbook.add_worksheet()
+            worksheet.write_row(0, 0, headers)
+            for index, row in enumerate(rows, 1):
+                worksheet.write_row(index, 0, row)
+            workbook.close()
+            output.seek(0)
+            while True:
+                block = output.read(64 * 1024)
+                if not block:
+                    break
+                yield block
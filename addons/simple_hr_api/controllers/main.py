@@ -0,0 +1,43 @@
+from psycopg2 import OperationalError
+
+from odoo import http
+from odoo.api import call_kw
+from odoo.http import request
+from odoo.models import check_method_name
+from odoo.service.model import PG_CONCURRENCY_ERRORS_TO_RETRY
+
+
+class SimpleHrApiController(http.Controller):
+
+    @http.route('/simple_hr_api/call_kw_batch', type='json', auth='user', methods=['POST'])
+    def call_kw_batch(self, calls):
+        """Run several ``call_kw`` calls in one request.
+
+        Each call runs in its own savepoint, so a failing call is rolled back
+        and reported in its slot without affecting the others. Results are
+        returned in the order of ``calls``. Concurrency errors (deadlock,
+        serialization failure, lock not available) are not reported: they
+        abort the request so that it is retried as a whole, like a single
+        ``call_kw``.
+        """
+        results = []
+        for call in calls:
+            try:
+                check_method_name(call['method'])
+                with request.env.cr.savepoint():
+                    result = call_kw(request.env[call['model']], call['method'],
+                                     call.get('args', []), call.get('kwargs', {}))
+                results.append({'result': result})
+            except OperationalError as error:
+                if error.pgcode in PG_CONCURRENCY_ERRORS_TO_RETRY:
+                    raise
+                results.append(self._serialize_error(error))
+            except Exception as error:
+                results.append(self._serialize_error(error))
+        return results
+
+    def _serialize_error(self, error):
+        return {'error': {
+            'message': str(error),
+            'data': http.serialize_exception(error),
+        }}
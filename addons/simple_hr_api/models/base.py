@@ -0,0 +1,75 @@
+import datetime
+
+from odoo import models, api
+from odoo.exceptions import UserError
+
+
+class Base(models.AbstractModel):
+    _inherit = 'base'
+
+    @api.model
+    def search_page(self, domain=None, fields=None, limit=80, cursor=None):
+        """Read one page of records in ``_order``, starting after ``cursor``.
+
+        Keyset pagination: instead of an OFFSET the next page is selected
+        with a row comparison on the order columns, so every page costs the
+        same whatever its position, given an index matching ``_order``.
+        ``cursor`` is the ``next_cursor`` of the previous page, or None for
+        the first one.
+        """
+        self.check_access_rights('read')
+        terms = self._get_keyset_order()
+        descending = terms[0][1]
+        columns = ', '.join(f'"{self._table}"."{name}"' for name, _ in terms)
+        direction = 'DESC' if descending else 'ASC'
+
+        domain = domain or []
+        self._flush_search(domain, order=self._order)
+        query = self._where_calc(domain)
+        self._apply_ir_rules(query, 'read')
+        if cursor:
+            if len(cursor) != len(terms):
+                raise UserError(f"Invalid cursor for {self._name}")
+            placeholders = ', '.join(['%s'] * len(terms))
+            query.add_where(f"({columns}) {'<' if descending else '>'} ({placeholders})", cursor)
+        from_clause, where_clause, where_params = query.get_sql()
+        self.env.cr.execute(f"""
+            SELECT "{self._table}".id, {columns}
+              FROM {from_clause}
+             WHERE {where_clause or 'TRUE'}
+          ORDER BY {', '.join(f'"{self._table}"."{name}" {direction}' for name, _ in terms)}
+             LIMIT %s
+        """, where_params + [limit + 1])
+        rows = self.env.cr.fetchall()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        records = self.browse([row[0] for row in rows]).read(fields or [])
+        next_cursor = None
+        if has_more:
+            # full precision values; a datetime rounded to the second would skip rows
+            next_cursor = [str(value) if isinstance(value, datetime.date) else value
+                           for value in rows[-1][1:]]
+        return {'records': records, 'next_cursor': next_cursor}
+
+    @api.model
+    def _get_keyset_order(self):
+        """``_order`` as ``[(column, descending)]`` ending with ``id``.
+
+        Only stored, non-null columns sorted in one direction can be compared
+        as a row, which is what the simple_* list models use.
+        """
+        terms = []
+        for term in self._order.split(','):
+            parts = term.strip().split()
+            name = parts[0].strip('"')
+            descending = len(parts) > 1 and parts[1].lower() == 'desc'
+            field = self._fields.get(name)
+            if not field or not field.store or not field.column_type or field.type == 'many2one':
+                raise UserError(f"{self._name} cannot be paginated on {name}")
+            terms.append((name, descending))
+        if terms[-1][0] != 'id':
+            terms.append(('id', terms[0][1]))
+        if len({descending for _, descending in terms}) > 1:
+            raise UserError(f"{self._name} cannot be paginated on a mixed direction order")
+        return terms
@@ -0,0 +1,117 @@
+import copy
+import time
+from datetime import datetime, time as dt_time
+
+import pytz
+
+from odoo import models, fields, api, tools
+
+# seconds the KPIs shared by users with the same companies and groups are cached for
+KPI_CACHE_TTL = 60
+
+
+class SimpleHrDashboard(models.AbstractModel):
+    _name = 'simple.hr.dashboard'
+    _description = 'HR Dashboard'
+
+    @api.model
+    def get_kpis(self, use_cache=True):
+        """All dashboard KPIs in one call.
+
+        Every figure comes from a ``search_count`` or a grouped read, so
+        the cost does not depend on how many records there are. Payroll
+        figures are only included for users who can read the payroll
+        summary.
+
+        The figures that only depend on the companies and access groups are
+        cached in the ormcache for up to ``KPI_CACHE_TTL`` seconds and
+        shared by all the users with the same ones; the user's own figures
+        (requests to approve, visible attendances) are read on every call.
+        """
+        payroll_access = self.env['hr.payslip.summary'].check_access_rights('read', raise_exception=False)
+        if use_cache:
+            kpis = copy.deepcopy(self._get_shared_kpis_cached(payroll_access, int(time.time() // KPI_CACHE_TTL)))
+        else:
+            kpis = self._get_shared_kpis(payroll_access)
+        kpis['attendance'] = self._get_attendance_kpis()
+        kpis['approvals']['to_approve'] = self.env['approval.request'].search_count([('can_approve', '=', True)])
+        return kpis
+
+    @api.model
+    @tools.ormcache('tuple(self.env.companies.ids)', 'self.env.su', 'tuple(sorted(self.env.user.groups_id.ids))',
+                    'payroll_access', 'time_bucket')
+    def _get_shared_kpis_cached(self, payroll_access, time_bucket):
+        return self._get_shared_kpis(payroll_access)
+
+    @api.model
+    def _get_shared_kpis(self, payroll_access):
+        kpis = {
+            'employees': self._get_employee_kpis(),
+            'approvals': self._get_approval_kpis(),
+            'appraisals': self._get_appraisal_kpis(),
+            'elearning': self._get_elearning_kpis(),
+            'generated_at': fields.Datetime.to_string(fields.Datetime.now()),
+        }
+        if payroll_access:
+            kpis['payroll'] = self.env['hr.payslip.summary'].get_dashboard_figures()
+        return kpis
+
+    @api.model
+    def _count_by(self, model, field_name, domain=None):
+        groups = self.env[model]._read_group(domain or [], [field_name], [field_name])
+        return {group[field_name]: group[f'{field_name}_count'] for group in groups}
+
+    @api.model
+    def _get_employee_kpis(self):
+        groups = self.env['hr.employee']._read_group([], ['department_id'], ['department_id'])
+        return {
+            'total': sum(group['department_id_count'] for group in groups),
+            'department_count': self.env['hr.department'].search_count([]),
+            'by_department': [{
+                'department_id': group['department_id'] and group['department_id'][0],
+                'name': group['department_id'] and group['department_id'][1],
+                'count': group['department_id_count'],
+            } for group in groups],
+        }
+
+    @api.model
+    def _get_attendance_kpis(self):
+        # hr_attendance is optional for the frontend
+        if 'hr.attendance' not in self.env:
+            return {'today': 0}
+        tz = pytz.timezone(self.env.user.tz or 'UTC')
+        today = fields.Date.context_today(self)
+        day_start = tz.localize(datetime.combine(today, dt_time.min)).astimezone(pytz.utc).replace(tzinfo=None)
+        return {'today': self.env['hr.attendance'].search_count([('check_in', '>=', day_start)])}
+
+    @api.model
+    def _get_approval_kpis(self):
+        by_state = self._count_by('approval.request', 'state')
+        # to_approve depends on the user, see get_kpis
+        return {
+            'total': sum(by_state.values()),
+            'by_state': by_state,
+        }
+
+    @api.model
+    def _get_appraisal_kpis(self):
+        by_state = self._count_by('hr.appraisal', 'state')
+        return {
+            'total': sum(by_state.values()),
+            'by_state': by_state,
+            'by_rating': self._count_by('hr.appraisal', 'overall_rating', [('state', '=', 'done')]),
+        }
+
+    @api.model
+    def _get_elearning_kpis(self):
+        # enrollment counters are maintained on the course, see elearning.course._apply_enrollment_deltas
+        groups = self.env['elearning.course']._read_group(
+            [], ['slide_count:sum', 'completed_count:sum'], [])
+        enrolled = groups and groups[0]['slide_count'] or 0
+        completed = groups and groups[0]['completed_count'] or 0
+        return {
+            'course_count': self.env['elearning.course'].search_count([]),
+            'enrollment_count': enrolled,
+            'completed_count': completed,
+            'completion_rate': completed / enrolled * 100 if enrolled else 0.0,
+        }
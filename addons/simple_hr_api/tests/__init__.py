@@ -0,0 +1,2 @@
+from . import test_hr_api_performance
+from . import test_benchmarks
@@ -0,0 +1,109 @@
+import argparse
+import json
+import logging
+import os
+import statistics
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+
+from odoo.tests import TransactionCase
+
+from odoo.addons.simple_hr_api.cli.populate import HrDataLoader
+
+_logger = logging.getLogger(__name__)
+
+# dataset sizes to benchmark, e.g. SIMPLE_HR_BENCHMARK_SIZES=1000,100000,1000000
+BENCHMARK_SIZES = [int(size) for size in os.environ.get('SIMPLE_HR_BENCHMARK_SIZES', '1000,10000').split(',')]
+# JSON lines file the results are appended to, one object per benchmark and size
+BENCHMARK_OUTPUT = os.environ.get(
+    'SIMPLE_HR_BENCHMARK_OUTPUT', os.path.join(tempfile.gettempdir(), 'simple_hr_benchmarks.jsonl'))
+# free-form label stored with every result, e.g. the commit being measured
+BENCHMARK_LABEL = os.environ.get('SIMPLE_HR_BENCHMARK_LABEL', '')
+BENCHMARK_REPEAT = int(os.environ.get('SIMPLE_HR_BENCHMARK_REPEAT', 3))
+
+
+class BenchmarkCase(TransactionCase):
+    """Timing benchmarks on generated datasets, with results written as JSON lines.
+
+    Compare two commits by running the ``benchmark`` test tag on both with a
+    different SIMPLE_HR_BENCHMARK_LABEL and the same output file.
+    """
+
+    def load_dataset(self, **volumes):
+        """Return a data loader for ``volumes``; its steps insert with COPY, without committing"""
+        opts = argparse.Namespace(**dict({
+            'employees': 0,
+            'payslip_months': 1,
+            'approval_categories': 10,
+            'approval_requests': 0,
+            'appraisals': None,
+            'courses': 100,
+            'enrollments': 0,
+            'batch_size': 10000,
+            'seed': 42,
+        }, **volumes))
+        return HrDataLoader(self.env, opts, commit=False)
+
+    @contextmanager
+    def rollback(self):
+        """Undo everything done in the block, so each size starts from the same database"""
+        self.env.flush_all()
+        self.cr.execute('SAVEPOINT simple_hr_benchmark')
+        try:
+            yield
+        finally:
+            self.env.invalidate_all()
+            self.cr.execute('ROLLBACK TO SAVEPOINT simple_hr_benchmark')
+            self.env.invalidate_all()
+
+    def measure(self, name, size, function, rows=None, repeat=BENCHMARK_REPEAT, undo=False, memory=False):
+        """Time ``function`` ``repeat`` times on a cold ORM cache and record the result.
+
+        ``rows`` is the number of rows processed per run, to derive a
+        throughput. With ``undo`` the changes of every run are rolled back,
+        for functions that are not idempotent. With ``memory`` the peak of
+        Python allocations is recorded as well.
+        """
+        timings, queries, peaks = [], [], []
+        for __ in range(repeat):
+            self.env.flush_all()
+            self.env.invalidate_all()
+            if undo:
+                self.cr.execute('SAVEPOINT simple_hr_benchmark_run')
+            if memory:
+                tracemalloc.start()
+            count = self.cr.sql_log_count
+            start = time.perf_counter()
+            function()
+            self.env.flush_all()
+            timings.append(time.perf_counter() - start)
+            queries.append(self.cr.sql_log_count - count)
+            if memory:
+                peaks.append(tracemalloc.get_traced_memory()[1])
+                tracemalloc.stop()
+            if undo:
+                self.env.invalidate_all()
+                self.cr.execute('ROLLBACK TO SAVEPOINT simple_hr_benchmark_run')
+        result = {
+            'benchmark': name,
+            'size': size,
+            'label': BENCHMARK_LABEL,
+            'timestamp': datetime.utcnow().isoformat(timespec='seconds'),
+            'repeat': repeat,
+            'min_s': min(timings),
+            'median_s': statistics.median(timings),
+            'max_s': max(timings),
+            'queries': max(queries),
+        }
+        if rows is not None:
+            result['rows'] = rows
+            result['rows_per_s'] = rows / result['median_s'] if result['median_s'] else None
+        if memory:
+            result['peak_memory_bytes'] = max(peaks)
+        with open(BENCHMARK_OUTPUT, 'a') as output:
+            output.write(json.dumps(result) + '\n')
+        _logger.info("Benchmark %s[%s]: %.3fs median, %d queries", name, size, result['median_s'], result['queries'])
+        return result
@@ -0,0 +1,106 @@
+from datetime import date
+
+from odoo.tests import tagged
+
+from odoo.addons.simple_hr_api.controllers.export import EXPORT_FIELDS, SimpleHrExportController
+from .common import BenchmarkCase, BENCHMARK_SIZES
+
+PAGE_SIZE = 80
+
+
+@tagged('benchmark', '-standard', 'post_install', '-at_install')
+class TestBenchmarks(BenchmarkCase):
+    """Run with --test-tags benchmark; see BenchmarkCase for the settings"""
+
+    def test_approval_category_list(self):
+        for size in BENCHMARK_SIZES:
+            with self.rollback():
+                self.load_dataset(approval_requests=size)._load_approvals()
+                self.measure('approval_category_list', size, lambda: self.env['approval.category'].search_read(
+                    [], ['name', 'approval_type', 'request_count']))
+
+    def test_approval_request_pages(self):
+        """A deep keyset page should cost the same as the first one, unlike OFFSET"""
+        Request = self.env['approval.request']
+        fields = ['name', 'category_id', 'request_owner_id', 'state', 'create_date']
+        for size in BENCHMARK_SIZES:
+            with self.rollback():
+                self.load_dataset(approval_requests=size)._load_approvals()
+                self.env.flush_all()
+                self.cr.execute("""
+                    SELECT create_date::text, id FROM approval_request
+                     ORDER BY create_date DESC, id DESC OFFSET %s LIMIT 1
+                """, [max(size - PAGE_SIZE - 1, 0)])
+                deep_cursor = list(self.cr.fetchone())
+                self.measure('approval_request_first_page', size,
+                             lambda: Request.search_page([], fields, limit=PAGE_SIZE), rows=PAGE_SIZE)
+                self.measure('approval_request_last_page_keyset', size,
+                             lambda: Request.search_page([], fields, limit=PAGE_SIZE, cursor=deep_cursor),
+                             rows=PAGE_SIZE)
+                self.measure('approval_request_last_page_offset', size,
+                             lambda: Request.search_read([], fields, offset=max(size - PAGE_SIZE, 0),
+                                                         limit=PAGE_SIZE), rows=PAGE_SIZE)
+
+    def test_payroll_generate(self):
+        for size in BENCHMARK_SIZES:
+            with self.rollback():
+                loader = self.load_dataset(employees=size)
+                loader._load_employees()
+                domain = [('id', '>=', loader.employee_start)]
+                self.measure('payroll_generate_payslips', size, lambda: self.env['hr.payslip'].generate_payslips(
+                    date(2030, 1, 1), date(2030, 1, 31), domain), rows=size, undo=True)
+
+    def test_elearning_course_list(self):
+        for size in BENCHMARK_SIZES:
+            with self.rollback():
+                loader = self.load_dataset(employees=min(size, 10000), enrollments=size)
+                loader._load_employees()
+                loader._load_elearning()
+                self.measure('elearning_course_list', size, lambda: self.env['elearning.course'].search_read(
+                    [], ['name', 'total_slides', 'slide_count', 'completed_count', 'completion_rate']))
+
+    def test_appraisal_recompute(self):
+        Appraisal = self.env['hr.appraisal']
+        for size in BENCHMARK_SIZES:
+            with self.rollback():
+                loader = self.load_dataset(employees=size)
+                loader._load_employees()
+                loader._load_appraisals()
+                domain = [('employee_id', '>=', loader.employee_start)]
+                self.measure('appraisal_recompute_sql', size,
+                             lambda: Appraisal._recompute_scores_sql(domain), rows=size)
+
+                def recompute_orm():
+                    appraisals = Appraisal.search(domain)
+                    self.env.add_to_compute(Appraisal._fields['final_score'], appraisals)
+                    self.env.add_to_compute(Appraisal._fields['overall_rating'], appraisals)
+                    appraisals.flush_recordset(['final_score', 'overall_rating'])
+                self.measure('appraisal_recompute_orm', size, recompute_orm, rows=size)
+                self.measure('appraisal_score_analytics', size, lambda: Appraisal.get_score_analytics(
+                    states=('new', 'pending', 'done'), use_cache=False))
+
+    def test_export_csv(self):
+        """Streams every payslip to CSV; memory must stay flat as the size grows"""
+        controller = SimpleHrExportController()
+        field_names = EXPORT_FIELDS['hr.payslip']
+        headers = [self.env['hr.payslip']._fields[name].string for name in field_names]
+        for size in BENCHMARK_SIZES:
+            with self.rollback():
+                loader = self.load_dataset(employees=size)
+                loader._load_employees()
+                loader._load_payslips()
+                domain = [('employee_id', '>=', loader.employee_start)]
+
+                def export():
+                    rows = controller._read_rows(self.env, 'hr.payslip', domain, field_names)
+                    for __ in controller._stream_csv(headers, rows):
+                        pass
+                self.measure('payslip_export_csv', size, export, rows=size, repeat=1, memory=True)
+
+    def test_dashboard_kpis(self):
+        for size in BENCHMARK_SIZES:
+            with self.rollback():
+                loader = self.load_dataset(employees=size, approval_requests=size, enrollments=size)
+                loader.load()
+                self.measure('dashboard_kpis', size,
+                             lambda: self.env['simple.hr.dashboard'].get_kpis(use_cache=False))
@@ -0,0 +1,70 @@
+from odoo.tests import TransactionCase, tagged
+
+PAGE_SIZE = 20
+
+
+@tagged('post_install', '-at_install')
+class TestHrApiQueryCount(TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        category = cls.env['approval.category'].create({
+            'name': 'Paged Category',
+            'approver_ids': [(6, 0, [cls.env.uid])],
+        })
+        cls.requests = cls.env['approval.request'].create([{
+            'category_id': category.id,
+            'reason': 'Keyset pagination test',
+        } for __ in range(5 * PAGE_SIZE + 3)])
+        cls.domain = [('category_id', '=', category.id)]
+
+    def test_search_page_walks_every_record_once(self):
+        Request = self.env['approval.request']
+        ids, cursor = [], None
+        while True:
+            page = Request.search_page(self.domain, ['name'], limit=PAGE_SIZE, cursor=cursor)
+            ids += [record['id'] for record in page['records']]
+            cursor = page['next_cursor']
+            if not cursor:
+                break
+        # same rows and order as the list view, with create_date ties broken by id
+        self.assertEqual(ids, Request.search(self.domain).ids)
+
+    def test_search_page_query_count(self):
+        Request = self.env['approval.request']
+        fields = ['name', 'category_id', 'request_owner_id', 'state', 'create_date']
+        self.env.invalidate_all()
+        with self.assertQueryCount(6):
+            page = Request.search_page(self.domain, fields, limit=PAGE_SIZE)
+        for __ in range(3):
+            page = Request.search_page(self.domain, fields, limit=PAGE_SIZE, cursor=page['next_cursor'])
+        # a deep page costs the same as the first one
+        self.env.invalidate_all()
+        with self.assertQueryCount(6):
+            Request.search_page(self.domain, fields, limit=PAGE_SIZE, cursor=page['next_cursor'])
+
+    def test_dashboard_kpis_query_count(self):
+        with self.assertQueryCount(20):
+            kpis = self.env['simple.hr.dashboard'].get_kpis(use_cache=False)
+        self.assertGreaterEqual(kpis['approvals']['total'], len(self.requests))
+
+    def test_dashboard_kpis_cache(self):
+        Dashboard = self.env['simple.hr.dashboard']
+        kpis = Dashboard.get_kpis()
+        # a cache hit only reads the user's own figures
+        with self.assertQueryCount(4):
+            cached = Dashboard.get_kpis()
+        self.assertEqual(cached['approvals'], kpis['approvals'])
+        self.assertEqual(cached['generated_at'], kpis['generated_at'])
+
+    def test_dashboard_kpis_without_payroll_access(self):
+        self.assertIn('payroll', self.env['simple.hr.dashboard'].get_kpis())
+        user = self.env['res.users'].create({
+            'name': 'Dashboard User',
+            'login': 'dashboard_user',
+            'groups_id': [(6, 0, [self.env.ref('base.group_user').id])],
+        })
+        kpis = self.env['simple.hr.dashboard'].with_user(user).get_kpis()
+        self.assertNotIn('payroll', kpis)
+        self.assertGreaterEqual(kpis['approvals']['total'], len(self.requests))
@@ -0,0 +1,26 @@
+{
+    'name': 'Simple HR Profiling',
+    'version': '16.0.1.0.0',
+    'summary': 'Opt-in ORM method profiling for the simple_* HR modules',
+    'description': '''
+        Simple HR Profiling module compatible with Odoo 16.0 Community Edition.
+        Provides a mixin inherited by the simple_* models that records call
+        counts, wall time, SQL queries and recordset sizes per method, exposed
+        as JSON and in the Prometheus text format.
+
+        Disabled by default. Enable it in the server configuration:
+            simple_hr_profiling = True
+            simple_hr_profiling_sample_rate = 0.1
+            simple_hr_profiling_token = <token for the metrics scraper>
+    ''',
+    'author': 'Custom Development',
+    'website': '',
+    'category': 'Human Resources',
+    'license': 'LGPL-3',
+    'depends': ['base'],
+    'data': [],
+    'demo': [],
+    'installable': True,
+    'auto_install': False,
+    'application': False,
+}
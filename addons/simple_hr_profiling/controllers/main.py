@@ -0,0 +1,43 @@
+import hmac
+
+from werkzeug.exceptions import Forbidden
+
+from odoo import http
+from odoo.http import request
+from odoo.tools import config
+
+from odoo.addons.simple_hr_profiling.profiler import PROFILER
+
+
+class SimpleHrProfilingController(http.Controller):
+
+    def _check_access(self):
+        """Scrapers authenticate with the configured token, users must be administrators"""
+        token = config.get('simple_hr_profiling_token')
+        authorization = request.httprequest.headers.get('Authorization', '')
+        if token and hmac.compare_digest(authorization, f'Bearer {token}'):
+            return
+        if not request.env.user._is_public() and request.env.user.has_group('base.group_system'):
+            return
+        raise Forbidden()
+
+    @http.route('/simple_hr_profiling/stats', type='http', auth='public', methods=['GET'])
+    def stats(self):
+        self._check_access()
+        return request.make_json_response(PROFILER.to_dict())
+
+    @http.route('/simple_hr_profiling/metrics', type='http', auth='public', methods=['GET'])
+    def metrics(self):
+        self._check_access()
+        return request.make_response(PROFILER.to_prometheus(), headers=[
+            ('Content-Type', 'text/plain; version=0.0.4; charset=utf-8'),
+        ])
+
+    @http.route('/simple_hr_profiling/configure', type='json', auth='user')
+    def configure(self, enabled=None, sample_rate=None, reset=False):
+        """Change the profiling of the worker handling the request"""
+        self._check_access()
+        PROFILER.configure(enabled=enabled, sample_rate=sample_rate)
+        if reset:
+            PROFILER.reset()
+        return {'enabled': PROFILER.enabled, 'sample_rate': PROFILER.sample_rate}
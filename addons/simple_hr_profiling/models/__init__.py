@@ -0,0 +1 @@
+from . import profiling_mixin
@@ -0,0 +1,63 @@
+import functools
+import inspect
+import time
+
+from odoo import models
+
+from odoo.addons.simple_hr_profiling.profiler import PROFILER
+
+# ORM entry points profiled on top of the methods the simple_* modules define
+PROFILED_ORM_METHODS = ['create', 'write', 'unlink', 'read', 'search_read', 'read_group']
+NOT_PROFILED = {'init', '_register_hook', '_unregister_hook'}
+
+
+def profiled(model_name, name, method):
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        # the only cost when profiling is off
+        if not PROFILER.enabled or not PROFILER.sampled():
+            return method(self, *args, **kwargs)
+        cr = self.env.cr
+        queries = cr.sql_log_count
+        start = time.perf_counter()
+        result = method(self, *args, **kwargs)
+        # create returns the new records, the other methods run on self
+        records = result if name == 'create' else self
+        PROFILER.record(model_name, name, time.perf_counter() - start, cr.sql_log_count - queries,
+                        len(records) if isinstance(records, models.BaseModel) else 0)
+        return result
+    wrapper._simple_profiled = True
+    return wrapper
+
+
+class SimpleProfilingMixin(models.AbstractModel):
+    _name = 'simple.profiling.mixin'
+    _description = 'Profiled Simple HR Model'
+
+    def _register_hook(self):
+        """Wrap the methods of the model with the profiler.
+
+        This patches the registry class of the model only, so it is undone
+        whenever the registry is rebuilt. Computes and searches are looked
+        up by name on the records, so they are profiled as well.
+        """
+        super()._register_hook()
+        if self._abstract:
+            return
+        cls = type(self)
+        for name in self._get_profiled_methods():
+            method = getattr(cls, name, None)
+            if callable(method) and not getattr(method, '_simple_profiled', False):
+                setattr(cls, name, profiled(self._name, name, method))
+
+    def _get_profiled_methods(self):
+        names = set(PROFILED_ORM_METHODS)
+        for cls in type(self).__mro__:
+            module = getattr(cls, '_module', None) or ''
+            if not module.startswith('simple_') or module == 'simple_hr_profiling':
+                continue
+            names.update(
+                name for name, value in vars(cls).items()
+                if inspect.isfunction(value) and not name.startswith('__') and name not in NOT_PROFILED
+            )
+        return sorted(names)
@@ -0,0 +1,122 @@
+import os
+import random
+import threading
+
+from odoo.tools import config
+
+# upper bounds of the histogram buckets, +Inf is implied
+DURATION_BUCKETS = [0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30]
+QUERY_BUCKETS = [0, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000]
+RECORD_BUCKETS = [0, 1, 10, 100, 1000, 10000, 100000]
+
+MEASURES = [
+    # name, buckets, help
+    ('duration_seconds', DURATION_BUCKETS, "Wall time of the ORM method, nested calls included"),
+    ('queries', QUERY_BUCKETS, "SQL queries executed by the ORM method, nested calls included"),
+    ('records', RECORD_BUCKETS, "Size of the recordset the method ran on; the fan-out for computes"),
+]
+
+
+class Histogram:
+    __slots__ = ('buckets', 'counts', 'count', 'sum')
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0
+
+    def observe(self, value):
+        index = 0
+        while index < len(self.buckets) and value > self.buckets[index]:
+            index += 1
+        self.counts[index] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self):
+        """``[(upper bound, count of values <= bound)]``, ending with +Inf"""
+        total, result = 0, []
+        for bound, count in zip(self.buckets + [float('inf')], self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+    def to_dict(self):
+        return {
+            'count': self.count,
+            'sum': self.sum,
+            'avg': self.sum / self.count if self.count else 0,
+            'buckets': {str(bound): count for bound, count in self.cumulative()},
+        }
+
+
+class MethodProfiler:
+    """Per process store of the (model, method) histograms.
+
+    With prefork workers each process keeps its own figures; the exports
+    carry the pid so that they can be told apart or summed.
+    """
+
+    def __init__(self):
+        self.enabled = config.get('simple_hr_profiling', False) in (True, 'True', 'true', '1')
+        self.sample_rate = float(config.get('simple_hr_profiling_sample_rate', 1.0))
+        self.lock = threading.Lock()
+        self.stats = {}
+
+    def configure(self, enabled=None, sample_rate=None):
+        if enabled is not None:
+            self.enabled = bool(enabled)
+        if sample_rate is not None:
+            self.sample_rate = min(max(float(sample_rate), 0.0), 1.0)
+
+    def sampled(self):
+        return self.sample_rate >= 1 or random.random() < self.sample_rate
+
+    def record(self, model, method, duration, queries, records):
+        with self.lock:
+            histograms = self.stats.get((model, method))
+            if histograms is None:
+                histograms = self.stats[(model, method)] = [Histogram(buckets) for __, buckets, __ in MEASURES]
+            for histogram, value in zip(histograms, (duration, queries, records)):
+                histogram.observe(value)
+
+    def reset(self):
+        with self.lock:
+            self.stats = {}
+
+    def to_dict(self):
+        with self.lock:
+            return {
+                'pid': os.getpid(),
+                'enabled': self.enabled,
+                'sample_rate': self.sample_rate,
+                'methods': [dict({
+                    name: histogram.to_dict() for (name, __, __), histogram in zip(MEASURES, histograms)
+                }, model=model, method=method) for (model, method), histograms in sorted(self.stats.items())],
+            }
+
+    def to_prometheus(self):
+        pid = os.getpid()
+        lines = [
+            '# HELP simple_orm_profiling_sample_rate Fraction of the calls that are measured',
+            '# TYPE simple_orm_profiling_sample_rate gauge',
+            f'simple_orm_profiling_sample_rate{{pid="{pid}"}} {self.sample_rate}',
+        ]
+        with self.lock:
+            items = sorted(self.stats.items())
+            for index, (name, __, description) in enumerate(MEASURES):
+                metric = f'simple_orm_method_{name}'
+                lines += [f'# HELP {metric} {description}', f'# TYPE {metric} histogram']
+                for (model, method), histograms in items:
+                    histogram = histograms[index]
+                    labels = f'model="{model}",method="{method}",pid="{pid}"'
+                    for bound, count in histogram.cumulative():
+                        le = '+Inf' if bound == float('inf') else bound
+                        lines.append(f'{metric}_bucket{{{labels},le="{le}"}} {count}')
+                    lines.append(f'{metric}_sum{{{labels}}} {histogram.sum}')
+                    lines.append(f'{metric}_count{{{labels}}} {histogram.count}')
+        return '\n'.join(lines) + '\n'
+
+
+PROFILER = MethodProfiler()
@@ -0,0 +1,35 @@
+from odoo.tests import TransactionCase, tagged
+
+from odoo.addons.simple_hr_profiling.profiler import MethodProfiler, Histogram
+
+
+@tagged('post_install', '-at_install')
+class TestProfiler(TransactionCase):
+
+    def test_histogram_buckets_are_cumulative(self):
+        histogram = Histogram([1, 10])
+        for value in (0, 1, 5, 50):
+            histogram.observe(value)
+        self.assertEqual(histogram.cumulative(), [(1, 2), (10, 3), (float('inf'), 4)])
+        self.assertEqual((histogram.count, histogram.sum), (4, 56))
+
+    def test_prometheus_export(self):
+        profiler = MethodProfiler()
+        profiler.configure(enabled=True, sample_rate=0.5)
+        profiler.record('approval.request', 'create', 0.02, 7, 50)
+        metrics = profiler.to_prometheus()
+        self.assertIn('# TYPE simple_orm_method_duration_seconds histogram', metrics)
+        self.assertIn('simple_orm_method_queries_sum{model="approval.request",method="create"', metrics)
+        self.assertIn('le="+Inf"} 1', metrics)
+        self.assertIn('simple_orm_profiling_sample_rate{', metrics)
+        stats = profiler.to_dict()['methods']
+        self.assertEqual(stats[0]['records']['sum'], 50)
+        profiler.reset()
+        self.assertFalse(profiler.to_dict()['methods'])
+
+    def test_sampling(self):
+        profiler = MethodProfiler()
+        profiler.configure(sample_rate=0)
+        self.assertFalse(any(profiler.sampled() for __ in range(100)))
+        profiler.configure(sample_rate=1)
+        self.assertTrue(all(profiler.sampled() for __ in range(100)))
@@ -1,6 +1,6 @@
 {
     'name': 'Simple Payroll',
-    'version': '16.0.1.0.0',
+    'version': '16.0.1.2.0',
     'summary': 'Simple Payroll Management for Community Edition',
     'description': '''
         Simple Payroll module compatible with Odoo 16.0 Community Edition.
@@ -9,11 +9,13 @@
     'author': 'Custom Development',
     'website': '',
     'category': 'Human Resources',
-    'depends': ['hr', 'base'],
+    'depends': ['hr', 'base', 'simple_hr_profiling'],
     'data': [
         'security/ir.model.access.csv',
         'views/hr_payslip_views.xml',
+        'views/hr_payslip_run_views.xml',
         'data/hr_payslip_data.xml',
+        'data/ir_cron_data.xml',
     ],
     'demo': [],
     'installable': True,
@@ -0,0 +1,7 @@
+from odoo import api, SUPERUSER_ID
+
+
+def migrate(cr, version):
+    """Build the payroll summary from the existing payslips"""
+    env = api.Environment(cr, SUPERUSER_ID, {})
+    env['hr.payslip.summary']._refresh()
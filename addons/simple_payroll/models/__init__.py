@@ -1 +1,3 @@
 from . import hr_payslip
+from . import hr_payslip_run
+from . import hr_payslip_summary
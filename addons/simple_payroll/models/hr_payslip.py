@@ -1,11 +1,19 @@
-from odoo import models, fields, api
+import logging
+
+from odoo import models, fields, api, tools
+from collections import defaultdict
 from datetime import datetime, date
 
+_logger = logging.getLogger(__name__)
+
+SUMMARY_KEY_FIELDS = {'company_id', 'date_from', 'state', 'basic_wage', 'allowances', 'deductions'}
+
 
 class HrPayslip(models.Model):
     _name = 'hr.payslip'
+    _inherit = ['simple.profiling.mixin']
     _description = 'Pay Slip'
-    _order = 'date_from desc'
+    _order = 'date_from desc, id desc'
 
     name = fields.Char(string='Payslip Name', required=True, default='New')
     employee_id = fields.Many2one('hr.employee', string='Employee', required=True)
@@ -26,19 +34,143 @@ class HrPayslip(models.Model):
     
     company_id = fields.Many2one('res.company', string='Company', 
                                 default=lambda self: self.env.company)
+    run_id = fields.Many2one('hr.payslip.run', string='Payroll Run', index=True, ondelete='set null', copy=False)
+
+    def init(self):
+        # a payroll run never pays the same employee twice for a period, even when resumed
+        if not tools.index_exists(self._cr, 'hr_payslip_run_employee_period_uniq'):
+            self._cr.execute("""
+                CREATE UNIQUE INDEX hr_payslip_run_employee_period_uniq
+                    ON hr_payslip (employee_id, date_from, date_to)
+                 WHERE run_id IS NOT NULL AND state != 'cancel'
+            """)
+        # keyset pagination on _order, see base.search_page in simple_hr_api
+        tools.create_index(self._cr, 'hr_payslip_date_from_id_index',
+                           self._table, ['date_from DESC', 'id DESC'])
 
     @api.depends('basic_wage', 'allowances', 'deductions')
     def _compute_net_wage(self):
         for record in self:
             record.net_wage = record.basic_wage + record.allowances - record.deductions
 
+    @api.model_create_multi
+    def create(self, vals_list):
+        unnamed = [vals for vals in vals_list if vals.get('name', 'New') == 'New']
+        if unnamed:
+            # read all employee names of the batch with one query
+            employees = self.env['hr.employee'].browse({vals['employee_id'] for vals in unnamed if vals.get('employee_id')})
+            employee_names = {employee.id: employee.name for employee in employees}
+            for vals in unnamed:
+                vals['name'] = self._get_payslip_name(
+                    employee_names.get(vals.get('employee_id'), False),
+                    fields.Date.from_string(vals.get('date_from', fields.Date.today())),
+                )
+        payslips = super(HrPayslip, self).create(vals_list)
+        payslips._update_summary(1)
+        return payslips
+
+    def write(self, vals):
+        if not SUMMARY_KEY_FIELDS & set(vals):
+            return super(HrPayslip, self).write(vals)
+        # move the payslips out of their summary rows and back in afterwards
+        self._update_summary(-1)
+        result = super(HrPayslip, self).write(vals)
+        self._update_summary(1)
+        return result
+
+    def unlink(self):
+        self._update_summary(-1)
+        return super(HrPayslip, self).unlink()
+
+    def _update_summary(self, sign):
+        """Add (sign=1) or remove (sign=-1) the payslips from hr.payslip.summary"""
+        if self.env.context.get('skip_payslip_summary'):
+            return
+        payslips = self
+        run_ids = tuple(self.run_id.ids)
+        if run_ids:
+            # the summary of a run is rebuilt once it is closed: until then its payslips are not counted
+            self.env['hr.payslip.run'].flush_model(['summary_refreshed'])
+            self.env.cr.execute("""
+                SELECT id
+                  FROM hr_payslip_run
+                 WHERE id IN %s AND NOT summary_refreshed
+                   FOR SHARE
+            """, [run_ids])
+            unrefreshed_run_ids = {row[0] for row in self.env.cr.fetchall()}
+            payslips = self.filtered(lambda payslip: payslip.run_id.id not in unrefreshed_run_ids)
+        deltas = defaultdict(lambda: [0, 0.0, 0.0, 0.0, 0.0])
+        for payslip in payslips:
+            delta = deltas[(payslip.company_id.id, payslip.date_from.replace(day=1), payslip.state)]
+            delta[0] += sign
+            delta[1] += sign * payslip.basic_wage
+            delta[2] += sign * payslip.allowances
+            delta[3] += sign * payslip.deductions
+            delta[4] += sign * payslip.net_wage
+        self.env['hr.payslip.summary']._apply_deltas(deltas)
+
     @api.model
-    def create(self, vals):
-        if vals.get('name', 'New') == 'New':
-            employee = self.env['hr.employee'].browse(vals.get('employee_id'))
-            date_from = fields.Date.from_string(vals.get('date_from', fields.Date.today()))
-            vals['name'] = f"Payslip - {employee.name} - {date_from.strftime('%B %Y')}"
-        return super(HrPayslip, self).create(vals)
+    def _get_payslip_name(self, employee_name, date_from):
+        return f"Payslip - {employee_name} - {date_from.strftime('%B %Y')}"
+
+    @api.model
+    def generate_payslips(self, date_from, date_to, employee_domain=None, chunk_size=1000):
+        """Create the payslips of a payroll run for every employee matching the domain.
+
+        Employees who already have a payslip for the period are skipped.
+        Employee names are read once for the whole run and payslips are
+        created with one multi-create per chunk of ``chunk_size`` employees,
+        all in the caller's transaction.
+        Returns the number of payslips created and their ids.
+        """
+        return self._generate_payslips(date_from, date_to, employee_domain, chunk_size)
+
+    @api.model
+    def _generate_payslips(self, date_from, date_to, employee_domain=None, chunk_size=1000, auto_commit=False):
+        """Implementation of :meth:`generate_payslips`, not reachable over RPC.
+
+        With ``auto_commit`` every chunk is committed separately, which keeps
+        transactions short on large server-side runs.
+        """
+        date_from = fields.Date.to_date(date_from)
+        date_to = fields.Date.to_date(date_to)
+        employees = self.env['hr.employee'].search_read(employee_domain or [], ['name'], order='id')
+        payslip_ids = []
+        for start in range(0, len(employees), chunk_size):
+            payslips = self._create_for_employees(employees[start:start + chunk_size], date_from, date_to)
+            payslip_ids += payslips.ids
+            if auto_commit:
+                self.env.cr.commit()
+                # keep memory flat on large runs
+                self.env.invalidate_all()
+            _logger.info("Payroll run %s - %s: %d/%d payslips generated",
+                         date_from, date_to, len(payslip_ids), len(employees))
+        return {'count': len(payslip_ids), 'payslip_ids': payslip_ids}
+
+    @api.model
+    def _create_for_employees(self, employees, date_from, date_to, run=None):
+        """Create one payslip per employee for the period in a single multi-create.
+
+        ``employees`` is a list of ``{'id', 'name'}`` dicts. Employees who
+        already have a payslip for the period, other than a rejected one,
+        are skipped, so a crashed or repeated run never pays anyone twice.
+        """
+        if not employees:
+            return self
+        self.flush_model(['employee_id', 'date_from', 'date_to', 'state'])
+        self.env.cr.execute("""
+            SELECT employee_id
+              FROM hr_payslip
+             WHERE employee_id IN %s AND date_from = %s AND date_to = %s AND state != 'cancel'
+        """, [tuple(employee['id'] for employee in employees), date_from, date_to])
+        paid_employee_ids = {row[0] for row in self.env.cr.fetchall()}
+        return self.create([{
+            'name': self._get_payslip_name(employee['name'], date_from),
+            'employee_id': employee['id'],
+            'date_from': date_from,
+            'date_to': date_to,
+            'run_id': run.id if run else False,
+        } for employee in employees if employee['id'] not in paid_employee_ids])
 
     def action_payslip_done(self):
         self.write({'state': 'done'})
@@ -0,0 +1,277 @@
+import logging
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import psycopg2
+
+from odoo import models, fields, api
+from odoo.service.model import PG_CONCURRENCY_ERRORS_TO_RETRY
+from odoo.tools.safe_eval import safe_eval
+
+_logger = logging.getLogger(__name__)
+
+MAX_CHUNK_ATTEMPTS = 5
+
+
+class HrPayslipRun(models.Model):
+    _name = 'hr.payslip.run'
+    _inherit = ['simple.profiling.mixin']
+    _description = 'Payroll Run'
+    _order = 'date_from desc, id desc'
+
+    name = fields.Char(string='Name', required=True)
+    date_from = fields.Date(string='Date From', required=True)
+    date_to = fields.Date(string='Date To', required=True)
+    employee_domain = fields.Char(string='Employees', default='[]',
+                                  help="Domain on employees to include in the run")
+    chunk_size = fields.Integer(string='Chunk Size', default=500,
+                                help="Number of employees processed and committed together")
+    state = fields.Selection([
+        ('draft', 'Draft'),
+        ('running', 'Running'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+    ], string='Status', default='draft', required=True)
+    # chunks skip the incremental summary updates, see _refresh_summary
+    summary_refreshed = fields.Boolean(string='Summary Up to Date', default=False, copy=False, readonly=True)
+
+    chunk_ids = fields.One2many('hr.payslip.run.chunk', 'run_id', string='Chunks')
+    slip_ids = fields.One2many('hr.payslip', 'run_id', string='Payslips')
+    chunk_count = fields.Integer(string='Chunks', compute='_compute_progress')
+    chunk_done_count = fields.Integer(string='Processed Chunks', compute='_compute_progress')
+    payslip_count = fields.Integer(string='Payslips', compute='_compute_progress')
+
+    company_id = fields.Many2one('res.company', string='Company',
+                                 default=lambda self: self.env.company)
+
+    @api.depends('chunk_ids.state', 'chunk_ids.payslip_count')
+    def _compute_progress(self):
+        stats = {}
+        if self.ids:
+            groups = self.env['hr.payslip.run.chunk']._read_group(
+                [('run_id', 'in', self.ids)], ['payslip_count:sum'], ['run_id', 'state'], lazy=False)
+            for group in groups:
+                run_stats = stats.setdefault(group['run_id'][0], [0, 0, 0])
+                run_stats[0] += group['__count']
+                if group['state'] == 'done':
+                    run_stats[1] += group['__count']
+                run_stats[2] += group['payslip_count']
+        for run in self:
+            run.chunk_count, run.chunk_done_count, run.payslip_count = stats.get(run.id, (0, 0, 0))
+
+    def _get_employee_domain(self):
+        self.ensure_one()
+        return safe_eval(self.employee_domain or '[]')
+
+    def action_start(self):
+        """Split the employees into chunks and queue them for the payroll workers"""
+        for run in self.filtered(lambda run: run.state == 'draft'):
+            employee_ids = self.env['hr.employee'].search(run._get_employee_domain(), order='id').ids
+            chunk_size = run.chunk_size or 500
+            self.env['hr.payslip.run.chunk'].create([{
+                'run_id': run.id,
+                'sequence': sequence,
+                'employee_id_from': employee_ids[start],
+                'employee_id_to': employee_ids[min(start + chunk_size, len(employee_ids)) - 1],
+            } for sequence, start in enumerate(range(0, len(employee_ids), chunk_size))])
+            run.state = 'running'
+        self.env.ref('simple_payroll.ir_cron_process_payslip_run_chunks')._trigger()
+
+    def action_retry_failed(self):
+        """Queue failed chunks again; payslips already created are not duplicated"""
+        self.chunk_ids.filtered(lambda chunk: chunk.state == 'failed').write({
+            'state': 'pending',
+            'attempts': 0,
+            'error': False,
+        })
+        self.write({'state': 'running', 'summary_refreshed': False})
+        self.env.ref('simple_payroll.ir_cron_process_payslip_run_chunks')._trigger()
+
+    def action_view_payslips(self):
+        self.ensure_one()
+        return {
+            'type': 'ir.actions.act_window',
+            'name': f'{self.name} Payslips',
+            'res_model': 'hr.payslip',
+            'view_mode': 'tree,form',
+            'domain': [('run_id', '=', self.id)],
+        }
+
+    def _update_state(self):
+        """Close the runs that have no pending chunk left"""
+        for run in self.filtered(lambda run: run.state == 'running'):
+            states = set(run.chunk_ids.mapped('state'))
+            if 'pending' not in states:
+                run.state = 'failed' if 'failed' in states else 'done'
+
+    def _refresh_summary(self):
+        """Rebuild the payroll summary of the months of the closed runs not refreshed yet.
+
+        Chunks skip the incremental summary updates and so do the payslips
+        of a run until its summary is refreshed (see
+        hr.payslip._update_summary). The runs are locked first: payslip
+        writes that skipped their deltas are committed before the refresh
+        reads hr_payslip, later ones see the flag set and apply them.
+        """
+        runs = self.filtered(lambda run: run.state in ('done', 'failed') and not run.summary_refreshed)
+        if not runs:
+            return
+        self.env.cr.execute("SELECT id FROM hr_payslip_run WHERE id IN %s FOR UPDATE", [tuple(runs.ids)])
+        self.env['hr.payslip.summary']._refresh(periods=runs.mapped('date_from'))
+        runs.write({'summary_refreshed': True})
+
+
+class HrPayslipRunChunk(models.Model):
+    _name = 'hr.payslip.run.chunk'
+    _inherit = ['simple.profiling.mixin']
+    _description = 'Payroll Run Chunk'
+    _order = 'run_id, sequence, id'
+
+    run_id = fields.Many2one('hr.payslip.run', string='Payroll Run', required=True, ondelete='cascade', index=True)
+    sequence = fields.Integer(string='Sequence', default=0)
+    employee_id_from = fields.Integer(string='First Employee ID', required=True)
+    employee_id_to = fields.Integer(string='Last Employee ID', required=True)
+    state = fields.Selection([
+        ('pending', 'Pending'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+    ], string='Status', default='pending', required=True, index=True)
+    attempts = fields.Integer(string='Attempts', default=0)
+    payslip_count = fields.Integer(string='Payslips', default=0)
+    error = fields.Text(string='Error')
+
+    def _generate_payslips(self):
+        """Create the payslips of the chunk; already paid employees are skipped"""
+        self.ensure_one()
+        run = self.run_id
+        employees = self.env['hr.employee'].search_read(run._get_employee_domain() + [
+            ('id', '>=', self.employee_id_from),
+            ('id', '<=', self.employee_id_to),
+        ], ['name'], order='id')
+        # concurrent chunks would all contend on the same summary row; the cron
+        # refreshes the month once the run is complete instead
+        payslips = self.env['hr.payslip'].with_context(skip_payslip_summary=True)._create_for_employees(
+            employees, run.date_from, run.date_to, run=run)
+        self.write({
+            'state': 'done',
+            'attempts': self.attempts + 1,
+            'payslip_count': len(payslips),
+        })
+
+    @api.model
+    def _claim_next(self):
+        """Lock the next pending chunk for this transaction, skipping those other workers hold"""
+        self.env.cr.execute("""
+            SELECT id
+              FROM hr_payslip_run_chunk
+             WHERE state = 'pending'
+          ORDER BY run_id, sequence, id
+             LIMIT 1
+               FOR UPDATE SKIP LOCKED
+        """)
+        row = self.env.cr.fetchone()
+        return self.browse(row[0]) if row else self
+
+    def _relock(self):
+        """Lock the chunk again after a rollback released it.
+
+        Returns False when another worker claimed it in the meantime or it
+        is no longer pending, in which case it must be left alone.
+        """
+        self.ensure_one()
+        self.env.cr.execute("""
+            SELECT id
+              FROM hr_payslip_run_chunk
+             WHERE id = %s AND state = 'pending'
+               FOR UPDATE SKIP LOCKED
+        """, [self.id])
+        return bool(self.env.cr.fetchone())
+
+    @api.model
+    def _process_pending_chunks(self):
+        """Worker loop: process pending chunks one at a time until none is left.
+
+        Every chunk is committed on its own. Concurrency errors roll the
+        chunk back and retry it later with a random backoff; a chunk that
+        keeps failing is marked as failed. A chunk is only marked done in
+        the transaction that creates its payslips, so a crashed worker
+        leaves it pending for the next one. The rollback releases the chunk
+        lock, so it is taken again before recording the failure.
+        Returns the ids of the chunks it processed or marked as failed.
+        """
+        cr = self.env.cr
+        processed = []
+        while True:
+            chunk = self._claim_next()
+            if not chunk:
+                cr.commit()
+                return processed
+            try:
+                chunk._generate_payslips()
+                chunk.run_id._update_state()
+                cr.commit()
+                processed.append(chunk.id)
+            except psycopg2.OperationalError as error:
+                if error.pgcode not in PG_CONCURRENCY_ERRORS_TO_RETRY:
+                    raise
+                cr.rollback()
+                if not chunk._relock():
+                    continue
+                attempts = chunk.attempts + 1
+                chunk.write({
+                    'attempts': attempts,
+                    'state': 'failed' if attempts >= MAX_CHUNK_ATTEMPTS else 'pending',
+                    'error': str(error),
+                })
+                chunk.run_id._update_state()
+                cr.commit()
+                if attempts >= MAX_CHUNK_ATTEMPTS:
+                    processed.append(chunk.id)
+                time.sleep(random.uniform(0, 0.1 * 2 ** attempts))
+            except Exception as error:
+                cr.rollback()
+                _logger.exception("Payroll run chunk %s failed", chunk.id)
+                if not chunk._relock():
+                    continue
+                chunk.write({
+                    'attempts': chunk.attempts + 1,
+                    'state': 'failed',
+                    'error': str(error),
+                })
+                chunk.run_id._update_state()
+                cr.commit()
+                processed.append(chunk.id)
+
+    @api.model
+    def _process_in_parallel(self, workers):
+        """Run ``workers`` worker loops concurrently, each on its own cursor"""
+        uid, context = self.env.uid, self.env.context
+
+        def work():
+            with self.pool.cursor() as cr:
+                env = api.Environment(cr, uid, context)
+                return env['hr.payslip.run.chunk']._process_pending_chunks()
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            processed = [chunk_id for chunk_ids in executor.map(lambda _: work(), range(workers))
+                         for chunk_id in chunk_ids]
+        return self.browse(processed)
+
+    @api.model
+    def _cron_process_pending_chunks(self):
+        workers = int(self.env['ir.config_parameter'].sudo().get_param('simple_payroll.run_workers', 2))
+        # chunks must be visible to the worker cursors
+        self.env.cr.commit()
+        processed = self._process_in_parallel(max(workers, 1))
+        # the workers committed on their own cursors
+        self.env.invalidate_all()
+        # workers finishing the last chunks concurrently may each still see the other one pending
+        self.env['hr.payslip.run'].search([('state', '=', 'running')])._update_state()
+        # one refresh per month once the runs are closed, instead of one per worker racing on the same rows;
+        # runs closed by an invocation that died before this point are caught up by the next one
+        self.env['hr.payslip.run'].search([
+            ('state', 'in', ('done', 'failed')),
+            ('summary_refreshed', '=', False),
+        ])._refresh_summary()
+        _logger.info("Payroll workers processed %d chunks", len(processed))
@@ -0,0 +1,164 @@
+from odoo import models, fields, api, tools
+from collections import defaultdict
+
+SUMMARY_MEASURES = ['basic_wage', 'allowances', 'deductions', 'net_wage']
+
+
+class HrPayslipSummary(models.Model):
+    _name = 'hr.payslip.summary'
+    _inherit = ['simple.profiling.mixin']
+    _description = 'Payroll Summary'
+    _order = 'period desc, company_id, state'
+
+    # one row per company, month and state; maintained by hr.payslip, see _apply_deltas
+    company_id = fields.Many2one('res.company', string='Company', readonly=True)
+    period = fields.Date(string='Period', readonly=True, help="First day of the payslip month")
+    state = fields.Selection([
+        ('draft', 'Draft'),
+        ('verify', 'Waiting'),
+        ('done', 'Done'),
+        ('cancel', 'Rejected'),
+    ], string='Status', readonly=True)
+
+    payslip_count = fields.Integer(string='Payslips', readonly=True)
+    basic_wage_total = fields.Float(string='Basic Wage Total', readonly=True)
+    allowances_total = fields.Float(string='Allowances Total', readonly=True)
+    deductions_total = fields.Float(string='Deductions Total', readonly=True)
+    net_wage_total = fields.Float(string='Net Salary Total', readonly=True)
+
+    basic_wage_avg = fields.Float(string='Average Basic Wage', compute='_compute_averages')
+    allowances_avg = fields.Float(string='Average Allowances', compute='_compute_averages')
+    deductions_avg = fields.Float(string='Average Deductions', compute='_compute_averages')
+    net_wage_avg = fields.Float(string='Average Net Salary', compute='_compute_averages')
+
+    def init(self):
+        if not tools.index_exists(self._cr, 'hr_payslip_summary_key_uniq'):
+            self._cr.execute("""
+                CREATE UNIQUE INDEX hr_payslip_summary_key_uniq
+                    ON hr_payslip_summary ((COALESCE(company_id, 0)), period, state)
+            """)
+
+    @api.depends('payslip_count', 'basic_wage_total', 'allowances_total', 'deductions_total', 'net_wage_total')
+    def _compute_averages(self):
+        for record in self:
+            for measure in SUMMARY_MEASURES:
+                total = record[f'{measure}_total']
+                record[f'{measure}_avg'] = total / record.payslip_count if record.payslip_count else 0.0
+
+    @api.model
+    def _apply_deltas(self, deltas):
+        """Add signed payslip totals to their summary rows in one upsert.
+
+        ``deltas`` maps ``(company_id, period, state)`` keys to
+        ``[count, basic_wage, allowances, deductions, net_wage]`` increments.
+        """
+        deltas = {key: delta for key, delta in deltas.items() if any(delta)}
+        if not deltas:
+            return
+        self.flush_model()
+        keys = list(deltas)
+        columns = list(zip(*(deltas[key] for key in keys)))
+        self.env.cr.execute("""
+            INSERT INTO hr_payslip_summary AS summary (
+                company_id, period, state, payslip_count, basic_wage_total,
+                allowances_total, deductions_total, net_wage_total
+            )
+            SELECT *
+              FROM unnest(%s::int[], %s::date[], %s::varchar[], %s::int[],
+                          %s::float8[], %s::float8[], %s::float8[], %s::float8[])
+                ON CONFLICT ((COALESCE(company_id, 0)), period, state) DO UPDATE
+               SET payslip_count = summary.payslip_count + EXCLUDED.payslip_count,
+                   basic_wage_total = summary.basic_wage_total + EXCLUDED.basic_wage_total,
+                   allowances_total = summary.allowances_total + EXCLUDED.allowances_total,
+                   deductions_total = summary.deductions_total + EXCLUDED.deductions_total,
+                   net_wage_total = summary.net_wage_total + EXCLUDED.net_wage_total
+        """, [
+            [key[0] or None for key in keys],
+            [key[1] for key in keys],
+            [key[2] for key in keys],
+            *[list(column) for column in columns],
+        ])
+        self.env.cr.execute("DELETE FROM hr_payslip_summary WHERE payslip_count <= 0")
+        self.invalidate_model()
+
+    @api.model
+    def _refresh(self, periods=None):
+        """Rebuild the summary from hr_payslip, for the given months or entirely.
+
+        Rows are upserted and the keys left without payslips deleted in the
+        same statement, so readers never see the months empty and
+        concurrent refreshes do not collide on the unique key.
+        """
+        self.env['hr.payslip'].flush_model()
+        self.flush_model()
+        where, scope, params = '', 'TRUE', []
+        if periods is not None:
+            periods = [fields.Date.to_date(period).replace(day=1) for period in periods]
+            if not periods:
+                return
+            where = "WHERE date_trunc('month', date_from)::date = ANY(%(periods)s::date[])"
+            scope = "period = ANY(%(periods)s::date[])"
+            params = {'periods': periods}
+        self.env.cr.execute(f"""
+            WITH refreshed AS (
+                INSERT INTO hr_payslip_summary AS summary (
+                    company_id, period, state, payslip_count, basic_wage_total,
+                    allowances_total, deductions_total, net_wage_total
+                )
+                SELECT company_id, date_trunc('month', date_from)::date, state, COUNT(*),
+                       SUM(COALESCE(basic_wage, 0)), SUM(COALESCE(allowances, 0)),
+                       SUM(COALESCE(deductions, 0)), SUM(COALESCE(net_wage, 0))
+                  FROM hr_payslip
+                  {where}
+              GROUP BY company_id, date_trunc('month', date_from), state
+                    ON CONFLICT ((COALESCE(company_id, 0)), period, state) DO UPDATE
+                   SET payslip_count = EXCLUDED.payslip_count,
+                       basic_wage_total = EXCLUDED.basic_wage_total,
+                       allowances_total = EXCLUDED.allowances_total,
+                       deductions_total = EXCLUDED.deductions_total,
+                       net_wage_total = EXCLUDED.net_wage_total
+             RETURNING summary.id
+            )
+            DELETE FROM hr_payslip_summary
+             WHERE {scope}
+               AND id NOT IN (SELECT id FROM refreshed)
+        """, params or None)
+        self.invalidate_model()
+
+    @api.model
+    def get_dashboard_figures(self, company_ids=None, date_from=None, date_to=None):
+        """Dashboard-ready payroll figures read from the summary table.
+
+        The cost depends on the number of companies and months, not on the
+        number of payslips. Defaults to the user's active companies.
+        """
+        company_ids = company_ids or self.env.companies.ids
+        domain = [('company_id', 'in', company_ids)]
+        if date_from:
+            domain.append(('period', '>=', date_from))
+        if date_to:
+            domain.append(('period', '<=', date_to))
+        totals = {'all': defaultdict(float)}
+        for row in self.search_read(domain, ['period', 'state', 'payslip_count']
+                                    + [f'{measure}_total' for measure in SUMMARY_MEASURES]):
+            for key in ('all', row['state'], fields.Date.to_string(row['period'])):
+                bucket = totals.setdefault(key, defaultdict(float))
+                bucket['payslip_count'] += row['payslip_count']
+                for measure in SUMMARY_MEASURES:
+                    bucket[f'{measure}_total'] += row[f'{measure}_total']
+
+        def figures(bucket):
+            count = int(bucket['payslip_count'])
+            result = {'payslip_count': count}
+            for measure in SUMMARY_MEASURES:
+                total = bucket[f'{measure}_total']
+                result[f'{measure}_total'] = total
+                result[f'{measure}_avg'] = total / count if count else 0.0
+            return result
+
+        states = dict(self._fields['state'].selection)
+        result = figures(totals.pop('all'))
+        result['by_state'] = {key: figures(bucket) for key, bucket in totals.items() if key in states}
+        result['by_period'] = [dict(figures(totals[key]), period=key)
+                               for key in sorted(key for key in totals if key not in states)]
+        return result
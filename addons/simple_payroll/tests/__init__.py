@@ -0,0 +1 @@
+from . import test_payroll_performance
@@ -0,0 +1,136 @@
+from datetime import date
+
+from odoo.tests import TransactionCase, tagged
+
+BATCH_SIZE = 50
+
+PAYSLIP_LIST_FIELDS = ['name', 'employee_id', 'date_from', 'date_to', 'state', 'net_wage']
+
+
+@tagged('post_install', '-at_install')
+class TestPayrollQueryCount(TransactionCase):
+    """Payslips, their summary rows and run chunks are written per batch, not per employee"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.employees = cls.env['hr.employee'].create([{
+            'name': f'Payroll Employee {index}',
+        } for index in range(BATCH_SIZE)])
+        cls.employee_domain = [('id', 'in', cls.employees.ids)]
+        cls.date_from = date(2024, 1, 1)
+        cls.date_to = date(2024, 1, 31)
+
+    def _generate(self):
+        result = self.env['hr.payslip'].generate_payslips(self.date_from, self.date_to, self.employee_domain)
+        return self.env['hr.payslip'].browse(result['payslip_ids'])
+
+    def _summary(self, state):
+        return self.env['hr.payslip.summary'].search([
+            ('company_id', '=', self.env.company.id),
+            ('period', '=', self.date_from),
+            ('state', '=', state),
+        ])
+
+    def test_generate_payslips(self):
+        with self.assertQueryCount(15):
+            result = self.env['hr.payslip'].generate_payslips(self.date_from, self.date_to, self.employee_domain)
+        self.assertEqual(result['count'], BATCH_SIZE)
+        self.assertEqual(self._summary('draft').payslip_count, BATCH_SIZE)
+
+    def test_generate_payslips_skips_paid_employees(self):
+        self._generate()
+        with self.assertQueryCount(6):
+            result = self.env['hr.payslip'].generate_payslips(self.date_from, self.date_to, self.employee_domain)
+        self.assertEqual(result['count'], 0)
+
+    def test_state_change(self):
+        payslips = self._generate()
+        with self.assertQueryCount(10):
+            payslips.action_payslip_done()
+        self.assertFalse(self._summary('draft'))
+        summary = self._summary('done')
+        self.assertEqual(summary.payslip_count, BATCH_SIZE)
+        self.assertAlmostEqual(summary.net_wage_total, sum(payslips.mapped('net_wage')))
+
+    def test_unlink(self):
+        payslips = self._generate()
+        with self.assertQueryCount(15):
+            payslips[:10].unlink()
+        self.assertEqual(self._summary('draft').payslip_count, BATCH_SIZE - 10)
+
+    def test_list_read(self):
+        payslips = self._generate()
+        self.env.invalidate_all()
+        with self.assertQueryCount(5):
+            records = self.env['hr.payslip'].search_read([('id', 'in', payslips.ids)], PAYSLIP_LIST_FIELDS)
+        self.assertEqual(len(records), BATCH_SIZE)
+
+    def test_dashboard_figures(self):
+        self._generate()
+        self.env.invalidate_all()
+        with self.assertQueryCount(3):
+            figures = self.env['hr.payslip.summary'].get_dashboard_figures()
+        self.assertGreaterEqual(figures['by_state']['draft']['payslip_count'], BATCH_SIZE)
+
+    def test_summary_refresh_matches_incremental_updates(self):
+        payslips = self._generate()
+        payslips[:20].action_payslip_done()
+        payslips[20:25].write({'basic_wage': 1000000})
+        expected = {summary.state: (summary.payslip_count, summary.net_wage_total)
+                    for summary in self._summary('draft') | self._summary('done')}
+        with self.assertQueryCount(3):
+            self.env['hr.payslip.summary']._refresh(periods=[self.date_from])
+        for state, (count, net_wage_total) in expected.items():
+            summary = self._summary(state)
+            self.assertEqual(summary.payslip_count, count)
+            self.assertAlmostEqual(summary.net_wage_total, net_wage_total)
+
+    def test_summary_refresh_drops_emptied_keys(self):
+        payslips = self._generate()
+        self.env.cr.execute("UPDATE hr_payslip SET state = 'done' WHERE id IN %s", [tuple(payslips.ids)])
+        payslips.invalidate_recordset(['state'])
+        self.env['hr.payslip.summary']._refresh(periods=[self.date_from])
+        self.assertFalse(self._summary('draft'))
+        self.assertEqual(self._summary('done').payslip_count, BATCH_SIZE)
+
+    def _start_run(self):
+        run = self.env['hr.payslip.run'].create({
+            'name': 'January',
+            'date_from': self.date_from,
+            'date_to': self.date_to,
+            'employee_domain': str(self.employee_domain),
+            'chunk_size': BATCH_SIZE,
+        })
+        run.action_start()
+        return run
+
+    def test_run_chunk(self):
+        run = self._start_run()
+        chunk = run.chunk_ids
+        self.assertEqual(len(chunk), 1)
+        with self.assertQueryCount(15):
+            chunk._generate_payslips()
+        self.assertEqual(chunk.payslip_count, BATCH_SIZE)
+        # the chunk skips the summary, the cron refreshes it once the run is closed
+        self.assertFalse(self._summary('draft'))
+        run._update_state()
+        self.assertEqual(run.state, 'done')
+        # payslips of a run not summarized yet do not move the summary rows
+        run.slip_ids[:10].action_payslip_done()
+        self.assertFalse(self._summary('done'))
+        run._refresh_summary()
+        self.assertTrue(run.summary_refreshed)
+        self.assertEqual(self._summary('draft').payslip_count, BATCH_SIZE - 10)
+        self.assertEqual(self._summary('done').payslip_count, 10)
+        # once refreshed, they are counted incrementally again
+        run.slip_ids[10:15].action_payslip_done()
+        self.assertEqual(self._summary('done').payslip_count, 15)
+
+    def test_run_chunk_relock(self):
+        chunk = self._start_run().chunk_ids
+        self.assertTrue(chunk._relock())
+        # a chunk another worker already finished is not touched again
+        chunk.write({'state': 'done'})
+        chunk.flush_recordset()
+        self.assertFalse(chunk._relock())
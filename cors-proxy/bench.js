@@ -0,0 +1,253 @@
+// 프록시 처리량 벤치마크: 기존 프록시(server.js)와 게이트웨이(gateway.js)를 같은 부하로 비교
+//
+// 기본으로는 search_read 응답을 흉내내는 가짜 Odoo 서버를 띄워 프록시 자체의 오버헤드만 측정하고,
+// --target을 주면 실제 Odoo에 로그인해 측정
+//
+// 사용법:
+//   node bench.js [--concurrency=50] [--duration=10] [--rows=200] [--latency=5] [--writes=0.1]
+//   node bench.js --target=http://localhost:8069 --db=odoo_hr --login=admin --password=admin
+//
+//   --rows     가짜 서버의 search_read 응답 행 수
+//   --latency  가짜 서버의 응답 지연(ms)
+//   --writes   write 호출 비율 (같은 세션의 조회 캐시를 무효화)
+
+const http = require('http');
+const net = require('net');
+const path = require('path');
+const { spawn } = require('child_process');
+
+const options = {
+  concurrency: 50,
+  duration: 10,
+  rows: 200,
+  latency: 5,
+  writes: 0.1,
+  target: '',
+  db: 'odoo_hr',
+  login: 'admin',
+  password: 'admin',
+};
+process.argv.slice(2).forEach((arg) => {
+  const [key, value] = arg.replace(/^--/, '').split('=');
+  if (!(key in options)) {
+    console.error(`❌ 알 수 없는 옵션: ${arg}`);
+    process.exit(1);
+  }
+  options[key] = typeof options[key] === 'number' ? Number(value) : value;
+});
+
+const ORIGIN = 'http://localhost:3000';
+
+// 프론트엔드가 보내는 조회 몇 가지를 번갈아 호출
+const READ_CALLS = [0, 80, 160, 240, 320].map((offset) => ({
+  model: 'hr.employee',
+  method: 'search_read',
+  args: [],
+  kwargs: { domain: [], fields: ['name', 'job_title', 'department_id', 'work_email', 'work_phone'], limit: 80, offset },
+}));
+
+function startFakeOdoo() {
+  const rows = Array.from({ length: options.rows }, (_, index) => ({
+    id: index + 1,
+    name: `직원 ${index + 1}`,
+    job_title: '소프트웨어 엔지니어',
+    department_id: [1 + (index % 10), `부서 ${1 + (index % 10)}`],
+    work_email: `employee${index + 1}@example.com`,
+    work_phone: `010-0000-${String(index).padStart(4, '0')}`,
+  }));
+  const server = http.createServer((req, res) => {
+    const chunks = [];
+    req.on('data', (chunk) => chunks.push(chunk));
+    req.on('end', () => setTimeout(() => {
+      const payload = chunks.length ? JSON.parse(Buffer.concat(chunks)) : {};
+      const result = payload.params && payload.params.method === 'search_read' ? rows : true;
+      // Odoo와 같은 직렬화 형식 (json.dumps 기본 구분자)
+      const body = `{"jsonrpc": "2.0", "id": ${JSON.stringify(payload.id)}, "result": ${JSON.stringify(result)}}`;
+      res.writeHead(200, {
+        'Content-Type': 'application/json',
+        'Content-Length': Buffer.byteLength(body),
+        'Set-Cookie': 'session_id=bench; Path=/; HttpOnly',
+      });
+      res.end(body);
+    }, options.latency));
+  });
+  return new Promise((resolve) => server.listen(0, () => resolve(server)));
+}
+
+function freePort() {
+  return new Promise((resolve) => {
+    const server = net.createServer().listen(0, () => {
+      const { port } = server.address();
+      server.close(() => resolve(port));
+    });
+  });
+}
+
+function waitForPort(port, child) {
+  return new Promise((resolve, reject) => {
+    const started = Date.now();
+    const attempt = () => {
+      if (child.exitCode !== null) {
+        reject(new Error(`프로세스 종료 (코드 ${child.exitCode})`));
+        return;
+      }
+      const socket = net.connect(port, '127.0.0.1');
+      socket.on('connect', () => {
+        socket.destroy();
+        resolve();
+      });
+      socket.on('error', () => {
+        if (Date.now() - started > 10000) {
+          reject(new Error('시작 시간 초과'));
+        } else {
+          setTimeout(attempt, 100);
+        }
+      });
+    };
+    attempt();
+  });
+}
+
+function post(agent, port, urlPath, body, cookie) {
+  return new Promise((resolve, reject) => {
+    const request = http.request({
+      hostname: '127.0.0.1',
+      port,
+      path: urlPath,
+      method: 'POST',
+      agent,
+      headers: {
+        'Content-Type': 'application/json',
+        'Content-Length': Buffer.byteLength(body),
+        'Accept-Encoding': 'gzip, br',
+        Origin: ORIGIN,
+        ...(cookie ? { Cookie: cookie } : {}),
+      },
+    }, (response) => {
+      let bytes = 0;
+      response.on('data', (chunk) => {
+        bytes += chunk.length;
+      });
+      response.on('end', () => resolve({ status: response.statusCode, bytes, headers: response.headers }));
+      response.on('error', reject);
+    });
+    request.on('error', reject);
+    request.end(body);
+  });
+}
+
+async function login(port) {
+  const agent = new http.Agent();
+  const body = JSON.stringify({
+    jsonrpc: '2.0',
+    method: 'call',
+    params: { db: options.db, login: options.login, password: options.password },
+    id: 0,
+  });
+  const response = await post(agent, port, '/web/session/authenticate', body);
+  const cookie = (response.headers['set-cookie'] || []).map((value) => value.split(';')[0])
+    .find((value) => value.startsWith('session_id='));
+  agent.destroy();
+  return cookie || '';
+}
+
+async function runLoad(port) {
+  const agent = new http.Agent({ keepAlive: true, maxSockets: options.concurrency });
+  const latencies = [];
+  let bytes = 0;
+  let errors = 0;
+  let nextId = 1;
+  const deadline = Date.now() + options.duration * 1000;
+
+  const client = async () => {
+    // 가상 사용자마다 세션을 따로 사용 (게이트웨이 캐시는 세션 단위)
+    const cookie = await login(port);
+    while (Date.now() < deadline) {
+      const write = Math.random() < options.writes;
+      const params = write
+        ? { model: 'hr.employee', method: 'write', args: [[1], { work_phone: '010-1234-5678' }], kwargs: {} }
+        : READ_CALLS[Math.floor(Math.random() * READ_CALLS.length)];
+      const body = JSON.stringify({ jsonrpc: '2.0', method: 'call', params, id: nextId++ });
+      const start = process.hrtime.bigint();
+      try {
+        const response = await post(agent, port, '/web/dataset/call_kw', body, cookie);
+        bytes += response.bytes;
+        if (response.status !== 200) {
+          errors += 1;
+        }
+      } catch (error) {
+        errors += 1;
+      }
+      latencies.push(Number(process.hrtime.bigint() - start) / 1e6);
+    }
+  };
+
+  const started = Date.now();
+  await Promise.all(Array.from({ length: options.concurrency }, client));
+  const seconds = (Date.now() - started) / 1000;
+  agent.destroy();
+
+  latencies.sort((a, b) => a - b);
+  const at = (ratio) => latencies[Math.min(latencies.length - 1, Math.ceil(ratio * latencies.length) - 1)] || 0;
+  const round = (value) => Math.round(value * 10) / 10;
+  return {
+    requests: latencies.length,
+    errors,
+    rps: round(latencies.length / seconds),
+    p50: round(at(0.5)),
+    p99: round(at(0.99)),
+    'KB/req': round(bytes / 1024 / Math.max(latencies.length, 1)),
+  };
+}
+
+async function benchmark(label, script, env, target) {
+  const port = await freePort();
+  const child = spawn(process.execPath, [path.join(__dirname, script)], {
+    env: { ...process.env, ...env, PORT: String(port), ODOO_URL: target },
+    stdio: 'ignore',
+  });
+  try {
+    await waitForPort(port, child);
+    console.log(`🚀 ${label} 측정 중 (${options.concurrency}명, ${options.duration}초)...`);
+    return await runLoad(port);
+  } catch (error) {
+    console.log(`⚠️  ${label} 건너뜀: ${error.message}`);
+    return null;
+  } finally {
+    child.kill();
+  }
+}
+
+async function main() {
+  let fakeOdoo = null;
+  let target = options.target;
+  if (!target) {
+    fakeOdoo = await startFakeOdoo();
+    target = `http://127.0.0.1:${fakeOdoo.address().port}`;
+    console.log(`📡 가짜 Odoo: ${target} (search_read ${options.rows}행, 지연 ${options.latency}ms)`);
+  }
+
+  const results = {};
+  const runs = [
+    ['proxy (server.js)', 'server.js', {}],
+    ['gateway', 'gateway.js', { GATEWAY_CACHE_TTL: '0' }],
+    ['gateway + cache', 'gateway.js', {}],
+  ];
+  for (const [label, script, env] of runs) {
+    const result = await benchmark(label, script, env, target);
+    if (result) {
+      results[label] = result;
+    }
+  }
+
+  if (fakeOdoo) {
+    fakeOdoo.close();
+  }
+  console.log('');
+  console.table(results);
+}
+
+main().catch((error) => {
+  console.error('❌ 벤치마크 실패:', error.message);
+  process.exit(1);
+});
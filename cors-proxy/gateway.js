@@ -0,0 +1,413 @@
+// CORS 게이트웨이 (server.js 대체용 고성능 모드)
+// - 요청/응답 본문을 파싱해 다시 직렬화하지 않고 그대로 전달
+// - Odoo로의 연결은 keep-alive 에이전트 풀에서 재사용
+// - 큰 JSON 응답은 클라이언트가 지원하면 brotli/gzip으로 압축
+// - CORS preflight(OPTIONS)는 Odoo까지 가지 않고 직접 응답하며 브라우저가 max-age 동안 캐시
+// - 조회 call_kw 결과는 세션별로 짧게 캐시하고, 같은 세션의 변경 호출이 오면 해당 모델 캐시를 무효화
+//
+// 환경 변수 (기본값):
+//   PORT=8070
+//   ODOO_URL=http://localhost:8069
+//   ALLOWED_ORIGINS=http://localhost:3000      쉼표로 여러 개 지정
+//   GATEWAY_CACHE_TTL=2000                     조회 캐시 유지 시간(ms), 0이면 캐시 끔
+//   GATEWAY_CACHE_SIZE=2000                    캐시 항목 수 상한
+//   GATEWAY_MAX_SOCKETS=64                     Odoo로 여는 최대 동시 연결 수
+//   GATEWAY_COMPRESS_MIN=1024                  이 크기(byte) 이상 응답만 압축
+//   GATEWAY_DEBUG=true                         요청별 로그 출력
+
+const http = require('http');
+const https = require('https');
+const zlib = require('zlib');
+
+const PORT = Number(process.env.PORT || 8070);
+const TARGET = new URL(process.env.ODOO_URL || 'http://localhost:8069');
+const ALLOWED_ORIGINS = new Set((process.env.ALLOWED_ORIGINS || 'http://localhost:3000').split(',').map((origin) => origin.trim()));
+const CACHE_TTL = Number(process.env.GATEWAY_CACHE_TTL || 2000);
+const CACHE_SIZE = Number(process.env.GATEWAY_CACHE_SIZE || 2000);
+const MAX_SOCKETS = Number(process.env.GATEWAY_MAX_SOCKETS || 64);
+const COMPRESS_MIN = Number(process.env.GATEWAY_COMPRESS_MIN || 1024);
+const DEBUG = process.env.GATEWAY_DEBUG === 'true';
+
+// frontend/src/services/rpcTransport.js 의 READ_METHODS와 동일하게 유지
+const READ_METHODS = new Set([
+  'search_read',
+  'search_page',
+  'read',
+  'search',
+  'search_count',
+  'read_group',
+  'name_search',
+  'name_get',
+  'fields_get',
+  'get_kpis',
+  'get_dashboard_figures',
+  'get_score_analytics',
+]);
+
+const CALL_KW_PATH = /^\/web\/dataset\/call_kw(\/|$|\?)/;
+const BATCH_PATH = '/simple_hr_api/call_kw_batch';
+
+// 프록시가 그대로 넘기면 안 되는 연결 단위 헤더
+const HOP_BY_HOP = new Set([
+  'connection', 'keep-alive', 'proxy-authenticate', 'proxy-authorization',
+  'te', 'trailer', 'transfer-encoding', 'upgrade',
+]);
+
+const upstream = TARGET.protocol === 'https:' ? https : http;
+const agent = new upstream.Agent({
+  keepAlive: true,
+  keepAliveMsecs: 10000,
+  maxSockets: MAX_SOCKETS,
+  maxFreeSockets: MAX_SOCKETS,
+  scheduling: 'lifo',
+});
+
+function log(...args) {
+  if (DEBUG) {
+    console.log(...args);
+  }
+}
+
+// 세션별 조회 결과 캐시: 키 -> { status, headers, body, model, session, time }
+class ReadCache {
+  constructor(maxSize, ttl) {
+    this.maxSize = maxSize;
+    this.ttl = ttl;
+    this.entries = new Map();
+    this.inflight = new Map();
+  }
+
+  get(key) {
+    const entry = this.entries.get(key);
+    if (!entry) {
+      return undefined;
+    }
+    if (Date.now() - entry.time > this.ttl) {
+      this.entries.delete(key);
+      return undefined;
+    }
+    return entry;
+  }
+
+  set(key, entry) {
+    this.entries.delete(key);
+    this.entries.set(key, { ...entry, time: Date.now() });
+    while (this.entries.size > this.maxSize) {
+      this.entries.delete(this.entries.keys().next().value);
+    }
+  }
+
+  // 저장된 결과를 지우고, 진행 중인 조회는 결과를 캐시하지 않도록 표시한 뒤 목록에서 제외
+  // (이후 같은 조회는 변경 전 요청에 합류하지 않고 새로 요청)
+  invalidate(session, model) {
+    for (const [key, entry] of this.entries) {
+      if (entry.session === session && entry.model === model) {
+        this.entries.delete(key);
+      }
+    }
+    for (const [key, pending] of this.inflight) {
+      if (pending.session === session && pending.model === model) {
+        pending.stale = true;
+        this.inflight.delete(key);
+      }
+    }
+  }
+}
+
+const cache = new ReadCache(CACHE_SIZE, CACHE_TTL);
+
+function corsHeaders(req) {
+  const origin = req.headers.origin;
+  if (!origin || !ALLOWED_ORIGINS.has(origin)) {
+    return {};
+  }
+  return {
+    'Access-Control-Allow-Origin': origin,
+    'Access-Control-Allow-Credentials': 'true',
+    Vary: 'Origin',
+  };
+}
+
+function handlePreflight(req, res) {
+  res.writeHead(204, {
+    ...corsHeaders(req),
+    'Access-Control-Allow-Methods': 'GET, POST, PUT, DELETE, OPTIONS',
+    'Access-Control-Allow-Headers': req.headers['access-control-request-headers']
+      || 'Content-Type, Authorization, X-Requested-With, Accept, Origin',
+    'Access-Control-Max-Age': '86400',
+    'Content-Length': '0',
+  });
+  res.end();
+}
+
+function sessionOf(req) {
+  const match = /(?:^|;\s*)session_id=([^;]+)/.exec(req.headers.cookie || '');
+  return match ? match[1] : null;
+}
+
+function pickEncoding(req) {
+  const accepted = req.headers['accept-encoding'] || '';
+  if (/\bbr\b/.test(accepted)) {
+    return 'br';
+  }
+  if (/\bgzip\b/.test(accepted)) {
+    return 'gzip';
+  }
+  return null;
+}
+
+// brotli 기본 품질(11)은 너무 느려 실시간 응답에는 4 정도가 적당
+const BROTLI_OPTIONS = { params: { [zlib.constants.BROTLI_PARAM_QUALITY]: 4 } };
+const GZIP_OPTIONS = { level: 5 };
+
+function compressor(encoding) {
+  return encoding === 'br' ? zlib.createBrotliCompress(BROTLI_OPTIONS) : zlib.createGzip(GZIP_OPTIONS);
+}
+
+// 버퍼로 받은 응답은 스트림을 만들지 않고 한 번에 압축
+function compressBuffer(encoding, buffer) {
+  return new Promise((resolve, reject) => {
+    const done = (error, result) => (error ? reject(error) : resolve(result));
+    if (encoding === 'br') {
+      zlib.brotliCompress(buffer, BROTLI_OPTIONS, done);
+    } else {
+      zlib.gzip(buffer, GZIP_OPTIONS, done);
+    }
+  });
+}
+
+function upstreamHeaders(req, body) {
+  const headers = {};
+  for (const [name, value] of Object.entries(req.headers)) {
+    if (!HOP_BY_HOP.has(name)) {
+      headers[name] = value;
+    }
+  }
+  headers.host = TARGET.host;
+  // 압축은 게이트웨이에서 처리
+  delete headers['accept-encoding'];
+  if (body) {
+    headers['content-length'] = body.length;
+  }
+  return headers;
+}
+
+function responseHeaders(req, headers) {
+  const result = {};
+  for (const [name, value] of Object.entries(headers)) {
+    if (!HOP_BY_HOP.has(name) && !name.startsWith('access-control-')) {
+      result[name] = value;
+    }
+  }
+  return { ...result, ...corsHeaders(req) };
+}
+
+// 응답을 보내면서 조건이 맞으면 압축
+function send(req, res, status, headers, source) {
+  const encoding = pickEncoding(req);
+  const length = Buffer.isBuffer(source) ? source.length : Number(headers['content-length'] || Infinity);
+  const compressible = /json|text|javascript|xml|csv/.test(headers['content-type'] || '');
+  if (encoding && compressible && !headers['content-encoding'] && length >= COMPRESS_MIN) {
+    delete headers['content-length'];
+    headers['content-encoding'] = encoding;
+    headers.vary = headers.vary ? `${headers.vary}, Accept-Encoding` : 'Accept-Encoding';
+    if (Buffer.isBuffer(source)) {
+      compressBuffer(encoding, source).then((compressed) => {
+        headers['content-length'] = compressed.length;
+        res.writeHead(status, headers);
+        res.end(compressed);
+      }, (error) => sendError(req, res, error));
+      return;
+    }
+    res.writeHead(status, headers);
+    source.pipe(compressor(encoding)).pipe(res);
+    return;
+  }
+  res.writeHead(status, headers);
+  if (Buffer.isBuffer(source)) {
+    res.end(source);
+  } else {
+    source.pipe(res);
+  }
+}
+
+function sendError(req, res, error) {
+  console.error('❌ 게이트웨이 오류:', error.message);
+  if (res.headersSent) {
+    res.destroy(error);
+    return;
+  }
+  const body = Buffer.from(JSON.stringify({ error: '프록시 서버 오류', message: error.message }));
+  res.writeHead(502, { ...corsHeaders(req), 'Content-Type': 'application/json', 'Content-Length': body.length });
+  res.end(body);
+}
+
+// 본문을 그대로 스트리밍으로 전달 (세션 인증, 내보내기, 정적 파일 등)
+function passThrough(req, res) {
+  const proxyReq = upstream.request({
+    protocol: TARGET.protocol,
+    hostname: TARGET.hostname,
+    port: TARGET.port,
+    path: req.url,
+    method: req.method,
+    headers: upstreamHeaders(req),
+    agent,
+  }, (proxyRes) => {
+    log(`✅ ${proxyRes.statusCode} ${req.method} ${req.url}`);
+    send(req, res, proxyRes.statusCode, responseHeaders(req, proxyRes.headers), proxyRes);
+  });
+  proxyReq.on('error', (error) => sendError(req, res, error));
+  req.pipe(proxyReq);
+}
+
+// 본문을 버퍼로 받아 Odoo에 전달하고 응답 본문도 버퍼로 받음
+function forwardBuffered(req, body) {
+  return new Promise((resolve, reject) => {
+    const proxyReq = upstream.request({
+      protocol: TARGET.protocol,
+      hostname: TARGET.hostname,
+      port: TARGET.port,
+      path: req.url,
+      method: req.method,
+      headers: upstreamHeaders(req, body),
+      agent,
+    }, (proxyRes) => {
+      const chunks = [];
+      proxyRes.on('data', (chunk) => chunks.push(chunk));
+      proxyRes.on('end', () => resolve({
+        status: proxyRes.statusCode,
+        headers: proxyRes.headers,
+        body: Buffer.concat(chunks),
+      }));
+      proxyRes.on('error', reject);
+    });
+    proxyReq.on('error', reject);
+    proxyReq.end(body);
+  });
+}
+
+function readBody(req) {
+  return new Promise((resolve, reject) => {
+    const chunks = [];
+    req.on('data', (chunk) => chunks.push(chunk));
+    req.on('end', () => resolve(Buffer.concat(chunks)));
+    req.on('error', reject);
+  });
+}
+
+// 캐시된 JSON-RPC 응답의 id를 현재 요청의 id로 교체
+// Odoo 응답은 {"jsonrpc": "2.0", "id": ..., "result": ...} 순서로 직렬화됨
+const RESPONSE_ID = /^(\{\s*"jsonrpc"\s*:\s*"2\.0"\s*,\s*"id"\s*:\s*)(null|-?\d+|"(?:[^"\\]|\\.)*")(\s*,\s*"result"\s*:)/;
+
+function withRequestId(body, requestId) {
+  const head = body.subarray(0, 128).toString('latin1');
+  const match = RESPONSE_ID.exec(head);
+  if (!match) {
+    return null;
+  }
+  const prefix = Buffer.from(`${match[1]}${JSON.stringify(requestId === undefined ? null : requestId)}${match[3]}`);
+  return Buffer.concat([prefix, body.subarray(Buffer.byteLength(match[0], 'latin1'))]);
+}
+
+async function handleCallKw(req, res) {
+  const body = await readBody(req);
+  let payload;
+  try {
+    payload = JSON.parse(body);
+  } catch (error) {
+    payload = null;
+  }
+  const session = sessionOf(req);
+  const params = (payload && payload.params) || {};
+
+  const written = req.url === BATCH_PATH
+    ? [...new Set((params.calls || []).filter((call) => !READ_METHODS.has(call.method)).map((call) => call.model))]
+    : (params.model && !READ_METHODS.has(params.method) ? [params.model] : []);
+  // 변경 전후로 두 번 무효화: 변경이 진행되는 동안 시작된 조회가 변경 전 데이터를 캐시하지 않도록 함
+  const invalidateWritten = () => written.forEach((model) => cache.invalidate(session, model));
+  invalidateWritten();
+
+  const cacheable = CACHE_TTL > 0 && session && req.url !== BATCH_PATH && READ_METHODS.has(params.method);
+  if (!cacheable) {
+    let response;
+    try {
+      response = await forwardBuffered(req, body);
+    } finally {
+      invalidateWritten();
+    }
+    log(`✅ ${response.status} ${params.model}.${params.method}`);
+    send(req, res, response.status, responseHeaders(req, response.headers), response.body);
+    return;
+  }
+
+  const key = `${session}\u0000${JSON.stringify([params.model, params.method, params.args, params.kwargs])}`;
+  let entry = cache.get(key);
+  if (entry) {
+    log(`⚡ 캐시 ${params.model}.${params.method}`);
+  } else if (cache.inflight.has(key)) {
+    entry = await cache.inflight.get(key).promise;
+  } else {
+    const pending = { session, model: params.model, stale: false };
+    pending.promise = forwardBuffered(req, body).then((response) => {
+      const cached = { ...response, model: params.model, session, requestId: payload.id };
+      // 정상 결과만 캐시 (오류 응답은 "result" 대신 "error"가 있어 withRequestId가 null)
+      // 요청 도중 같은 모델이 변경되었으면 변경 전 데이터일 수 있으므로 캐시하지 않음
+      if (response.status === 200 && withRequestId(response.body, payload.id) && !pending.stale) {
+        cache.set(key, cached);
+      }
+      return cached;
+    });
+    cache.inflight.set(key, pending);
+    try {
+      entry = await pending.promise;
+    } finally {
+      if (cache.inflight.get(key) === pending) {
+        cache.inflight.delete(key);
+      }
+    }
+    log(`✅ ${entry.status} ${params.model}.${params.method}`);
+  }
+
+  const responseBody = entry.requestId === payload.id ? entry.body : withRequestId(entry.body, payload.id);
+  if (!responseBody) {
+    // 공유한 진행 중 요청이 오류로 끝난 경우 직접 다시 요청
+    const response = await forwardBuffered(req, body);
+    send(req, res, response.status, responseHeaders(req, response.headers), response.body);
+    return;
+  }
+  const headers = responseHeaders(req, entry.headers);
+  // 캐시 응답은 다른 요청의 쿠키를 다시 내려주지 않음
+  delete headers['set-cookie'];
+  headers['content-length'] = responseBody.length;
+  send(req, res, entry.status, headers, responseBody);
+}
+
+function handle(req, res) {
+  if (req.method === 'OPTIONS') {
+    handlePreflight(req, res);
+    return;
+  }
+  if (req.method === 'POST' && (CALL_KW_PATH.test(req.url) || req.url === BATCH_PATH)) {
+    handleCallKw(req, res).catch((error) => sendError(req, res, error));
+    return;
+  }
+  passThrough(req, res);
+}
+
+function createGateway() {
+  const server = http.createServer(handle);
+  server.keepAliveTimeout = 65000;
+  server.headersTimeout = 66000;
+  return server;
+}
+
+module.exports = { createGateway, withRequestId, READ_METHODS };
+
+if (require.main === module) {
+  createGateway().listen(PORT, () => {
+    console.log(`🚀 CORS 게이트웨이가 포트 ${PORT}에서 실행 중입니다`);
+    console.log(`📡 Odoo 백엔드: ${TARGET.origin} (keep-alive 연결 최대 ${MAX_SOCKETS}개)`);
+    console.log(`🌐 허용 Origin: ${[...ALLOWED_ORIGINS].join(', ')}`);
+    console.log(`⚡ 조회 캐시: ${CACHE_TTL > 0 ? `${CACHE_TTL}ms` : '사용 안 함'}`);
+  });
+}
@@ -3,7 +3,8 @@ const { createProxyMiddleware } = require('http-proxy-middleware');
 const cors = require('cors');
 
 const app = express();
-const PORT = 8070;
+const PORT = Number(process.env.PORT || 8070);
+const ODOO_URL = process.env.ODOO_URL || 'http://localhost:8069';
 
 // CORS 설정
 app.use(cors({
@@ -18,7 +19,7 @@ app.use(express.json());
 
 // Odoo 프록시 설정
 const odooProxy = createProxyMiddleware({
-  target: 'http://localhost:8069',
+  target: ODOO_URL,
   changeOrigin: true,
   secure: false,
   logLevel: 'debug',
@@ -58,7 +59,7 @@ app.use('/', odooProxy);
 // 서버 시작
 app.listen(PORT, () => {
   console.log(`🚀 CORS 프록시 서버가 포트 ${PORT}에서 실행 중입니다`);
-  console.log(`📡 Odoo 백엔드: http://localhost:8069`);
+  console.log(`📡 Odoo 백엔드: ${ODOO_URL}`);
   console.log(`🌐 React 프론트엔드: http://localhost:3000`);
   console.log(`🔄 프록시 서버: http://localhost:${PORT}`);
 });
@@ -0,0 +1,46 @@
+import { useCallback, useEffect, useState } from 'react';
+
+// 고정 높이 행 목록의 가상 스크롤
+// - 스크롤 위치에 보이는 행(+ 여유분)만 렌더링하고 위/아래는 빈 공간으로 채움
+// - 마지막 행 근처까지 스크롤하면 onEndReached를 호출해 다음 페이지를 불러옴
+const useVirtualRows = ({ count, rowHeight, overscan = 10, onEndReached }) => {
+  // 목록이 로딩 후에 렌더링되어도 크기를 잡을 수 있도록 callback ref 사용
+  const [container, containerRef] = useState(null);
+  const [scrollTop, setScrollTop] = useState(0);
+  const [viewportHeight, setViewportHeight] = useState(0);
+
+  const handleScroll = useCallback((event) => {
+    setScrollTop(event.currentTarget.scrollTop);
+  }, []);
+
+  useEffect(() => {
+    if (!container) {
+      return undefined;
+    }
+    setViewportHeight(container.clientHeight);
+    const observer = new ResizeObserver(() => setViewportHeight(container.clientHeight));
+    observer.observe(container);
+    return () => observer.disconnect();
+  }, [container]);
+
+  const visibleCount = Math.ceil(viewportHeight / rowHeight);
+  const start = Math.max(0, Math.floor(scrollTop / rowHeight) - overscan);
+  const end = Math.min(count, Math.floor(scrollTop / rowHeight) + visibleCount + overscan);
+
+  useEffect(() => {
+    if (onEndReached && count > 0 && end >= count - overscan) {
+      onEndReached();
+    }
+  }, [count, end, overscan, onEndReached]);
+
+  return {
+    containerRef,
+    handleScroll,
+    start,
+    end,
+    paddingTop: start * rowHeight,
+    paddingBottom: (count - end) * rowHeight,
+  };
+};
+
+export default useVirtualRows;
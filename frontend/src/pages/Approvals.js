@@ -1,5 +1,5 @@
-import React, { useState } from 'react';
-import { useQuery, useMutation, useQueryClient } from 'react-query';
+import React, { useCallback, useState } from 'react';
+import { useInfiniteQuery, useQuery, useMutation, useQueryClient } from 'react-query';
 import {
   Box,
   Typography,
@@ -13,6 +13,7 @@ import {
   TableHead,
   TableRow,
   Paper,
+  Checkbox,
   Chip,
   CircularProgress,
   Alert,
@@ -43,6 +44,14 @@ import {
 import { format, parseISO } from 'date-fns';
 import { ko } from 'date-fns/locale';
 import odooApi from '../services/odooApi';
+import useVirtualRows from '../hooks/useVirtualRows';
+
+const PAGE_SIZE = 80;
+const ROW_HEIGHT = 73;
+const REQUEST_FIELDS = [
+  'id', 'name', 'category_id', 'request_owner_id', 'employee_id',
+  'date_start', 'date_end', 'reason', 'amount', 'state', 'create_date'
+];
 
 const ApprovalCard = ({ title, value, icon, color }) => (
   <Card>
@@ -88,6 +97,8 @@ const getStatusText = (state) => {
 const Approvals = () => {
   const [open, setOpen] = useState(false);
   const [selectedRequest, setSelectedRequest] = useState(null);
+  const [selectedIds, setSelectedIds] = useState([]);
+  const [reviewSummary, setReviewSummary] = useState(null);
   const [formData, setFormData] = useState({
     name: '',
     category_id: '',
@@ -99,18 +110,51 @@ const Approvals = () => {
 
   const queryClient = useQueryClient();
 
-  // 승인 요청 목록 조회
-  const { data: approvalRequests, isLoading, error } = useQuery(
+  // 승인 요청 목록 조회 (키셋 페이지 단위로 스크롤 시 추가 로딩)
+  const {
+    data: approvalPages,
+    isLoading,
+    error,
+    hasNextPage,
+    isFetchingNextPage,
+    fetchNextPage,
+  } = useInfiniteQuery(
     'approvalRequests',
-    () => odooApi.searchRead('approval.request', [], [
-      'id', 'name', 'category_id', 'request_owner_id', 'employee_id',
-      'date_start', 'date_end', 'reason', 'amount', 'state'
-    ]),
+    ({ pageParam = null }) => odooApi.searchPage('approval.request', [], REQUEST_FIELDS, PAGE_SIZE, pageParam),
+    {
+      getNextPageParam: (lastPage) => lastPage.next_cursor || undefined,
+    }
+  );
+  const approvalRequests = approvalPages?.pages.flatMap((page) => page.records);
+
+  // 상태별 건수는 서버에서 집계
+  const { data: stateCounts } = useQuery(
+    ['approvalRequests', 'stateCounts'],
+    () => odooApi.getApprovalStateCounts(),
     {
       refetchInterval: 30000,
     }
   );
 
+  const handleEndReached = useCallback(() => {
+    if (hasNextPage && !isFetchingNextPage) {
+      fetchNextPage();
+    }
+  }, [hasNextPage, isFetchingNextPage, fetchNextPage]);
+
+  const {
+    containerRef,
+    handleScroll,
+    start,
+    end,
+    paddingTop,
+    paddingBottom,
+  } = useVirtualRows({
+    count: approvalRequests?.length || 0,
+    rowHeight: ROW_HEIGHT,
+    onEndReached: handleEndReached,
+  });
+
   // 승인 카테고리 조회
   const { data: categories } = useQuery(
     'approvalCategories',
@@ -142,17 +186,19 @@ const Approvals = () => {
     }
   );
 
-  // 승인/거부 처리
+  // 승인/거부 처리 (선택한 요청을 한 번의 호출로 일괄 처리)
   const updateStatusMutation = useMutation(
-    ({ id, action }) => {
+    ({ ids, action }) => {
       if (action === 'approve') {
-        return odooApi.callKw('approval.request', 'action_approve', [id]);
+        return odooApi.approveRequests(ids);
       } else if (action === 'refuse') {
-        return odooApi.callKw('approval.request', 'action_refuse', [id]);
+        return odooApi.refuseRequests(ids);
       }
     },
     {
-      onSuccess: () => {
+      onSuccess: (summary) => {
+        setReviewSummary(summary);
+        setSelectedIds([]);
         queryClient.invalidateQueries('approvalRequests');
       },
     }
@@ -171,18 +217,35 @@ const Approvals = () => {
   };
 
   const handleApprove = (id) => {
-    updateStatusMutation.mutate({ id, action: 'approve' });
+    updateStatusMutation.mutate({ ids: [id], action: 'approve' });
   };
 
   const handleRefuse = (id) => {
-    updateStatusMutation.mutate({ id, action: 'refuse' });
+    updateStatusMutation.mutate({ ids: [id], action: 'refuse' });
+  };
+
+  const handleBulkAction = (action) => {
+    updateStatusMutation.mutate({ ids: selectedIds, action });
+  };
+
+  const handleToggleSelect = (id) => {
+    setSelectedIds(prev => (
+      prev.includes(id) ? prev.filter(selectedId => selectedId !== id) : [...prev, id]
+    ));
   };
 
   // 통계 계산
-  const totalRequests = approvalRequests?.length || 0;
-  const approvedRequests = approvalRequests?.filter(req => req.request_status === 'approved').length || 0;
-  const pendingRequests = approvalRequests?.filter(req => req.request_status === 'pending').length || 0;
-  const newRequests = approvalRequests?.filter(req => req.request_status === 'new').length || 0;
+  const totalRequests = Object.values(stateCounts || {}).reduce((total, count) => total + count, 0);
+  const approvedRequests = stateCounts?.approved || 0;
+  const pendingRequests = stateCounts?.pending || 0;
+  const newRequests = stateCounts?.new || 0;
+
+  const pendingIds = approvalRequests?.filter(req => req.state === 'pending').map(req => req.id) || [];
+  const allPendingSelected = pendingIds.length > 0 && pendingIds.every(id => selectedIds.includes(id));
+
+  const handleToggleSelectAll = () => {
+    setSelectedIds(allPendingSelected ? [] : pendingIds);
+  };
 
   if (isLoading) {
     return (
@@ -256,13 +319,62 @@ const Approvals = () => {
       {/* 승인 요청 목록 */}
       <Card>
         <CardContent>
-          <Typography variant="h6" gutterBottom>
-            결재 요청 목록
-          </Typography>
-          <TableContainer component={Paper} variant="outlined">
-            <Table>
+          <Box sx={{ display: 'flex', justifyContent: 'space-between', alignItems: 'center', mb: 1 }}>
+            <Typography variant="h6">
+              결재 요청 목록
+            </Typography>
+            {selectedIds.length > 0 && (
+              <Box sx={{ display: 'flex', gap: 1 }}>
+                <Button
+                  size="small"
+                  variant="contained"
+                  color="success"
+                  onClick={() => handleBulkAction('approve')}
+                  disabled={updateStatusMutation.isLoading}
+                >
+                  선택 승인 ({selectedIds.length})
+                </Button>
+                <Button
+                  size="small"
+                  variant="outlined"
+                  color="error"
+                  onClick={() => handleBulkAction('refuse')}
+                  disabled={updateStatusMutation.isLoading}
+                >
+                  선택 거부 ({selectedIds.length})
+                </Button>
+              </Box>
+            )}
+          </Box>
+          {reviewSummary && (
+            <Alert
+              severity={reviewSummary.denied_ids.length ? 'warning' : 'success'}
+              onClose={() => setReviewSummary(null)}
+              sx={{ mb: 2 }}
+            >
+              {reviewSummary.processed_ids.length}건 처리 완료
+              {reviewSummary.denied_ids.length > 0 &&
+                `, ${reviewSummary.denied_ids.length}건은 권한이 없거나 검토중 상태가 아니어서 건너뛰었습니다`}
+            </Alert>
+          )}
+          <TableContainer
+            component={Paper}
+            variant="outlined"
+            ref={containerRef}
+            onScroll={handleScroll}
+            sx={{ maxHeight: 600 }}
+          >
+            <Table stickyHeader>
               <TableHead>
                 <TableRow>
+                  <TableCell padding="checkbox">
+                    <Checkbox
+                      checked={allPendingSelected}
+                      indeterminate={selectedIds.length > 0 && !allPendingSelected}
+                      onChange={handleToggleSelectAll}
+                      disabled={pendingIds.length === 0}
+                    />
+                  </TableCell>
                   <TableCell>제목</TableCell>
                   <TableCell>카테고리</TableCell>
                   <TableCell>요청자</TableCell>
@@ -274,8 +386,25 @@ const Approvals = () => {
                 </TableRow>
               </TableHead>
               <TableBody>
-                {approvalRequests?.map((request) => (
-                  <TableRow key={request.id} hover>
+                {paddingTop > 0 && (
+                  <TableRow sx={{ height: paddingTop }}>
+                    <TableCell colSpan={9} sx={{ p: 0, border: 0 }} />
+                  </TableRow>
+                )}
+                {approvalRequests?.slice(start, end).map((request) => (
+                  <TableRow
+                    key={request.id}
+                    hover
+                    selected={selectedIds.includes(request.id)}
+                    sx={{ height: ROW_HEIGHT }}
+                  >
+                    <TableCell padding="checkbox">
+                      <Checkbox
+                        checked={selectedIds.includes(request.id)}
+                        onChange={() => handleToggleSelect(request.id)}
+                        disabled={request.state !== 'pending'}
+                      />
+                    </TableCell>
                     <TableCell>
                       <Typography variant="body2" fontWeight="medium">
                         {request.name}
@@ -320,13 +449,13 @@ const Approvals = () => {
                     </TableCell>
                     <TableCell>
                       <Chip
-                        label={getStatusText(request.request_status)}
-                        color={getStatusColor(request.request_status)}
+                        label={getStatusText(request.state)}
+                        color={getStatusColor(request.state)}
                         size="small"
                       />
                     </TableCell>
                     <TableCell>
-                      {request.request_status === 'pending' || request.request_status === 'new' ? (
+                      {request.state === 'pending' ? (
                         <Box sx={{ display: 'flex', gap: 1 }}>
                           <Button
                             size="small"
@@ -353,9 +482,21 @@ const Approvals = () => {
                     </TableCell>
                   </TableRow>
                 ))}
+                {paddingBottom > 0 && (
+                  <TableRow sx={{ height: paddingBottom }}>
+                    <TableCell colSpan={9} sx={{ p: 0, border: 0 }} />
+                  </TableRow>
+                )}
+                {isFetchingNextPage && (
+                  <TableRow>
+                    <TableCell colSpan={9} align="center">
+                      <CircularProgress size={24} />
+                    </TableCell>
+                  </TableRow>
+                )}
                 {(!approvalRequests || approvalRequests.length === 0) && (
                   <TableRow>
-                    <TableCell colSpan={8} align="center">
+                    <TableCell colSpan={9} align="center">
                       <Typography color="text.secondary">
                         결재 요청이 없습니다.
                       </Typography>
@@ -39,52 +39,19 @@ const StatCard = ({ title, value, icon, color }) => (
 );
 
 export default function Dashboard() {
-  const { data: employees, isLoading: employeesLoading, error: employeesError } = useQuery(
-    'employees',
-    () => odooApi.getEmployees(['name', 'department_id']),
+  // 모든 KPI를 서버에서 집계하여 한 번에 조회
+  const { data: summary, isLoading } = useQuery(
+    'dashboardSummary',
+    () => odooApi.getDashboardSummary(),
     { 
       retry: 1,
       onError: (error) => {
-        console.warn('💡 HR 모듈이 설치되지 않았거나 권한이 없습니다:', error.message);
+        console.warn('💡 simple_hr_api 모듈이 설치되지 않았거나 권한이 없습니다:', error.message);
       }
     }
   );
 
-  const { data: departments, isLoading: departmentsLoading, error: departmentsError } = useQuery(
-    'departments',
-    () => odooApi.getDepartments(['name', 'member_ids']),
-    { 
-      retry: 1,
-      onError: (error) => {
-        console.warn('💡 HR Department 모듈이 설치되지 않았거나 권한이 없습니다:', error.message);
-      }
-    }
-  );
-
-  const { data: attendance, isLoading: attendanceLoading, error: attendanceError } = useQuery(
-    'attendance',
-    () => odooApi.getAttendance(null, ['employee_id', 'check_in', 'check_out']),
-    { 
-      retry: 1,
-      onError: (error) => {
-        console.warn('💡 HR Attendance 모듈이 설치되지 않았거나 권한이 없습니다:', error.message);
-      }
-    }
-  );
-
-  // OCA Community Payroll 모듈 설치로 Payroll 기능 활성화
-  const { data: payslips, isLoading: payslipsLoading, error: payslipsError } = useQuery(
-    'payslips',
-    () => odooApi.getPayslips(['employee_id', 'state', 'net_wage']),
-    { 
-      retry: 1,
-      onError: (error) => {
-        console.warn('💡 OCA Community Payroll 모듈을 설치하고 활성화해주세요:', error.message);
-      }
-    }
-  );
-
-  if (employeesLoading || departmentsLoading || attendanceLoading || payslipsLoading) {
+  if (isLoading) {
     return (
       <Box sx={{ display: 'flex', justifyContent: 'center', mt: 4 }}>
         <CircularProgress />
@@ -92,19 +59,18 @@ export default function Dashboard() {
     );
   }
 
-  // 부서별 직원 수 계산
-  const departmentStats = departments?.map(dept => ({
-    name: dept.name,
-    count: dept.member_ids ? dept.member_ids.length : 0,
-  })) || [];
+  // 부서별 직원 수
+  const departmentStats = summary?.employees.by_department
+    .filter(dept => dept.department_id)
+    .map(dept => ({
+      name: dept.name,
+      count: dept.count,
+    })) || [];
 
-  const totalEmployees = employees?.length || 0;
-  const totalDepartments = departments?.length || 0;
-  const todayAttendance = attendance?.filter(att => {
-    const today = new Date().toDateString();
-    return new Date(att.check_in).toDateString() === today;
-  }).length || 0;
-  const totalPayslips = payslips?.length || 0;
+  const totalEmployees = summary?.employees.total || 0;
+  const totalDepartments = summary?.employees.department_count || 0;
+  const todayAttendance = summary?.attendance.today || 0;
+  const totalPayslips = summary?.payroll?.payslip_count || 0;
 
   return (
     <Box>
@@ -101,8 +101,8 @@ const ELearning = () => {
   const { data: courses, isLoading, error } = useQuery(
     'courses',
     () => odooApi.searchRead('elearning.course', [], [
-      'id', 'name', 'description', 'total_slides', 'slide_count',
-      'user_id', 'create_date', 'slide_ids', 'enroll', 'visibility', 'active'
+      'id', 'name', 'description', 'total_slides', 'slide_count', 'completed_count',
+      'completion_rate', 'user_id', 'create_date', 'enroll', 'visibility', 'active'
     ]),
     {
       refetchInterval: 30000,
@@ -287,7 +287,7 @@ const ELearning = () => {
                 </Box>
                 <Box sx={{ display: 'flex', justifyContent: 'space-between', mb: 2 }}>
                   <Typography variant="body2">
-                    등록자: {course.enroll_count || 0}명
+                    등록자: {course.slide_count || 0}명
                   </Typography>
                   <Typography variant="body2" color="text.secondary">
                     {course.create_date ? 
@@ -495,7 +495,7 @@ const ELearning = () => {
             </Grid>
             <Grid item xs={6}>
               <Typography variant="body2">
-                <strong>등록자 수:</strong> {selectedCourse?.enroll_count || 0}명
+                <strong>등록자 수:</strong> {selectedCourse?.slide_count || 0}명
               </Typography>
             </Grid>
             <Grid item xs={6}>
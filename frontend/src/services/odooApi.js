@@ -1,4 +1,7 @@
 import axios from 'axios';
+import { RpcTransport } from './rpcTransport';
+
+const API_DEBUG = process.env.REACT_APP_API_DEBUG === 'true';
 
 class OdooAPI {
   constructor() {
@@ -7,6 +10,7 @@ class OdooAPI {
     this.sessionId = null;
     this.uid = null;
     this.database = 'odoo_hr';
+    this.requestId = 1;
     
     console.log('🌐 Odoo API 초기화 - 프록시 서버 사용:', this.baseURL);
     
@@ -18,11 +22,16 @@ class OdooAPI {
       withCredentials: true,
       timeout: 15000,
     });
+
+    // 같은 tick의 호출을 배치로 묶고, 조회 결과를 캐시하는 전송 계층
+    this.transport = new RpcTransport(this.client, { debug: API_DEBUG });
     
     // 요청 인터셉터: 실제 Odoo 데이터 사용 우선
     this.client.interceptors.request.use(
       (config) => {
-        console.log(`API 요청: ${config.method?.toUpperCase()} ${config.url}`);
+        if (API_DEBUG) {
+          console.log(`API 요청: ${config.method?.toUpperCase()} ${config.url}`);
+        }
         return config;
       },
       (error) => {
@@ -34,7 +43,9 @@ class OdooAPI {
     // 응답 인터셉터: 실제 Odoo 연결만 사용 (모의 데이터 비활성화)
     this.client.interceptors.response.use(
       (response) => {
-        console.log(` API 응답 성공: ${response.config.url}`);
+        if (API_DEBUG) {
+          console.log(` API 응답 성공: ${response.config.url}`);
+        }
         return response;
       },
       (error) => {
@@ -73,7 +84,7 @@ class OdooAPI {
           login: username,
           password: password,
         },
-        id: Math.random(),
+        id: this.requestId++,
       });
 
       if (response.data.result && response.data.result.uid) {
@@ -106,10 +117,11 @@ class OdooAPI {
         jsonrpc: '2.0',
         method: 'call',
         params: {},
-        id: Math.random(),
+        id: this.requestId++,
       });
       this.uid = null;
       this.sessionId = null;
+      this.transport.clear();
     } catch (error) {
       console.error('Logout error:', error);
     }
@@ -130,6 +142,18 @@ class OdooAPI {
     return this.search(model, domain, fields, limit, offset);
   }
 
+  // 키셋 페이지 조회 (simple_hr_api의 search_page)
+  // - _order 기준으로 cursor 다음 레코드부터 limit개를 조회하므로 페이지 위치와 관계없이 응답 시간이 일정
+  // - 반환값: { records, next_cursor } (마지막 페이지면 next_cursor는 null)
+  async searchPage(model, domain = [], fields = [], limit = 80, cursor = null) {
+    return this.callKw(model, 'search_page', [], {
+      domain,
+      fields,
+      limit,
+      cursor,
+    });
+  }
+
   // 데이터 생성
   async create(model, values) {
     return this.callKw(model, 'create', [values]);
@@ -145,38 +169,10 @@ class OdooAPI {
     return this.callKw(model, 'unlink', [ids]);
   }
 
-  // Odoo RPC 호출
+  // Odoo RPC 호출 - 같은 tick의 호출은 한 번의 배치 요청으로 전송되고,
+  // 조회 메서드는 진행 중 요청 공유 및 캐시를 사용 (변경 호출 시 해당 모델 캐시 무효화)
   async callKw(model, method, args = [], kwargs = {}) {
-    console.log(`🚀 API 호출 시도: ${model}.${method}`);
-    
-    try {
-      const response = await this.client.post('/web/dataset/call_kw', {
-        jsonrpc: '2.0',
-        method: 'call',
-        params: {
-          model,
-          method,
-          args,
-          kwargs,
-        },
-        id: Math.random(),
-      });
-
-      if (response.data && response.data.error) {
-        throw new Error(response.data.error.message || 'API 호출 오류');
-      }
-
-      console.log(`✅ ${model}.${method} 실제 데이터 사용`);
-      return response.data.result;
-    } catch (error) {
-      console.error(`❌ ${model}.${method} API 호출 오류:`, error.message);
-      
-      // 실제 API 오류 - 프록시 서버 확인 필요
-      console.error(`❌ ${model}.${method} 실제 API 오류 - 프록시 서버 확인 필요`);
-      
-      // 에러를 다시 던져서 response interceptor가 mock data로 fallback할 수 있도록 함
-      throw error;
-    }
+    return this.transport.call(model, method, args, kwargs);
   }
 
   // HR 모듈 특화 메서드들
@@ -197,6 +193,49 @@ class OdooAPI {
     return this.search('hr.payslip', [], fields);
   }
 
+  // 내가 승인할 수 있는 검토중 결재 요청 (서버에서 can_approve 조건으로 조회)
+  async getMyPendingApprovals(fields = ['name', 'category_id', 'request_owner_id', 'request_date', 'state']) {
+    return this.search('approval.request', [['can_approve', '=', true]], fields);
+  }
+
+  // 상태별 결재 요청 수 (목록을 모두 불러오지 않고 서버에서 집계)
+  async getApprovalStateCounts(domain = []) {
+    const groups = await this.callKw('approval.request', 'read_group', [domain, ['state'], ['state']], { lazy: true });
+    return Object.fromEntries(groups.map((group) => [group.state, group.state_count]));
+  }
+
+  // 결재 요청 일괄 승인/거부 - 한 번의 call_kw로 처리하고 요청별 결과 요약을 반환
+  async approveRequests(ids, comment = null) {
+    return this.callKw('approval.request', 'bulk_approve', [ids], { comment });
+  }
+
+  async refuseRequests(ids, reason = null) {
+    return this.callKw('approval.request', 'bulk_refuse', [ids], { reason });
+  }
+
+  // 대시보드 KPI 전체를 한 번의 JSON-RPC 호출로 조회 (simple_hr_api 애드온)
+  async getDashboardSummary() {
+    return this.callKw('simple.hr.dashboard', 'get_kpis', []);
+  }
+
+  // 급여 집계 (서버의 hr.payslip.summary 테이블에서 회사/월/상태별 합계를 조회)
+  async getPayrollSummary(dateFrom = null, dateTo = null) {
+    return this.callKw('hr.payslip.summary', 'get_dashboard_figures', [], {
+      date_from: dateFrom,
+      date_to: dateTo,
+    });
+  }
+
+  // 대용량 내보내기 URL (simple_hr_api가 서버에서 청크 단위로 스트리밍, 세션 쿠키로 인증)
+  // model: 'hr.payslip' | 'approval.request' | 'elearning.enrollment', format: 'csv' | 'xlsx'
+  getExportUrl(model, domain = [], fields = null, format = 'csv') {
+    const params = new URLSearchParams({ domain: JSON.stringify(domain), format });
+    if (fields) {
+      params.set('fields', fields.join(','));
+    }
+    return `${this.baseURL}/simple_hr_api/export/${model}?${params.toString()}`;
+  }
+
   async createEmployee(employeeData) {
     return this.create('hr.employee', employeeData);
   }
@@ -0,0 +1,201 @@
+// JSON-RPC 전송 계층
+// - 같은 tick에 발생한 call_kw 호출을 하나의 배치 요청으로 묶어 전송
+// - 동일한 조회 요청이 진행 중이면 같은 Promise를 공유 (중복 제거)
+// - 조회 결과를 크기 제한이 있는 LRU 캐시에 보관하고, 같은 모델의 create/write/unlink 등
+//   변경 호출이 발생하면 해당 모델의 캐시를 무효화
+
+export const READ_METHODS = new Set([
+  'search_read',
+  'search_page',
+  'read',
+  'search',
+  'search_count',
+  'read_group',
+  'name_search',
+  'name_get',
+  'fields_get',
+  'get_kpis',
+  'get_dashboard_figures',
+  'get_score_analytics',
+]);
+
+export const BATCH_ROUTE = '/simple_hr_api/call_kw_batch';
+const SINGLE_ROUTE = '/web/dataset/call_kw';
+
+export class LRUCache {
+  constructor(maxSize = 200, ttl = 10000) {
+    this.maxSize = maxSize;
+    this.ttl = ttl;
+    this.entries = new Map();
+  }
+
+  get(key) {
+    const entry = this.entries.get(key);
+    if (!entry) {
+      return undefined;
+    }
+    if (Date.now() - entry.time > this.ttl) {
+      this.entries.delete(key);
+      return undefined;
+    }
+    // 최근 사용 항목을 맨 뒤로 이동
+    this.entries.delete(key);
+    this.entries.set(key, entry);
+    return entry.value;
+  }
+
+  set(key, value, tag) {
+    this.entries.delete(key);
+    this.entries.set(key, { value, tag, time: Date.now() });
+    while (this.entries.size > this.maxSize) {
+      this.entries.delete(this.entries.keys().next().value);
+    }
+  }
+
+  invalidateTag(tag) {
+    for (const [key, entry] of this.entries) {
+      if (entry.tag === tag) {
+        this.entries.delete(key);
+      }
+    }
+  }
+
+  clear() {
+    this.entries.clear();
+  }
+}
+
+export class RpcTransport {
+  constructor(client, { cacheSize = 200, cacheTtl = 10000, debug = false } = {}) {
+    this.client = client;
+    this.cache = new LRUCache(cacheSize, cacheTtl);
+    this.inflight = new Map();
+    // 모델별 변경 횟수: 조회 도중 변경이 일어나면 그 결과는 캐시하지 않음
+    this.generations = new Map();
+    this.queue = [];
+    this.flushTimer = null;
+    this.batchSupported = true;
+    this.nextId = 1;
+    this.debug = debug;
+  }
+
+  call(model, method, args = [], kwargs = {}) {
+    if (!READ_METHODS.has(method)) {
+      this.invalidateModel(model);
+      return this.enqueue({ model, method, args, kwargs });
+    }
+
+    const key = JSON.stringify([model, method, args, kwargs]);
+    const cached = this.cache.get(key);
+    if (cached !== undefined) {
+      return Promise.resolve(cached);
+    }
+    if (this.inflight.has(key)) {
+      return this.inflight.get(key);
+    }
+
+    const generation = this.generations.get(model) || 0;
+    const promise = this.enqueue({ model, method, args, kwargs })
+      .then((result) => {
+        if ((this.generations.get(model) || 0) === generation) {
+          this.cache.set(key, result, model);
+        }
+        return result;
+      })
+      .finally(() => {
+        this.inflight.delete(key);
+      });
+    this.inflight.set(key, promise);
+    return promise;
+  }
+
+  invalidateModel(model) {
+    this.generations.set(model, (this.generations.get(model) || 0) + 1);
+    this.cache.invalidateTag(model);
+  }
+
+  clear() {
+    this.cache.clear();
+    this.generations.clear();
+  }
+
+  enqueue(call) {
+    return new Promise((resolve, reject) => {
+      this.queue.push({ ...call, resolve, reject });
+      if (!this.flushTimer) {
+        this.flushTimer = setTimeout(() => this.flush(), 0);
+      }
+    });
+  }
+
+  async flush() {
+    const calls = this.queue;
+    this.queue = [];
+    this.flushTimer = null;
+    if (calls.length === 0) {
+      return;
+    }
+
+    if (calls.length > 1 && this.batchSupported) {
+      try {
+        await this.sendBatch(calls);
+        return;
+      } catch (error) {
+        // 서버에 simple_hr_api가 없으면 개별 호출로 대체
+        if (error.response?.status !== 404) {
+          calls.forEach((call) => call.reject(error));
+          return;
+        }
+        this.batchSupported = false;
+      }
+    }
+    await Promise.all(calls.map((call) => this.sendSingle(call)));
+  }
+
+  async sendBatch(calls) {
+    if (this.debug) {
+      console.log(`🚀 배치 API 호출: ${calls.map((call) => `${call.model}.${call.method}`).join(', ')}`);
+    }
+    const response = await this.client.post(BATCH_ROUTE, {
+      jsonrpc: '2.0',
+      method: 'call',
+      params: {
+        calls: calls.map(({ model, method, args, kwargs }) => ({ model, method, args, kwargs })),
+      },
+      id: this.nextId++,
+    });
+    if (response.data && response.data.error) {
+      throw new Error(response.data.error.message || 'API 호출 오류');
+    }
+    response.data.result.forEach((outcome, index) => {
+      const call = calls[index];
+      if (outcome.error) {
+        call.reject(new Error(outcome.error.message || 'API 호출 오류'));
+      } else {
+        call.resolve(outcome.result);
+      }
+    });
+  }
+
+  async sendSingle(call) {
+    const { model, method, args, kwargs } = call;
+    if (this.debug) {
+      console.log(`🚀 API 호출: ${model}.${method}`);
+    }
+    try {
+      const response = await this.client.post(SINGLE_ROUTE, {
+        jsonrpc: '2.0',
+        method: 'call',
+        params: { model, method, args, kwargs },
+        id: this.nextId++,
+      });
+      if (response.data && response.data.error) {
+        throw new Error(response.data.error.message || 'API 호출 오류');
+      }
+      call.resolve(response.data.result);
+    } catch (error) {
+      console.error(`❌ ${model}.${method} API 호출 오류:`, error.message);
+      call.reject(error);
+    }
+  }
+}
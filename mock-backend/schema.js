@@ -0,0 +1,1013 @@
+// 모의 백엔드 모델 정의와 시드 기반 데이터 생성
+// - simple_* 애드온이 정의하는 모델과 프론트엔드가 조회하는 표준 HR 모델의 필드, 기본 정렬, 계산 필드
+// - 같은 시드와 옵션이면 항상 같은 데이터가 생성됨 (옵션 이름은 hr_populate 명령과 동일)
+
+const { OdooError } = require('./store');
+
+const SCORE_FIELDS = ['technical_skills', 'communication', 'teamwork', 'leadership', 'problem_solving'];
+const RATING_THRESHOLDS = [[4.5, 'excellent'], [3.5, 'good'], [2.5, 'satisfactory'], [1.5, 'needs_improvement']];
+const RATINGS = [...RATING_THRESHOLDS.map(([, rating]) => rating), 'unsatisfactory'];
+const PERCENTILES = [0.25, 0.5, 0.75, 0.9];
+const SUMMARY_MEASURES = ['basic_wage', 'allowances', 'deductions', 'net_wage'];
+
+const SURNAMES = ['김', '이', '박', '최', '정', '강', '조', '윤', '장', '임', '한', '오', '서', '신', '권', '황', '안', '송', '류', '홍'];
+const GIVEN_NAMES = [
+  '민준', '서연', '도윤', '지우', '하준', '서윤', '시우', '하은', '주원', '지유',
+  '지호', '수아', '예준', '지아', '준우', '서현', '현우', '민서', '도현', '채원',
+  '건우', '다은', '우진', '예은', '선우', '수빈', '연우', '지민', '유준', '예린',
+];
+const DEPARTMENTS = ['개발팀', '인사팀', '마케팅팀', '영업팀', '재무팀', '디자인팀', '기획팀', '고객지원팀', '품질관리팀', '법무팀'];
+const JOB_TITLES = ['사원', '주임', '대리', '과장', '차장', '부장', '시니어 개발자', 'HR 매니저', '마케팅 전문가', 'UI/UX 디자이너', '영업 담당자'];
+const APPROVAL_CATEGORIES = ['출장', '구매', '휴가', '교육', '경비', '장비', '재택근무', '채용', '계약', '기타'];
+const COURSES = ['React 고급 과정', 'Python 기초', '프로젝트 관리', '데이터 분석 입문', '리더십 과정', '정보보안 교육', '커뮤니케이션 스킬', '클라우드 기초'];
+const LEAVE_TYPES = [['연차', 'fixed'], ['병가', 'no'], ['경조사', 'no'], ['공가', 'no']];
+const MONTHS = ['January', 'February', 'March', 'April', 'May', 'June', 'July', 'August', 'September', 'October', 'November', 'December'];
+
+// 필드 정의 헬퍼
+const char = (string, extra = {}) => ({ type: 'char', string, ...extra });
+const text = (string, extra = {}) => ({ type: 'text', string, ...extra });
+const integer = (string, extra = {}) => ({ type: 'integer', string, ...extra });
+const float = (string, extra = {}) => ({ type: 'float', string, ...extra });
+const boolean = (string, extra = {}) => ({ type: 'boolean', string, ...extra });
+const date = (string, extra = {}) => ({ type: 'date', string, ...extra });
+const datetime = (string, extra = {}) => ({ type: 'datetime', string, ...extra });
+const selection = (string, values, extra = {}) => ({ type: 'selection', string, selection: values, ...extra });
+const many2one = (comodel, string, extra = {}) => ({ type: 'many2one', comodel, string, ...extra });
+const many2many = (comodel, string, extra = {}) => ({ type: 'many2many', comodel, string, ...extra });
+const one2many = (comodel, inverse, string) => ({ type: 'one2many', comodel, inverse, string });
+
+function pad(number, size = 2) {
+  return String(number).padStart(size, '0');
+}
+
+function formatDate(day) {
+  return `${day.getUTCFullYear()}-${pad(day.getUTCMonth() + 1)}-${pad(day.getUTCDate())}`;
+}
+
+function formatDatetime(moment) {
+  return `${formatDate(moment)} ${pad(moment.getUTCHours())}:${pad(moment.getUTCMinutes())}:${pad(moment.getUTCSeconds())}`;
+}
+
+function addDays(day, days) {
+  const result = new Date(day);
+  result.setUTCDate(result.getUTCDate() + days);
+  return result;
+}
+
+const nowString = () => formatDatetime(new Date());
+
+function getRating(score) {
+  const match = RATING_THRESHOLDS.find(([threshold]) => score >= threshold);
+  return match ? match[1] : 'unsatisfactory';
+}
+
+// methods: 레코드 메서드 (store, ids, args, kwargs, ctx), args[0]의 id 목록이 ids로 전달됨
+// modelMethods: @api.model 메서드 (store, args, kwargs, ctx)
+
+// 레코드 메서드에서 공통으로 쓰는 상태 변경
+const setState = (model, state, extra = () => ({})) => (store, ids) => store.write(model, ids, { state, ...extra() });
+
+const MODELS = {
+  'res.company': {
+    fields: { name: char('Company Name', { required: true }) },
+    order: 'id',
+  },
+
+  'res.partner': {
+    fields: {
+      name: char('Name'),
+      email: char('Email'),
+      phone: char('Phone'),
+      is_company: boolean('Is a Company'),
+      active: boolean('Active', { default: true }),
+    },
+    order: 'name',
+  },
+
+  'res.users': {
+    fields: {
+      name: char('Name', { required: true }),
+      login: char('Login', { required: true }),
+      email: char('Email'),
+      partner_id: many2one('res.partner', 'Related Partner'),
+      employee_id: many2one('hr.employee', 'Related Employee'),
+      company_id: many2one('res.company', 'Company', { default: 1 }),
+      tz: char('Timezone', { default: 'Asia/Seoul' }),
+      active: boolean('Active', { default: true }),
+    },
+    order: 'name',
+  },
+
+  'hr.department': {
+    fields: {
+      name: char('Department Name', { required: true }),
+      parent_id: many2one('hr.department', 'Parent Department'),
+      manager_id: many2one('hr.employee', 'Manager'),
+      member_ids: one2many('hr.employee', 'department_id', 'Members'),
+      company_id: many2one('res.company', 'Company', { default: 1 }),
+      active: boolean('Active', { default: true }),
+      total_employee: integer('Total Employee', {
+        compute: (row, store) => store.table('hr.employee').idsWhere('department_id', row.id).size,
+      }),
+    },
+    order: 'name',
+  },
+
+  'hr.employee': {
+    fields: {
+      name: char('Employee Name', { required: true }),
+      job_title: char('Job Title'),
+      department_id: many2one('hr.department', 'Department'),
+      parent_id: many2one('hr.employee', 'Manager'),
+      work_email: char('Work Email'),
+      work_phone: char('Work Phone'),
+      mobile_phone: char('Work Mobile'),
+      user_id: many2one('res.users', 'User'),
+      work_contact_id: many2one('res.partner', 'Work Contact'),
+      company_id: many2one('res.company', 'Company', { default: 1 }),
+      active: boolean('Active', { default: true }),
+      create_date: datetime('Created on', { default: nowString }),
+    },
+    order: 'name',
+    methods: {
+      attendance_manual: (store, ids, args, kwargs, ctx) => {
+        const [employeeId] = ids;
+        const open = store.searchIds('hr.attendance', [['employee_id', '=', employeeId], ['check_out', '=', false]], {}, ctx);
+        if (open.length) {
+          store.write('hr.attendance', open, { check_out: nowString() });
+        } else {
+          store.create('hr.attendance', [{ employee_id: employeeId, check_in: nowString() }], ctx);
+        }
+        return { action: { type: 'ir.actions.client', tag: 'hr_attendance_greeting_message' } };
+      },
+    },
+  },
+
+  'hr.attendance': {
+    fields: {
+      employee_id: many2one('hr.employee', 'Employee', { required: true }),
+      check_in: datetime('Check In', { required: true, default: nowString }),
+      check_out: datetime('Check Out'),
+      worked_hours: float('Worked Hours'),
+    },
+    order: 'check_in desc',
+    displayName: (row, store) => store.table('hr.employee').displayName(row.employee_id),
+    recompute: (row) => {
+      row.worked_hours = row.check_in && row.check_out
+        ? Math.round((Date.parse(`${row.check_out}Z`) - Date.parse(`${row.check_in}Z`)) / 36000) / 100
+        : 0;
+    },
+  },
+
+  'hr.leave.type': {
+    fields: {
+      name: char('Time Off Type', { required: true }),
+      requires_allocation: selection('Requires allocation', [['yes', 'Yes'], ['no', 'No Limit']], { default: 'yes' }),
+      // 프론트엔드가 조회하는 이전 버전 필드 이름
+      allocation_type: selection('Allocation Type', [['fixed', 'Fixed'], ['no', 'No Allocation']], { default: 'fixed' }),
+      active: boolean('Active', { default: true }),
+    },
+    order: 'name',
+  },
+
+  'hr.leave': {
+    fields: {
+      name: char('Description'),
+      employee_id: many2one('hr.employee', 'Employee', { required: true }),
+      holiday_status_id: many2one('hr.leave.type', 'Time Off Type', { required: true }),
+      request_date_from: date('Request Start Date'),
+      request_date_to: date('Request End Date'),
+      date_from: datetime('Start Date'),
+      date_to: datetime('End Date'),
+      number_of_days: float('Duration (Days)'),
+      state: selection('Status', [
+        ['draft', 'To Submit'], ['confirm', 'To Approve'], ['refuse', 'Refused'],
+        ['validate1', 'Second Approval'], ['validate', 'Approved'],
+      ], { default: 'confirm' }),
+    },
+    order: 'date_from desc',
+    displayName: (row, store) => `${store.table('hr.employee').displayName(row.employee_id)}: ${row.number_of_days}일`,
+    methods: {
+      action_approve: setState('hr.leave', 'validate'),
+      action_refuse: setState('hr.leave', 'refuse'),
+      action_draft: setState('hr.leave', 'draft'),
+    },
+  },
+
+  'hr.payslip': {
+    fields: {
+      name: char('Payslip Name', { required: true, default: 'New' }),
+      employee_id: many2one('hr.employee', 'Employee', { required: true }),
+      date_from: date('Date From', { required: true }),
+      date_to: date('Date To', { required: true }),
+      state: selection('Status', [['draft', 'Draft'], ['verify', 'Waiting'], ['done', 'Done'], ['cancel', 'Rejected']], { default: 'draft' }),
+      basic_wage: float('Basic Wage', { default: 3000000 }),
+      allowances: float('Allowances', { default: 500000 }),
+      deductions: float('Deductions', { default: 300000 }),
+      net_wage: float('Net Salary'),
+      company_id: many2one('res.company', 'Company', { default: 1 }),
+      run_id: many2one('hr.payslip.run', 'Payroll Run'),
+      create_date: datetime('Created on', { default: nowString }),
+    },
+    order: 'date_from desc, id desc',
+    recompute: (row) => {
+      row.net_wage = row.basic_wage + row.allowances - row.deductions;
+    },
+    beforeCreate: (valsList, store) => {
+      const employees = store.table('hr.employee');
+      return valsList.map((vals) => {
+        if (vals.name && vals.name !== 'New') {
+          return vals;
+        }
+        const day = new Date(`${(vals.date_from || formatDate(new Date())).slice(0, 10)}T00:00:00Z`);
+        const employeeName = employees.displayName(vals.employee_id) || false;
+        return { ...vals, name: `Payslip - ${employeeName} - ${MONTHS[day.getUTCMonth()]} ${day.getUTCFullYear()}` };
+      });
+    },
+    methods: {
+      action_payslip_done: setState('hr.payslip', 'done'),
+      action_payslip_draft: setState('hr.payslip', 'draft'),
+      action_payslip_cancel: setState('hr.payslip', 'cancel'),
+    },
+  },
+
+  'hr.payslip.run': {
+    fields: {
+      name: char('Name', { required: true }),
+      date_from: date('Date From', { required: true }),
+      date_to: date('Date To', { required: true }),
+      employee_domain: char('Employees', { default: '[]' }),
+      chunk_size: integer('Chunk Size', { default: 500 }),
+      state: selection('Status', [['draft', 'Draft'], ['running', 'Running'], ['done', 'Done'], ['failed', 'Failed']], { default: 'draft' }),
+      chunk_ids: one2many('hr.payslip.run.chunk', 'run_id', 'Chunks'),
+      slip_ids: one2many('hr.payslip', 'run_id', 'Payslips'),
+      chunk_count: integer('Chunks', {
+        compute: (row, store) => store.table('hr.payslip.run.chunk').idsWhere('run_id', row.id).size,
+      }),
+      chunk_done_count: integer('Processed Chunks', {
+        compute: (row, store) => {
+          const chunks = store.table('hr.payslip.run.chunk');
+          return [...chunks.idsWhere('run_id', row.id)].filter((id) => chunks.rows.get(id).state === 'done').length;
+        },
+      }),
+      payslip_count: integer('Payslips', {
+        compute: (row, store) => store.table('hr.payslip').idsWhere('run_id', row.id).size,
+      }),
+      company_id: many2one('res.company', 'Company', { default: 1 }),
+    },
+    order: 'date_from desc, id desc',
+  },
+
+  'hr.payslip.run.chunk': {
+    fields: {
+      run_id: many2one('hr.payslip.run', 'Payroll Run', { required: true }),
+      sequence: integer('Sequence'),
+      employee_id_from: integer('First Employee ID', { required: true }),
+      employee_id_to: integer('Last Employee ID', { required: true }),
+      state: selection('Status', [['pending', 'Pending'], ['done', 'Done'], ['failed', 'Failed']], { default: 'pending' }),
+      attempts: integer('Attempts'),
+      payslip_count: integer('Payslips'),
+      error: text('Error'),
+    },
+    order: 'run_id, sequence, id',
+    displayName: (row) => `Chunk ${row.sequence}`,
+  },
+
+  // 회사/월/상태별 급여 합계, hr.payslip이 바뀌면 다시 집계
+  'hr.payslip.summary': {
+    fields: {
+      company_id: many2one('res.company', 'Company'),
+      period: date('Period'),
+      state: selection('Status', [['draft', 'Draft'], ['verify', 'Waiting'], ['done', 'Done'], ['cancel', 'Rejected']]),
+      payslip_count: integer('Payslips'),
+      ...Object.fromEntries(SUMMARY_MEASURES.flatMap((measure) => [
+        [`${measure}_total`, float(`${measure} total`)],
+        [`${measure}_avg`, float(`${measure} average`, {
+          compute: (row) => (row.payslip_count ? row[`${measure}_total`] / row.payslip_count : 0),
+        })],
+      ])),
+    },
+    order: 'period desc, company_id, state',
+    displayName: (row) => `${row.period} ${row.state}`,
+    derive: {
+      from: 'hr.payslip',
+      build: (store) => {
+        const groups = new Map();
+        store.table('hr.payslip').rows.forEach((payslip) => {
+          const period = `${payslip.date_from.slice(0, 7)}-01`;
+          const key = `${payslip.company_id}|${period}|${payslip.state}`;
+          if (!groups.has(key)) {
+            groups.set(key, {
+              company_id: payslip.company_id,
+              period,
+              state: payslip.state,
+              payslip_count: 0,
+              ...Object.fromEntries(SUMMARY_MEASURES.map((measure) => [`${measure}_total`, 0])),
+            });
+          }
+          const group = groups.get(key);
+          group.payslip_count += 1;
+          SUMMARY_MEASURES.forEach((measure) => {
+            group[`${measure}_total`] += payslip[measure];
+          });
+        });
+        return [...groups.values()];
+      },
+    },
+    modelMethods: {
+      get_dashboard_figures: (store, args, kwargs, ctx) => {
+        const [companyIds, dateFrom, dateTo] = args;
+        const domain = [['company_id', 'in', kwargs.company_ids || companyIds || [1]]];
+        if (kwargs.date_from || dateFrom) {
+          domain.push(['period', '>=', kwargs.date_from || dateFrom]);
+        }
+        if (kwargs.date_to || dateTo) {
+          domain.push(['period', '<=', kwargs.date_to || dateTo]);
+        }
+        const table = store.table('hr.payslip.summary');
+        const totals = { all: {} };
+        const addTo = (key, row) => {
+          const bucket = totals[key] || (totals[key] = {});
+          bucket.payslip_count = (bucket.payslip_count || 0) + row.payslip_count;
+          SUMMARY_MEASURES.forEach((measure) => {
+            bucket[`${measure}_total`] = (bucket[`${measure}_total`] || 0) + row[`${measure}_total`];
+          });
+        };
+        store.searchIds('hr.payslip.summary', domain, {}, ctx).forEach((id) => {
+          const row = table.rows.get(id);
+          ['all', row.state, row.period].forEach((key) => addTo(key, row));
+        });
+        const figures = (bucket) => {
+          const count = bucket.payslip_count || 0;
+          const result = { payslip_count: count };
+          SUMMARY_MEASURES.forEach((measure) => {
+            const total = bucket[`${measure}_total`] || 0;
+            result[`${measure}_total`] = total;
+            result[`${measure}_avg`] = count ? total / count : 0;
+          });
+          return result;
+        };
+        const states = new Set(table.fields.state.selection.map(([state]) => state));
+        const result = figures(totals.all);
+        delete totals.all;
+        result.by_state = Object.fromEntries(Object.entries(totals)
+          .filter(([key]) => states.has(key)).map(([key, bucket]) => [key, figures(bucket)]));
+        result.by_period = Object.keys(totals).filter((key) => !states.has(key)).sort()
+          .map((key) => ({ ...figures(totals[key]), period: key }));
+        return result;
+      },
+    },
+  },
+
+  'approval.category': {
+    fields: {
+      name: char('Category Name', { required: true }),
+      sequence: integer('Sequence', { default: 10 }),
+      active: boolean('Active', { default: true }),
+      description: text('Description'),
+      color: integer('Color'),
+      approval_type: selection('Approval Type', [
+        ['manager', 'Manager Approval'], ['hr', 'HR Approval'], ['finance', 'Finance Approval'], ['custom', 'Custom Approval'],
+      ], { default: 'manager' }),
+      approver_ids: many2many('res.users', 'Approvers'),
+      manager_approval: boolean('Manager Approval Required', { default: true }),
+      has_amount: boolean('Has Amount Field'),
+      has_date: boolean('Has Date Field', { default: true }),
+      has_period: boolean('Has Period Field'),
+      request_ids: one2many('approval.request', 'category_id', 'Requests'),
+      request_count: integer('Request Count', {
+        compute: (row, store) => store.table('approval.request').idsWhere('category_id', row.id).size,
+      }),
+      request_sequence: integer('Last Request Number'),
+    },
+    order: 'sequence, name',
+  },
+
+  'approval.request': {
+    fields: {
+      name: char('Request Subject', { required: true }),
+      category_id: many2one('approval.category', 'Category', { required: true }),
+      request_owner_id: many2one('res.users', 'Request Owner', { required: true, default: (ctx) => ctx.uid }),
+      employee_id: many2one('hr.employee', 'Employee'),
+      reason: text('Description/Reason', { required: true }),
+      date_start: date('Start Date'),
+      date_end: date('End Date'),
+      amount: float('Amount'),
+      state: selection('Status', [
+        ['new', 'To Submit'], ['pending', 'Submitted'], ['approved', 'Approved'], ['refused', 'Refused'], ['cancel', 'Cancelled'],
+      ], { default: 'new' }),
+      approver_ids: many2many('res.users', 'Approvers', {
+        compute: (row, store) => store.table('approval.category').rows.get(row.category_id).approver_ids,
+      }),
+      approved_by: many2one('res.users', 'Approved By'),
+      refused_by: many2one('res.users', 'Refused By'),
+      request_date: datetime('Request Date', { default: nowString }),
+      approval_date: datetime('Approval Date'),
+      approval_comment: text('Approval Comment'),
+      refusal_reason: text('Refusal Reason'),
+      priority: selection('Priority', [['0', 'Low'], ['1', 'Normal'], ['2', 'High'], ['3', 'Very High']], { default: '1' }),
+      duration_days: integer('Duration (Days)', {
+        compute: (row) => (row.date_start && row.date_end
+          ? Math.round((Date.parse(row.date_end) - Date.parse(row.date_start)) / 86400000) + 1 : 0),
+      }),
+      can_approve: boolean('Can Approve', {
+        compute: (row, store, ctx) => row.state === 'pending'
+          && store.table('approval.category').rows.get(row.category_id).approver_ids.includes(ctx.uid),
+      }),
+      create_date: datetime('Created on', { default: nowString }),
+    },
+    order: 'create_date desc, id desc',
+    search: {
+      can_approve: (operator, value, ctx) => {
+        const domain = [['state', '=', 'pending'], ['category_id.approver_ids', 'in', [ctx.uid]]];
+        return (operator === '=') === Boolean(value) ? domain : ['!', '&', ...domain];
+      },
+    },
+    recompute: (row, store) => {
+      // employee_id는 request_owner_id.employee_id 관련 필드
+      const owner = store.tables.get('res.users').rows.get(row.request_owner_id);
+      row.employee_id = owner ? owner.employee_id : false;
+    },
+    beforeCreate: (valsList, store) => {
+      const categories = store.table('approval.category');
+      return valsList.map((vals) => {
+        if (vals.name || !vals.category_id) {
+          return vals;
+        }
+        const category = categories.rows.get(vals.category_id);
+        category.request_sequence += 1;
+        return { ...vals, name: `${category.name} #${pad(category.request_sequence, 3)}` };
+      });
+    },
+    methods: {
+      bulk_approve: (store, ids, args, kwargs, ctx) => bulkReview(store, ids, 'approved', kwargs.comment || args[0], ctx),
+      bulk_refuse: (store, ids, args, kwargs, ctx) => bulkReview(store, ids, 'refused', kwargs.reason || args[0], ctx),
+      action_submit: setState('approval.request', 'pending', () => ({ request_date: nowString() })),
+      action_approve: (store, ids, args, kwargs, ctx) => strictReview(store, ids, 'approved', ctx),
+      action_refuse: (store, ids, args, kwargs, ctx) => strictReview(store, ids, 'refused', ctx),
+      action_cancel: setState('approval.request', 'cancel'),
+      action_draft: setState('approval.request', 'new', () => ({
+        approved_by: false, refused_by: false, approval_date: false, approval_comment: '', refusal_reason: '',
+      })),
+    },
+  },
+
+  'hr.appraisal': {
+    fields: {
+      name: char('Appraisal Name', { required: true, default: 'New' }),
+      employee_id: many2one('hr.employee', 'Employee', { required: true }),
+      manager_id: many2one('hr.employee', 'Manager', {
+        compute: (row, store) => {
+          const employee = store.table('hr.employee').rows.get(row.employee_id);
+          return employee ? employee.parent_id : false;
+        },
+      }),
+      date_start: date('Start Date', { required: true }),
+      date_close: date('End Date', { required: true }),
+      state: selection('Status', [['new', 'New'], ['pending', 'Pending'], ['done', 'Done'], ['cancel', 'Cancelled']], { default: 'new' }),
+      ...Object.fromEntries(SCORE_FIELDS.map((name) => [name, float(name)])),
+      final_score: float('Final Score'),
+      overall_rating: selection('Overall Rating', RATINGS.map((rating) => [rating, rating])),
+      manager_feedback: text('Manager Feedback'),
+      employee_feedback: text('Employee Self-Assessment'),
+      goals_achieved: text('Goals Achieved'),
+      goals_next_period: text('Goals for Next Period'),
+      meeting_date: datetime('Meeting Date'),
+      next_appraisal_date: date('Next Appraisal Date'),
+    },
+    order: 'date_close desc',
+    recompute: (row) => {
+      const scores = SCORE_FIELDS.map((name) => row[name]).filter((score) => score > 0);
+      row.final_score = scores.length ? scores.reduce((total, score) => total + score, 0) / scores.length : 0;
+      row.overall_rating = getRating(row.final_score);
+    },
+    methods: {
+      action_start_appraisal: setState('hr.appraisal', 'pending'),
+      action_complete_appraisal: setState('hr.appraisal', 'done'),
+      action_cancel_appraisal: setState('hr.appraisal', 'cancel'),
+      action_reset_to_draft: setState('hr.appraisal', 'new'),
+    },
+    modelMethods: {
+      get_score_analytics: (store, args, kwargs, ctx) => {
+        const [dateFrom, dateTo, departmentIds, states] = args;
+        return scoreAnalytics(store, { date_from: dateFrom, date_to: dateTo, department_ids: departmentIds, states, ...kwargs }, ctx);
+      },
+    },
+  },
+
+  'elearning.course': {
+    fields: {
+      name: char('Course Name', { required: true }),
+      description: text('Description'),
+      user_id: many2one('res.users', 'Responsible', { default: (ctx) => ctx.uid }),
+      active: boolean('Active', { default: true }),
+      slide_ids: one2many('elearning.enrollment', 'course_id', 'Enrollments'),
+      total_slides: integer('Total Slides', { default: 10 }),
+      // 애드온에서는 등록 변경 시 갱신되는 카운터, 여기서는 등록 인덱스로 계산
+      slide_count: integer('Slide Count', { compute: (row, store) => courseCounters(store, row.id).enrolled }),
+      completed_count: integer('Completed Enrollments', { compute: (row, store) => courseCounters(store, row.id).completed }),
+      completion_rate: float('Completion Rate', {
+        compute: (row, store) => {
+          const { enrolled, completed } = courseCounters(store, row.id);
+          return enrolled ? (completed / enrolled) * 100 : 0;
+        },
+      }),
+      enroll: selection('Enroll Policy', [['public', 'Public'], ['invite', 'On Invitation'], ['payment', 'On Payment']], { default: 'public' }),
+      visibility: selection('Visibility', [['public', 'Public'], ['members', 'Members Only'], ['connected', 'Signed In']], { default: 'public' }),
+      create_date: datetime('Created on', { default: nowString }),
+    },
+    order: 'create_date desc',
+    dependsOn: ['elearning.enrollment'],
+  },
+
+  'elearning.enrollment': {
+    fields: {
+      course_id: many2one('elearning.course', 'Course', { required: true }),
+      partner_id: many2one('res.partner', 'Student', { required: true }),
+      employee_id: many2one('hr.employee', 'Employee'),
+      completed: boolean('Completed'),
+      completion: float('Completion %'),
+      completion_date: datetime('Completion Date'),
+      slide_views: integer('Slides Viewed'),
+      quiz_attempts: integer('Quiz Attempts'),
+      quiz_karma: integer('Quiz Score'),
+      state: selection('Status', [
+        ['enrolled', 'Enrolled'], ['in_progress', 'In Progress'], ['completed', 'Completed'], ['cancelled', 'Cancelled'],
+      ], { default: 'enrolled' }),
+      enrollment_date: datetime('Enrollment Date', { default: nowString }),
+      last_activity_date: datetime('Last Activity'),
+      create_date: datetime('Created on', { default: nowString }),
+    },
+    order: 'create_date desc, id desc',
+    displayName: (row, store) => `${store.table('elearning.course').displayName(row.course_id)} - ${store.table('res.partner').displayName(row.partner_id)}`,
+    recompute: (row) => {
+      row.completed = row.completion >= 100;
+    },
+    methods: {
+      action_mark_completed: setState('elearning.enrollment', 'completed', () => ({
+        completion: 100, completion_date: nowString(),
+      })),
+      action_start_course: setState('elearning.enrollment', 'in_progress', () => ({ last_activity_date: nowString() })),
+      action_cancel_enrollment: setState('elearning.enrollment', 'cancelled'),
+    },
+  },
+
+  // 추상 모델: 레코드 없이 메서드만 제공
+  'simple.hr.dashboard': {
+    fields: {},
+    modelMethods: {
+      get_kpis: (store, args, kwargs, ctx) => dashboardKpis(store, ctx),
+    },
+  },
+};
+
+function courseCounters(store, courseId) {
+  const enrollments = store.table('elearning.enrollment');
+  const course = store.table('elearning.course');
+  return course.cached(`counters:${courseId}`, () => {
+    let completed = 0;
+    const ids = enrollments.idsWhere('course_id', courseId);
+    ids.forEach((id) => {
+      if (enrollments.rows.get(id).completion >= 100) {
+        completed += 1;
+      }
+    });
+    return { enrolled: ids.size, completed };
+  });
+}
+
+function splitByApprovalRight(store, ids, ctx) {
+  const allowed = new Set(store.searchIds('approval.request', [['id', 'in', ids], ['can_approve', '=', true]], {}, ctx));
+  return [ids.filter((id) => allowed.has(id)), ids.filter((id) => !allowed.has(id))];
+}
+
+function review(store, ids, state, comment, ctx) {
+  if (!ids.length) {
+    return;
+  }
+  const vals = { state, approval_date: nowString() };
+  if (state === 'approved') {
+    vals.approved_by = ctx.uid;
+    if (comment) {
+      vals.approval_comment = comment;
+    }
+  } else {
+    vals.refused_by = ctx.uid;
+    if (comment) {
+      vals.refusal_reason = comment;
+    }
+  }
+  store.write('approval.request', ids, vals);
+}
+
+function strictReview(store, ids, state, ctx) {
+  const [allowed, denied] = splitByApprovalRight(store, ids, ctx);
+  if (denied.length) {
+    throw new OdooError(`You don't have permission to ${state === 'approved' ? 'approve' : 'refuse'} this request.`);
+  }
+  review(store, allowed, state, null, ctx);
+  return true;
+}
+
+function bulkReview(store, ids, state, comment, ctx) {
+  const [allowed, denied] = splitByApprovalRight(store, ids, ctx);
+  review(store, allowed, state, comment, ctx);
+  const requests = store.table('approval.request');
+  return {
+    processed_ids: allowed,
+    denied_ids: denied,
+    results: [
+      ...allowed.map((id) => ({ id, result: state })),
+      ...denied.map((id) => ({
+        id, result: requests.rows.has(id) && requests.rows.get(id).state === 'pending' ? 'denied' : 'invalid_state',
+      })),
+    ],
+  };
+}
+
+function percentile(sorted, ratio) {
+  // PostgreSQL percentile_cont와 같은 선형 보간
+  if (!sorted.length) {
+    return null;
+  }
+  const position = ratio * (sorted.length - 1);
+  const lower = Math.floor(position);
+  const upper = Math.ceil(position);
+  return sorted[lower] + (sorted[upper] - sorted[lower]) * (position - lower);
+}
+
+function scoreAnalytics(store, { date_from: dateFrom, date_to: dateTo, department_ids: departmentIds, states = ['done'] }, ctx) {
+  // states=undefined(미지정)이면 기본값, null/[]이면 상태 조건 없음
+  const domain = [];
+  if (dateFrom) {
+    domain.push(['date_close', '>=', dateFrom]);
+  }
+  if (dateTo) {
+    domain.push(['date_close', '<=', dateTo]);
+  }
+  if (departmentIds && departmentIds.length) {
+    domain.push(['employee_id.department_id', 'in', departmentIds]);
+  }
+  if (states && states.length) {
+    domain.push(['state', 'in', states]);
+  }
+  const appraisals = store.table('hr.appraisal');
+  const employees = store.table('hr.employee');
+  const rows = store.searchIds('hr.appraisal', domain, { order: 'id' }, ctx).map((id) => appraisals.rows.get(id));
+
+  const grouped = (keyOf) => {
+    const groups = new Map();
+    rows.forEach((row) => {
+      const key = keyOf(row);
+      if (!groups.has(key)) {
+        groups.set(key, []);
+      }
+      groups.get(key).push(row);
+    });
+    return [...groups.entries()].sort(([a], [b]) => (a === false) - (b === false) || a - b).map(([key, members]) => {
+      const scores = members.map((row) => row.final_score).sort((a, b) => a - b);
+      const average = (values) => (values.length ? values.reduce((total, value) => total + value, 0) / values.length : 0);
+      return [key, {
+        count: members.length,
+        final_score_avg: average(scores),
+        final_score_percentiles: Object.fromEntries(PERCENTILES.map((ratio) => [String(ratio), percentile(scores, ratio)])),
+        skill_avg: Object.fromEntries(SCORE_FIELDS.map((name) => [name, average(members.map((row) => row[name]).filter(Boolean))])),
+        rating_histogram: Object.fromEntries(RATINGS.map((rating) => [rating, members.filter((row) => row.overall_rating === rating).length])),
+      }];
+    });
+  };
+
+  const departments = store.table('hr.department');
+  return {
+    departments: grouped((row) => {
+      const employee = employees.rows.get(row.employee_id);
+      return employee ? employee.department_id : false;
+    }).map(([key, figures]) => ({ ...figures, department_id: key, department_name: key ? departments.displayName(key) : false })),
+    years: grouped((row) => Number(row.date_close.slice(0, 4)))
+      .map(([key, figures]) => ({ ...figures, year: key })),
+  };
+}
+
+// simple.hr.dashboard.get_kpis와 같은 구조, 모든 수치를 인덱스 크기로 계산
+function dashboardKpis(store, ctx) {
+  const employees = store.table('hr.employee');
+  const departments = store.table('hr.department');
+  const byDepartment = employees.countBy('department_id');
+  const requests = store.table('approval.request');
+  const appraisals = store.table('hr.appraisal');
+  const courses = store.table('elearning.course');
+  const byState = requests.countBy('state');
+  const appraisalStates = appraisals.countBy('state');
+
+  let enrolled = 0;
+  let completed = 0;
+  courses.rows.forEach((course) => {
+    const counters = courseCounters(store, course.id);
+    enrolled += counters.enrolled;
+    completed += counters.completed;
+  });
+
+  return {
+    employees: {
+      total: employees.size,
+      department_count: departments.size,
+      by_department: Object.entries(byDepartment).map(([key, count]) => {
+        const departmentId = key === 'false' ? false : Number(key);
+        return {
+          department_id: departmentId,
+          name: departmentId ? departments.displayName(departmentId) : false,
+          count,
+        };
+      }),
+    },
+    attendance: { today: store.searchCount('hr.attendance', [['check_in', '>=', `${ctx.today} 00:00:00`]], ctx) },
+    payroll: MODELS['hr.payslip.summary'].modelMethods.get_dashboard_figures(store, [], {}, ctx),
+    approvals: {
+      total: requests.size,
+      by_state: byState,
+      to_approve: store.searchCount('approval.request', [['can_approve', '=', true]], ctx),
+    },
+    appraisals: {
+      total: appraisals.size,
+      by_state: appraisalStates,
+      by_rating: appraisals.countBy('overall_rating', appraisals.idsWhere('state', 'done')),
+    },
+    elearning: {
+      course_count: courses.size,
+      enrollment_count: enrolled,
+      completed_count: completed,
+      completion_rate: enrolled ? (completed / enrolled) * 100 : 0,
+    },
+    generated_at: nowString(),
+  };
+}
+
+// 시드 데이터 생성 --------------------------------------------------------------
+
+// mulberry32: 시드가 같으면 같은 난수열
+function createRandom(seed) {
+  let state = seed >>> 0;
+  const next = () => {
+    state = (state + 0x6D2B79F5) >>> 0;
+    let value = state;
+    value = Math.imul(value ^ (value >>> 15), value | 1);
+    value ^= value + Math.imul(value ^ (value >>> 7), value | 61);
+    return ((value ^ (value >>> 14)) >>> 0) / 4294967296;
+  };
+  return {
+    next,
+    int: (min, max) => min + Math.floor(next() * (max - min + 1)),
+    pick: (values) => values[Math.floor(next() * values.length)],
+    weighted: (entries) => {
+      const total = entries.reduce((sum, [, weight]) => sum + weight, 0);
+      let roll = next() * total;
+      for (const [value, weight] of entries) {
+        roll -= weight;
+        if (roll < 0) {
+          return value;
+        }
+      }
+      return entries[entries.length - 1][0];
+    },
+  };
+}
+
+function populate(store, options) {
+  const random = createRandom(options.seed);
+  const today = new Date(`${options.today}T00:00:00Z`);
+  const ctx = { uid: 1, today: options.today };
+  const insert = (model, vals) => store.tables.get(model).insert(vals, ctx);
+  const pastMoment = (maxDays) => formatDatetime(new Date(today.getTime() - random.next() * maxDays * 86400000));
+  const employeeCount = options.employees;
+
+  insert('res.company', { name: 'My Company' });
+  insert('res.partner', { name: 'Administrator', email: 'admin@company.com' });
+  insert('res.users', { name: 'Administrator', login: 'admin', email: 'admin@company.com', partner_id: 1 });
+
+  // 부서, 직원: 부서마다 첫 직원이 관리자
+  const departmentCount = Math.max(1, options.departments);
+  for (let index = 0; index < departmentCount; index += 1) {
+    const base = DEPARTMENTS[index % DEPARTMENTS.length];
+    insert('hr.department', { name: index < DEPARTMENTS.length ? base : `${base} ${Math.floor(index / DEPARTMENTS.length) + 1}` });
+  }
+  // 사용자 계정은 직원 1000명까지만 생성 (결재 요청자, 승인자로 사용)
+  const userCount = Math.min(employeeCount, 1000);
+  const managers = new Map();
+  for (let id = 1; id <= employeeCount; id += 1) {
+    const departmentId = ((id - 1) % departmentCount) + 1;
+    const name = `${random.pick(SURNAMES)}${random.pick(GIVEN_NAMES)}`;
+    const partner = insert('res.partner', { name, email: `employee${id}@company.com` });
+    let userId = false;
+    if (id <= userCount) {
+      userId = insert('res.users', {
+        name, login: `employee${id}`, email: `employee${id}@company.com`, partner_id: partner.id, employee_id: id,
+      }).id;
+    }
+    insert('hr.employee', {
+      id,
+      name,
+      job_title: random.pick(JOB_TITLES),
+      department_id: departmentId,
+      parent_id: managers.get(departmentId) || false,
+      work_email: `employee${id}@company.com`,
+      work_phone: `010-${pad(random.int(1000, 9999), 4)}-${pad(random.int(0, 9999), 4)}`,
+      user_id: userId,
+      work_contact_id: partner.id,
+      create_date: pastMoment(1000),
+    });
+    if (!managers.has(departmentId)) {
+      managers.set(departmentId, id);
+      store.tables.get('hr.department').rows.get(departmentId).manager_id = id;
+    }
+  }
+  const departments = store.tables.get('hr.department');
+  departments.rows.forEach((row) => {
+    departments.removeFromIndexes(row);
+    departments.addToIndexes(row);
+  });
+  const users = store.tables.get('res.users');
+  users.rows.get(1).employee_id = employeeCount ? 1 : false;
+  users.removeFromIndexes(users.rows.get(1));
+  users.addToIndexes(users.rows.get(1));
+
+  // 근태: 최근 평일마다 직원별 한 건, 오늘 기록은 일부만 퇴근 전
+  let day = today;
+  for (let counted = 0; counted < options.attendanceDays; day = addDays(day, -1)) {
+    if ([0, 6].includes(day.getUTCDay())) {
+      continue;
+    }
+    counted += 1;
+    const isToday = day.getTime() === today.getTime();
+    for (let employeeId = 1; employeeId <= employeeCount; employeeId += 1) {
+      if (random.next() < 0.05) {
+        continue;
+      }
+      // 09:00~10:00 KST (UTC 00:00~01:00) 출근
+      const checkIn = new Date(day.getTime() + random.int(0, 60) * 60000);
+      const checkOut = new Date(checkIn.getTime() + random.int(8 * 60, 10 * 60) * 60000);
+      insert('hr.attendance', {
+        employee_id: employeeId,
+        check_in: formatDatetime(checkIn),
+        check_out: isToday && random.next() < 0.7 ? false : formatDatetime(checkOut),
+      });
+    }
+  }
+
+  // 휴가
+  LEAVE_TYPES.forEach(([name, allocationType]) => insert('hr.leave.type', {
+    name, allocation_type: allocationType, requires_allocation: allocationType === 'fixed' ? 'yes' : 'no',
+  }));
+  for (let index = 0; index < options.leaves; index += 1) {
+    const start = addDays(today, random.int(-120, 60));
+    const days = random.int(1, 5);
+    const employeeId = random.int(1, employeeCount);
+    insert('hr.leave', {
+      name: random.pick(['개인 사유', '가족 행사', '병원 진료', '여행', '']),
+      employee_id: employeeId,
+      holiday_status_id: random.int(1, LEAVE_TYPES.length),
+      request_date_from: formatDate(start),
+      request_date_to: formatDate(addDays(start, days - 1)),
+      date_from: `${formatDate(start)} 00:00:00`,
+      date_to: `${formatDate(addDays(start, days - 1))} 09:00:00`,
+      number_of_days: days,
+      state: random.weighted([['confirm', 3], ['validate', 5], ['refuse', 1], ['draft', 1]]),
+    });
+  }
+
+  // 급여: 월별 실행과 청크, 직원별 명세서 (최근 달은 draft/verify)
+  const wages = Array.from({ length: employeeCount + 1 }, () => random.int(300, 700) * 10000);
+  for (let month = options.payslipMonths; month >= 1; month -= 1) {
+    const start = new Date(Date.UTC(today.getUTCFullYear(), today.getUTCMonth() - month, 1));
+    const end = new Date(Date.UTC(start.getUTCFullYear(), start.getUTCMonth() + 1, 0));
+    const monthName = `${MONTHS[start.getUTCMonth()]} ${start.getUTCFullYear()}`;
+    const run = insert('hr.payslip.run', {
+      name: `Payroll ${monthName}`, date_from: formatDate(start), date_to: formatDate(end), state: 'done',
+    });
+    for (let from = 1, sequence = 0; from <= employeeCount; from += 500, sequence += 1) {
+      const to = Math.min(employeeCount, from + 499);
+      insert('hr.payslip.run.chunk', {
+        run_id: run.id, sequence, employee_id_from: from, employee_id_to: to, state: 'done', attempts: 1, payslip_count: to - from + 1,
+      });
+    }
+    const employeesTable = store.tables.get('hr.employee');
+    for (let employeeId = 1; employeeId <= employeeCount; employeeId += 1) {
+      insert('hr.payslip', {
+        name: `Payslip - ${employeesTable.rows.get(employeeId).name} - ${monthName}`,
+        employee_id: employeeId,
+        date_from: formatDate(start),
+        date_to: formatDate(end),
+        state: month === 1 ? random.weighted([['draft', 2], ['verify', 1]]) : 'done',
+        basic_wage: wages[employeeId],
+        allowances: random.int(20, 80) * 10000,
+        deductions: random.int(20, 60) * 10000,
+        run_id: run.id,
+        create_date: formatDatetime(addDays(end, 1)),
+      });
+    }
+  }
+
+  // 결재
+  const categoryCount = Math.max(1, options.approvalCategories);
+  for (let index = 0; index < categoryCount; index += 1) {
+    const base = APPROVAL_CATEGORIES[index % APPROVAL_CATEGORIES.length];
+    const approvers = [1, ...Array.from({ length: 2 }, () => random.int(1, userCount + 1))];
+    insert('approval.category', {
+      name: index < APPROVAL_CATEGORIES.length ? base : `${base} ${Math.floor(index / APPROVAL_CATEGORIES.length) + 1}`,
+      sequence: (index + 1) * 10,
+      description: `${base} 관련 결재`,
+      approval_type: random.pick(['manager', 'hr', 'finance', 'custom']),
+      approver_ids: [...new Set(approvers)],
+      has_amount: ['구매', '경비', '장비'].includes(base),
+      has_period: ['출장', '휴가', '재택근무', '교육'].includes(base),
+    });
+  }
+  const categories = store.tables.get('approval.category');
+  const requestMoments = Array.from({ length: options.approvalRequests }, () => pastMoment(365)).sort();
+  requestMoments.forEach((createDate) => {
+    const category = categories.rows.get(random.int(1, categoryCount));
+    category.request_sequence += 1;
+    const state = random.weighted([['new', 1], ['pending', 3], ['approved', 4], ['refused', 1], ['cancel', 1]]);
+    const start = createDate.slice(0, 10);
+    const reviewed = ['approved', 'refused'].includes(state);
+    insert('approval.request', {
+      name: `${category.name} #${pad(category.request_sequence, 3)}`,
+      category_id: category.id,
+      request_owner_id: random.int(1, userCount + 1),
+      reason: `${category.name} 요청 사유`,
+      date_start: category.has_period ? start : false,
+      date_end: category.has_period ? formatDate(addDays(new Date(`${start}T00:00:00Z`), random.int(0, 4))) : false,
+      amount: category.has_amount ? random.int(1, 500) * 10000 : 0,
+      state,
+      approved_by: state === 'approved' ? random.pick(category.approver_ids) : false,
+      refused_by: state === 'refused' ? random.pick(category.approver_ids) : false,
+      request_date: createDate,
+      approval_date: reviewed ? createDate : false,
+      priority: random.weighted([['0', 1], ['1', 6], ['2', 2], ['3', 1]]),
+      create_date: createDate,
+    });
+  });
+
+  // 평가: 연도별 주기, 지난 주기는 완료
+  const appraisalCount = options.appraisals === undefined ? employeeCount : options.appraisals;
+  for (let index = 0; index < appraisalCount; index += 1) {
+    const employeeId = (index % employeeCount) + 1;
+    const year = today.getUTCFullYear() - Math.floor(index / employeeCount);
+    const current = year === today.getUTCFullYear();
+    const state = current ? random.weighted([['new', 2], ['pending', 2], ['done', 1]]) : random.weighted([['done', 9], ['cancel', 1]]);
+    const scores = Object.fromEntries(SCORE_FIELDS.map((name) => [
+      name, state === 'new' ? 0 : Math.round((1 + random.next() * 4) * 10) / 10,
+    ]));
+    insert('hr.appraisal', {
+      name: `${year} Annual Appraisal - ${store.tables.get('hr.employee').rows.get(employeeId).name}`,
+      employee_id: employeeId,
+      date_start: `${year}-01-01`,
+      date_close: `${year}-12-31`,
+      state,
+      ...scores,
+      next_appraisal_date: `${year + 1}-12-31`,
+    });
+  }
+
+  // 교육
+  for (let index = 0; index < options.courses; index += 1) {
+    const base = COURSES[index % COURSES.length];
+    insert('elearning.course', {
+      name: index < COURSES.length ? base : `${base} ${Math.floor(index / COURSES.length) + 1}`,
+      description: `${base} 과정`,
+      user_id: 1,
+      total_slides: random.int(5, 40),
+      enroll: random.weighted([['public', 6], ['invite', 3], ['payment', 1]]),
+      visibility: random.weighted([['public', 6], ['members', 3], ['connected', 1]]),
+      create_date: pastMoment(730),
+    });
+  }
+  const courses = store.tables.get('elearning.course');
+  const employeesTable = store.tables.get('hr.employee');
+  const enrollmentMoments = options.courses ? Array.from({ length: options.enrollments }, () => pastMoment(365)).sort() : [];
+  enrollmentMoments.forEach((createDate) => {
+    const course = courses.rows.get(random.int(1, options.courses));
+    const employeeId = random.int(1, employeeCount);
+    const slideViews = random.int(0, course.total_slides);
+    const completion = Math.round((slideViews / course.total_slides) * 1000) / 10;
+    const cancelled = random.next() < 0.05;
+    insert('elearning.enrollment', {
+      course_id: course.id,
+      partner_id: employeesTable.rows.get(employeeId).work_contact_id,
+      employee_id: employeeId,
+      completion,
+      completion_date: completion >= 100 ? createDate : false,
+      slide_views: slideViews,
+      quiz_attempts: random.int(0, 3),
+      quiz_karma: random.int(0, 100),
+      state: cancelled ? 'cancelled' : completion >= 100 ? 'completed' : slideViews ? 'in_progress' : 'enrolled',
+      enrollment_date: createDate,
+      last_activity_date: slideViews ? createDate : false,
+      create_date: createDate,
+    });
+  });
+
+  // 생성 후 정렬/범위 인덱스와 집계 테이블을 처음부터 다시 만들도록 표시
+  store.tables.forEach((table) => table.touch());
+}
+
+module.exports = { MODELS, populate, createRandom };
@@ -1,7 +1,69 @@
+// 모의 Odoo 백엔드
+// simple_* 애드온 모델의 대용량 시드 데이터를 메모리에 생성하고 JSON-RPC(call_kw)로 제공
+// 실제 Odoo 없이 프론트엔드 렌더링과 API 배치 성능을 측정하기 위한 서버
+//
+// 사용법:
+//   node server.js [--employees=200] [--approval-requests=2000] [--latency=0] ...
+//   node --max-old-space-size=4096 server.js --employees=100000 --approval-requests=100000 --enrollments=100000
+//
+// 데이터 옵션 (hr_populate 명령과 같은 이름):
+//   --employees --departments --payslip-months --approval-categories --approval-requests
+//   --appraisals --courses --enrollments --attendance-days --leaves --seed --today=YYYY-MM-DD
+// 서버 옵션:
+//   --port=8069
+//   --latency=0            HTTP 요청마다 추가할 지연(ms), 배치 요청도 한 번만 적용
+//   --jitter=0             지연에 더할 무작위 편차 최대값(ms)
+//   --latency-per-row=0    반환한 레코드 1000건당 추가 지연(ms), 큰 응답의 직렬화/전송 비용 흉내
+//   --log                  호출마다 모델, 메서드, 처리 시간 출력
+
 const express = require('express');
 const cors = require('cors');
+const { Store, OdooError } = require('./store');
+const { MODELS, populate } = require('./schema');
+
+const DEFAULTS = {
+  port: 8069,
+  latency: 0,
+  jitter: 0,
+  latencyPerRow: 0,
+  log: false,
+  employees: 200,
+  departments: 10,
+  payslipMonths: 12,
+  approvalCategories: 10,
+  approvalRequests: 2000,
+  appraisals: undefined,
+  courses: 20,
+  enrollments: 2000,
+  attendanceDays: 5,
+  leaves: 300,
+  seed: 42,
+  today: new Date().toISOString().slice(0, 10),
+};
+
+function parseArgs(argv) {
+  const options = { ...DEFAULTS };
+  argv.forEach((arg) => {
+    const match = arg.match(/^--([^=]+)(?:=(.*))?$/);
+    const key = match && match[1].replace(/-(\w)/g, (_, letter) => letter.toUpperCase());
+    if (!match || !(key in DEFAULTS)) {
+      console.error(`❌ 알 수 없는 옵션: ${arg}`);
+      process.exit(1);
+    }
+    const value = match[2];
+    if (typeof DEFAULTS[key] === 'boolean') {
+      options[key] = value === undefined || value === 'true';
+    } else if (key === 'today') {
+      options[key] = value;
+    } else {
+      options[key] = Number(value);
+    }
+  });
+  return options;
+}
+
+const options = parseArgs(process.argv.slice(2));
 const app = express();
-const PORT = 8069;
 
 // CORS 설정
 app.use(cors({
@@ -9,89 +71,195 @@ app.use(cors({
   credentials: true
 }));
 
-app.use(express.json());
+app.use(express.json({ limit: '50mb' }));
 
 // 모의 데이터
-const mockData = {
-  employees: [
-    { id: 1, name: '김개발', job_title: '시니어 개발자', department_id: [1, '개발팀'], work_email: 'kim@company.com', work_phone: '010-1234-5678' },
-    { id: 2, name: '이인사', job_title: 'HR 매니저', department_id: [2, '인사팀'], work_email: 'lee@company.com', work_phone: '010-2345-6789' },
-    { id: 3, name: '박마케팅', job_title: '마케팅 전문가', department_id: [3, '마케팅팀'], work_email: 'park@company.com', work_phone: '010-3456-7890' },
-    { id: 4, name: '최디자인', job_title: 'UI/UX 디자이너', department_id: [1, '개발팀'], work_email: 'choi@company.com', work_phone: '010-4567-8901' },
-    { id: 5, name: '정영업', job_title: '영업 담당자', department_id: [4, '영업팀'], work_email: 'jung@company.com', work_phone: '010-5678-9012' }
-  ],
-  departments: [
-    { id: 1, name: '개발팀', parent_id: false, manager_id: [1, '김개발'], member_ids: [1, 4] },
-    { id: 2, name: '인사팀', parent_id: false, manager_id: [2, '이인사'], member_ids: [2] },
-    { id: 3, name: '마케팅팀', parent_id: false, manager_id: [3, '박마케팅'], member_ids: [3] },
-    { id: 4, name: '영업팀', parent_id: false, manager_id: [5, '정영업'], member_ids: [5] }
-  ],
-  attendance: [
-    { id: 1, employee_id: [1, '김개발'], check_in: '2025-08-05 09:00:00', check_out: '2025-08-05 18:00:00', worked_hours: 8.0 },
-    { id: 2, employee_id: [2, '이인사'], check_in: '2025-08-05 09:15:00', check_out: '2025-08-05 18:30:00', worked_hours: 8.25 },
-    { id: 3, employee_id: [3, '박마케팅'], check_in: '2025-08-05 08:45:00', check_out: '2025-08-05 17:45:00', worked_hours: 8.0 },
-    { id: 4, employee_id: [4, '최디자인'], check_in: '2025-08-05 09:30:00', check_out: null, worked_hours: 0 }
-  ],
-  payslips: [
-    { id: 1, employee_id: [1, '김개발'], date_from: '2025-07-01', date_to: '2025-07-31', state: 'done', net_wage: 4500000 },
-    { id: 2, employee_id: [2, '이인사'], date_from: '2025-07-01', date_to: '2025-07-31', state: 'done', net_wage: 4200000 },
-    { id: 3, employee_id: [3, '박마케팅'], date_from: '2025-07-01', date_to: '2025-07-31', state: 'draft', net_wage: 3800000 }
-  ],
-  timeoff: [
-    { id: 1, employee_id: [1, '김개발'], holiday_status_id: [1, '연차'], date_from: '2025-08-10', date_to: '2025-08-12', state: 'confirm', number_of_days: 3 },
-    { id: 2, employee_id: [2, '이인사'], holiday_status_id: [2, '병가'], date_from: '2025-08-15', date_to: '2025-08-15', state: 'validate', number_of_days: 1 }
-  ],
-  approvals: [
-    { id: 1, name: '출장 신청', employee_id: [1, '김개발'], category_id: [1, '출장'], state: 'pending', date: '2025-08-05' },
-    { id: 2, name: '장비 구매 요청', employee_id: [4, '최디자인'], category_id: [2, '구매'], state: 'approved', date: '2025-08-04' }
-  ],
-  courses: [
-    { id: 1, name: 'React 고급 과정', description: 'React 심화 학습', state: 'published', duration: 40 },
-    { id: 2, name: 'Python 기초', description: 'Python 프로그래밍 입문', state: 'published', duration: 30 },
-    { id: 3, name: '프로젝트 관리', description: '효과적인 프로젝트 관리 방법론', state: 'published', duration: 20 }
-  ],
-  appraisals: [
-    { id: 1, employee_id: [1, '김개발'], name: '2025 상반기 평가', state: 'new', date_close: '2025-08-31' },
-    { id: 2, employee_id: [2, '이인사'], name: '2025 상반기 평가', state: 'pending', date_close: '2025-08-31' }
-  ]
-};
+console.log('⏳ 모의 데이터 생성 중...');
+const startedAt = Date.now();
+const store = new Store(MODELS);
+populate(store, options);
+console.log(`✅ 데이터 생성 완료 (${((Date.now() - startedAt) / 1000).toFixed(1)}초)`);
 
 // 세션 관리
-let sessions = {};
+const sessions = new Map();
+
+function sessionOf(req) {
+  const match = /(?:^|;\s*)session_id=([^;]+)/.exec(req.headers.cookie || '');
+  return (match && sessions.get(match[1])) || { uid: 1 };
+}
+
+function contextOf(req, kwargs) {
+  return { ...(kwargs && kwargs.context), uid: sessionOf(req).uid, today: options.today };
+}
+
+// Odoo와 같이 오류도 HTTP 200의 JSON-RPC error로 응답
+function serializeError(error) {
+  return {
+    code: 200,
+    message: 'Odoo Server Error',
+    data: {
+      name: error instanceof OdooError ? error.errorName : 'builtins.Exception',
+      message: error.message,
+      arguments: [error.message],
+      debug: error instanceof OdooError ? '' : error.stack,
+    },
+  };
+}
+
+// 설정한 지연 시간만큼 응답을 늦춤 (rows: 응답에 포함된 레코드 수)
+function respond(res, body, rows = 0) {
+  const delay = options.latency + Math.random() * options.jitter + (rows / 1000) * options.latencyPerRow;
+  if (delay > 0) {
+    setTimeout(() => res.json(body), delay);
+  } else {
+    res.json(body);
+  }
+}
+
+function countRows(result) {
+  if (Array.isArray(result)) {
+    return result.length;
+  }
+  return result && Array.isArray(result.records) ? result.records.length : 0;
+}
+
+const READ_FIELDS = (kwargs, position, args) => kwargs.fields || args[position] || [];
+
+// call_kw 메서드 처리: ORM 기본 메서드, 그 다음 모델별 메서드
+function callKw(model, method, args = [], kwargs = {}, ctx) {
+  const table = store.table(model);
+  switch (method) {
+    case 'search_read':
+      return store.searchRead(model, kwargs.domain || args[0] || [], READ_FIELDS(kwargs, 1, args), {
+        offset: kwargs.offset || args[2] || 0,
+        limit: kwargs.limit || args[3] || undefined,
+        order: kwargs.order || args[4],
+      }, ctx);
+    case 'search': {
+      const domain = kwargs.domain || args[0] || [];
+      if (kwargs.count) {
+        return store.searchCount(model, domain, ctx);
+      }
+      return store.searchIds(model, domain, {
+        offset: kwargs.offset || args[1] || 0,
+        limit: kwargs.limit || args[2] || undefined,
+        order: kwargs.order || args[3],
+      }, ctx);
+    }
+    case 'search_count':
+      return store.searchCount(model, kwargs.domain || args[0] || [], ctx);
+    case 'read':
+      return store.read(model, [].concat(args[0] || []), READ_FIELDS(kwargs, 1, args), ctx);
+    case 'search_page':
+      return store.searchPage(
+        model,
+        kwargs.domain || args[0] || [],
+        READ_FIELDS(kwargs, 1, args),
+        kwargs.limit || args[2] || 80,
+        kwargs.cursor || args[3] || null,
+        ctx,
+      );
+    case 'read_group':
+      return store.readGroup(
+        model,
+        kwargs.domain || args[0] || [],
+        kwargs.fields || args[1] || [],
+        kwargs.groupby || args[2] || [],
+        {
+          offset: kwargs.offset || args[3] || 0,
+          limit: kwargs.limit || args[4] || undefined,
+          orderby: kwargs.orderby || args[5],
+          lazy: kwargs.lazy !== undefined ? kwargs.lazy : (args[6] !== undefined ? args[6] : true),
+        },
+        ctx,
+      );
+    case 'name_search':
+      return store.nameSearch(
+        model,
+        kwargs.name || args[0] || '',
+        kwargs.args || args[1] || [],
+        kwargs.operator || args[2] || 'ilike',
+        kwargs.limit || args[3] || 100,
+        ctx,
+      );
+    case 'name_get':
+      return [].concat(args[0] || []).filter((id) => table.rows.has(id)).map((id) => [id, table.displayName(id)]);
+    case 'fields_get':
+      return store.fieldsGet(model, kwargs.attributes || args[1]);
+    case 'create': {
+      const valsList = kwargs.vals_list || args[0] || {};
+      const ids = store.create(model, [].concat(valsList), ctx);
+      return Array.isArray(valsList) ? ids : ids[0];
+    }
+    case 'write':
+      return store.write(model, [].concat(args[0]), kwargs.vals || args[1] || {});
+    case 'unlink':
+      return store.unlink(model, [].concat(args[0]));
+    default:
+      break;
+  }
+  const { methods = {}, modelMethods = {} } = table.spec;
+  if (modelMethods[method]) {
+    return modelMethods[method](store, args, kwargs, ctx);
+  }
+  if (methods[method]) {
+    const result = methods[method](store, [].concat(args[0] || []), args.slice(1), kwargs, ctx);
+    return result === undefined ? true : result;
+  }
+  throw new OdooError(`The method '${method}' does not exist on the model '${model}'`, 'builtins.AttributeError');
+}
+
+function timedCall(req, { model, method, args, kwargs }) {
+  const start = process.hrtime.bigint();
+  try {
+    return callKw(model, method, args, kwargs || {}, contextOf(req, kwargs));
+  } finally {
+    if (options.log) {
+      console.log(`API 호출: ${model}.${method} (${(Number(process.hrtime.bigint() - start) / 1e6).toFixed(1)}ms)`);
+    }
+  }
+}
 
 // 인증 엔드포인트
 app.post('/web/session/authenticate', (req, res) => {
   const { params } = req.body;
   const { login, password } = params;
-  
-  // 간단한 인증 (실제로는 더 복잡한 로직 필요)
-  if (login === 'admin' && password === 'admin') {
-    const sessionId = 'mock_session_' + Date.now();
-    sessions[sessionId] = { uid: 1, login: 'admin' };
-    
-    res.json({
+  const users = store.table('res.users');
+  const [uid] = [...users.rows.values()].filter((user) => user.login === login).map((user) => user.id);
+
+  // 간단한 인증: admin/admin 또는 생성된 사용자(employeeN)의 비밀번호는 로그인과 같음
+  if (uid && password === login) {
+    const sessionId = `mock_session_${Date.now()}_${sessions.size}`;
+    sessions.set(sessionId, { uid, login });
+    res.cookie('session_id', sessionId, { httpOnly: true });
+    respond(res, {
       jsonrpc: '2.0',
       id: req.body.id,
       result: {
-        uid: 1,
+        uid,
         session_id: sessionId,
-        username: 'admin',
-        user_context: {},
+        username: login,
+        name: users.displayName(uid),
+        user_context: { lang: 'ko_KR', tz: 'Asia/Seoul', uid },
         db: 'odoo_hr'
       }
     });
   } else {
-    res.status(401).json({
+    respond(res, {
       jsonrpc: '2.0',
       id: req.body.id,
-      error: { message: '인증 실패' }
+      error: serializeError(new OdooError('Access Denied', 'odoo.exceptions.AccessDenied'))
     });
   }
 });
 
 // 로그아웃 엔드포인트
 app.post('/web/session/destroy', (req, res) => {
-  res.json({
+  const match = /(?:^|;\s*)session_id=([^;]+)/.exec(req.headers.cookie || '');
+  if (match) {
+    sessions.delete(match[1]);
+  }
+  respond(res, {
     jsonrpc: '2.0',
     id: req.body.id,
     result: true
@@ -99,116 +267,55 @@ app.post('/web/session/destroy', (req, res) => {
 });
 
 // 데이터베이스 목록
-app.get('/web/database/list', (req, res) => {
-  res.json(['odoo_hr']);
+app.all('/web/database/list', (req, res) => {
+  if (req.method === 'GET') {
+    res.json(['odoo_hr']);
+  } else {
+    respond(res, { jsonrpc: '2.0', id: req.body.id, result: ['odoo_hr'] });
+  }
 });
 
-// 메인 API 엔드포인트
-app.post('/web/dataset/call_kw', (req, res) => {
-  const { params } = req.body;
-  const { model, method, args, kwargs } = params;
-  
-  console.log(`API 호출: ${model}.${method}`, args, kwargs);
-  
+// 메인 API 엔드포인트 (/web/dataset/call_kw/<model>/<method> 형식 포함)
+app.post(['/web/dataset/call_kw', '/web/dataset/call_kw/*'], (req, res) => {
   try {
-    let result = [];
-    
-    switch (model) {
-      case 'hr.employee':
-        if (method === 'search_read') {
-          result = mockData.employees.map(emp => ({
-            id: emp.id,
-            name: emp.name,
-            job_title: emp.job_title,
-            department_id: emp.department_id,
-            work_email: emp.work_email,
-            work_phone: emp.work_phone
-          }));
-        } else if (method === 'create') {
-          const newEmployee = { id: Date.now(), ...args[0] };
-          mockData.employees.push(newEmployee);
-          result = newEmployee.id;
-        } else if (method === 'write') {
-          const [ids, values] = args;
-          mockData.employees = mockData.employees.map(emp => 
-            ids.includes(emp.id) ? { ...emp, ...values } : emp
-          );
-          result = true;
-        } else if (method === 'unlink') {
-          const [ids] = args;
-          mockData.employees = mockData.employees.filter(emp => !ids.includes(emp.id));
-          result = true;
-        }
-        break;
-        
-      case 'hr.department':
-        if (method === 'search_read') {
-          result = mockData.departments;
-        }
-        break;
-        
-      case 'hr.attendance':
-        if (method === 'search_read') {
-          result = mockData.attendance;
-        }
-        break;
-        
-      case 'hr.payslip':
-        if (method === 'search_read') {
-          result = mockData.payslips;
-        }
-        break;
-        
-      case 'hr.leave':
-        if (method === 'search_read') {
-          result = mockData.timeoff;
-        }
-        break;
-        
-      case 'approval.request':
-        if (method === 'search_read') {
-          result = mockData.approvals;
-        }
-        break;
-        
-      case 'slide.channel':
-        if (method === 'search_read') {
-          result = mockData.courses;
-        }
-        break;
-        
-      case 'hr.appraisal':
-        if (method === 'search_read') {
-          result = mockData.appraisals;
-        }
-        break;
-        
-      default:
-        result = [];
-    }
-    
-    res.json({
-      jsonrpc: '2.0',
-      id: req.body.id,
-      result: result
-    });
-    
+    const result = timedCall(req, req.body.params);
+    respond(res, { jsonrpc: '2.0', id: req.body.id, result }, countRows(result));
   } catch (error) {
-    console.error('API 오류:', error);
-    res.status(500).json({
-      jsonrpc: '2.0',
-      id: req.body.id,
-      error: { message: error.message }
-    });
+    console.error('API 오류:', error.message);
+    respond(res, { jsonrpc: '2.0', id: req.body.id, error: serializeError(error) });
   }
 });
 
-app.listen(PORT, () => {
-  console.log(`🚀 모의 Odoo 백엔드 서버가 http://localhost:${PORT}에서 실행 중입니다`);
-  console.log(`📊 테스트 데이터:`);
-  console.log(`   - 직원: ${mockData.employees.length}명`);
-  console.log(`   - 부서: ${mockData.departments.length}개`);
-  console.log(`   - 출근 기록: ${mockData.attendance.length}건`);
-  console.log(`   - 급여명세서: ${mockData.payslips.length}건`);
-  console.log(`\n🔐 테스트 계정: admin / admin`);
+// simple_hr_api 배치 엔드포인트: 호출별 결과 또는 오류를 순서대로 반환
+app.post('/simple_hr_api/call_kw_batch', (req, res) => {
+  let rows = 0;
+  const results = (req.body.params.calls || []).map((call) => {
+    try {
+      const result = timedCall(req, call);
+      rows += countRows(result);
+      return { result };
+    } catch (error) {
+      const serialized = serializeError(error);
+      return { error: { message: error.message, data: serialized.data } };
+    }
+  });
+  respond(res, { jsonrpc: '2.0', id: req.body.id, result: results }, rows);
+});
+
+app.listen(options.port, () => {
+  const count = (model) => store.table(model).size.toLocaleString();
+  console.log(`🚀 모의 Odoo 백엔드 서버가 http://localhost:${options.port}에서 실행 중입니다`);
+  console.log(`📊 테스트 데이터 (seed ${options.seed}, 기준일 ${options.today}):`);
+  console.log(`   - 직원: ${count('hr.employee')}명`);
+  console.log(`   - 부서: ${count('hr.department')}개`);
+  console.log(`   - 출근 기록: ${count('hr.attendance')}건`);
+  console.log(`   - 휴가: ${count('hr.leave')}건`);
+  console.log(`   - 급여명세서: ${count('hr.payslip')}건`);
+  console.log(`   - 결재 요청: ${count('approval.request')}건`);
+  console.log(`   - 인사 평가: ${count('hr.appraisal')}건`);
+  console.log(`   - 교육 과정: ${count('elearning.course')}개, 수강 등록: ${count('elearning.enrollment')}건`);
+  if (options.latency || options.jitter || options.latencyPerRow) {
+    console.log(`⏱️  응답 지연: ${options.latency}ms + 최대 ${options.jitter}ms, 1000행당 ${options.latencyPerRow}ms`);
+  }
+  console.log(`\n🔐 테스트 계정: admin / admin (employee1 / employee1 ...)`);
 });
@@ -0,0 +1,988 @@
+// 메모리 기반 모의 ORM
+// - 모델별 테이블(Map)과 필드 인덱스를 유지하고 Odoo 도메인을 인덱스로 평가
+//   · many2one / selection / boolean / many2many 필드: 값 -> id 집합 해시 인덱스 (=, !=, in, not in)
+//   · 날짜, 숫자 필드: 정렬된 (값, id) 배열을 이분 탐색 (>, >=, <, <=), 변경 시에만 다시 생성
+//   · 그 외 조건은 앞선 조건으로 좁혀진 후보만 순회하며 비교
+// - 정렬 순서별 id 목록을 캐시해 limit/offset 조회와 search_page(키셋 페이지네이션)를 빠르게 처리
+// - 오류는 Odoo와 같은 JSON-RPC 오류 형식으로 변환할 수 있도록 OdooError로 던짐
+
+const ALL = null; // 도메인 평가 결과: 전체 레코드
+
+class OdooError extends Error {
+  constructor(message, name = 'odoo.exceptions.UserError') {
+    super(message);
+    this.errorName = name;
+  }
+}
+
+const HASH_INDEXED = new Set(['many2one', 'selection', 'boolean', 'many2many']);
+const RANGE_INDEXED = new Set(['date', 'datetime', 'integer', 'float']);
+const NEGATIVE_OPERATORS = new Set(['!=', 'not in', 'not like', 'not ilike']);
+
+function toDatetimeString(value) {
+  if (!value || typeof value !== 'string') {
+    return value;
+  }
+  // 프론트엔드가 보내는 ISO 형식(2025-08-05T09:00:00.000Z)을 Odoo 형식으로 변환
+  return value.replace('T', ' ').replace(/(\.\d+)?Z$/, '').slice(0, 19);
+}
+
+function likeToRegExp(pattern, operator) {
+  const escaped = String(pattern).replace(/[.*+?^${}()|[\]\\]/g, '\\$&').replace(/%/g, '.*').replace(/_/g, '.');
+  const anchored = operator.startsWith('=') ? `^${escaped}$` : escaped;
+  return new RegExp(anchored, operator.includes('ilike') ? 'i' : '');
+}
+
+function compareValues(a, b) {
+  if (a === b) {
+    return 0;
+  }
+  return a < b ? -1 : 1;
+}
+
+class Table {
+  constructor(store, name, spec) {
+    this.store = store;
+    this.name = name;
+    this.spec = spec;
+    this.fields = { id: { type: 'integer' }, ...spec.fields };
+    this.rows = new Map();
+    this.nextId = 1;
+    this.generation = 0;
+    this.hashIndexes = new Map();
+    this.rangeIndexes = new Map();
+    this.sortCache = new Map();
+    this.memo = new Map();
+    // 생성 시 기본값을 채울 저장 필드 (계산 필드 제외)
+    this.storedFields = Object.entries(this.fields).filter(([field, definition]) => field !== 'id' && !definition.compute);
+    Object.entries(this.fields).forEach(([field, definition]) => {
+      if (HASH_INDEXED.has(definition.type) && !definition.compute) {
+        this.hashIndexes.set(field, new Map());
+      }
+    });
+  }
+
+  get size() {
+    return this.rows.size;
+  }
+
+  field(name) {
+    const definition = this.fields[name];
+    if (!definition) {
+      throw new OdooError(`Invalid field '${name}' on model '${this.name}'`, 'builtins.ValueError');
+    }
+    return definition;
+  }
+
+  // 인덱스 유지 --------------------------------------------------------------
+
+  indexKeys(field, value) {
+    if (this.fields[field].type === 'many2many') {
+      return value || [];
+    }
+    return [value === undefined || value === null ? false : value];
+  }
+
+  addToIndexes(row) {
+    this.hashIndexes.forEach((index, field) => {
+      this.indexKeys(field, row[field]).forEach((key) => {
+        let ids = index.get(key);
+        if (!ids) {
+          ids = new Set();
+          index.set(key, ids);
+        }
+        ids.add(row.id);
+      });
+    });
+  }
+
+  removeFromIndexes(row) {
+    this.hashIndexes.forEach((index, field) => {
+      this.indexKeys(field, row[field]).forEach((key) => {
+        const ids = index.get(key);
+        if (ids) {
+          ids.delete(row.id);
+          if (ids.size === 0) {
+            index.delete(key);
+          }
+        }
+      });
+    });
+  }
+
+  touch() {
+    this.generation += 1;
+    this.rangeIndexes.clear();
+    this.sortCache.clear();
+    this.memo.clear();
+    this.store.touched(this.name);
+  }
+
+  cached(key, compute) {
+    if (!this.memo.has(key)) {
+      this.memo.set(key, compute());
+    }
+    return this.memo.get(key);
+  }
+
+  idsWhere(field, value) {
+    return this.hashIndexes.get(field).get(value === undefined || value === null ? false : value) || new Set();
+  }
+
+  countBy(field, ids = ALL) {
+    const counts = {};
+    this.hashIndexes.get(field).forEach((members, key) => {
+      let count = members.size;
+      if (ids !== ALL) {
+        count = 0;
+        members.forEach((id) => {
+          if (ids.has(id)) {
+            count += 1;
+          }
+        });
+      }
+      if (count) {
+        counts[key] = count;
+      }
+    });
+    return counts;
+  }
+
+  rangeIndex(field) {
+    if (!this.rangeIndexes.has(field)) {
+      const entries = [];
+      this.rows.forEach((row) => {
+        const value = row[field];
+        if (value !== false && value !== null && value !== undefined) {
+          entries.push([value, row.id]);
+        }
+      });
+      entries.sort((a, b) => compareValues(a[0], b[0]) || a[1] - b[1]);
+      this.rangeIndexes.set(field, entries);
+    }
+    return this.rangeIndexes.get(field);
+  }
+
+  // 정렬된 배열에서 조건을 만족하는 구간을 이분 탐색
+  idsInRange(field, operator, value) {
+    const entries = this.rangeIndex(field);
+    const lowerBound = (strict) => {
+      let low = 0;
+      let high = entries.length;
+      while (low < high) {
+        const middle = (low + high) >> 1;
+        const order = compareValues(entries[middle][0], value);
+        if (order < 0 || (strict && order === 0)) {
+          low = middle + 1;
+        } else {
+          high = middle;
+        }
+      }
+      return low;
+    };
+    let start = 0;
+    let end = entries.length;
+    if (operator === '>') {
+      start = lowerBound(true);
+    } else if (operator === '>=') {
+      start = lowerBound(false);
+    } else if (operator === '<') {
+      end = lowerBound(false);
+    } else {
+      end = lowerBound(true);
+    }
+    const ids = new Set();
+    for (let position = start; position < end; position += 1) {
+      ids.add(entries[position][1]);
+    }
+    return ids;
+  }
+
+  // 변경 ---------------------------------------------------------------------
+
+  normalize(vals, current = {}) {
+    const row = {};
+    Object.entries(vals).forEach(([field, value]) => {
+      const definition = this.field(field);
+      if (definition.compute) {
+        throw new OdooError(`Field '${field}' on model '${this.name}' is computed and cannot be written`);
+      }
+      switch (definition.type) {
+        case 'many2one':
+          row[field] = Array.isArray(value) ? value[0] : (value || false);
+          break;
+        case 'many2many':
+          row[field] = this.applyCommands(current[field] || [], value);
+          break;
+        case 'datetime':
+          row[field] = toDatetimeString(value) || false;
+          break;
+        case 'date':
+          row[field] = value ? String(value).slice(0, 10) : false;
+          break;
+        case 'integer':
+          row[field] = value ? parseInt(value, 10) : 0;
+          break;
+        case 'float':
+          row[field] = value ? Number(value) : 0;
+          break;
+        case 'boolean':
+          row[field] = Boolean(value);
+          break;
+        default:
+          row[field] = value === undefined ? false : value;
+      }
+    });
+    return row;
+  }
+
+  // many2many 명령 [(6, 0, ids)], [(4, id)], [(3, id)], [(5,)] 또는 id 배열
+  applyCommands(ids, commands) {
+    if (!Array.isArray(commands)) {
+      return ids;
+    }
+    if (commands.every((command) => typeof command === 'number')) {
+      return [...commands];
+    }
+    let result = [...ids];
+    commands.forEach(([code, id, values]) => {
+      if (code === 6) {
+        result = [...values];
+      } else if (code === 4 && !result.includes(id)) {
+        result.push(id);
+      } else if (code === 3) {
+        result = result.filter((current) => current !== id);
+      } else if (code === 5) {
+        result = [];
+      }
+    });
+    return result;
+  }
+
+  insert(vals, ctx) {
+    const defaults = {};
+    this.storedFields.forEach(([field, definition]) => {
+      if (field in vals) {
+        return;
+      }
+      const fallback = { many2many: [], integer: 0, float: 0 }[definition.type];
+      defaults[field] = typeof definition.default === 'function'
+        ? definition.default(ctx, this.store)
+        : (definition.default !== undefined ? definition.default : (fallback === undefined ? false : fallback));
+    });
+    const row = { ...defaults, ...this.normalize(vals), id: vals.id || this.nextId };
+    this.nextId = Math.max(this.nextId, row.id + 1);
+    if (this.spec.recompute) {
+      this.spec.recompute(row, this.store);
+    }
+    this.rows.set(row.id, row);
+    this.addToIndexes(row);
+    return row;
+  }
+
+  update(ids, vals) {
+    ids.forEach((id) => {
+      const row = this.rows.get(id);
+      if (!row) {
+        return;
+      }
+      this.removeFromIndexes(row);
+      Object.assign(row, this.normalize(vals, row));
+      if (this.spec.recompute) {
+        this.spec.recompute(row, this.store);
+      }
+      this.addToIndexes(row);
+    });
+    this.touch();
+  }
+
+  remove(ids) {
+    ids.forEach((id) => {
+      const row = this.rows.get(id);
+      if (row) {
+        this.removeFromIndexes(row);
+        this.rows.delete(id);
+      }
+    });
+    this.touch();
+  }
+
+  // 조회 ---------------------------------------------------------------------
+
+  displayName(id) {
+    const row = this.rows.get(id);
+    if (!row) {
+      return '';
+    }
+    return this.spec.displayName ? this.spec.displayName(row, this.store) : row[this.spec.recName || 'name'];
+  }
+
+  value(row, field, ctx) {
+    const definition = this.field(field);
+    if (definition.compute) {
+      return definition.compute(row, this.store, ctx);
+    }
+    if (definition.type === 'one2many') {
+      const comodel = this.store.table(definition.comodel);
+      return [...comodel.idsWhere(definition.inverse, row.id)].sort((a, b) => a - b);
+    }
+    return row[field];
+  }
+
+  format(row, fields, ctx) {
+    const record = { id: row.id };
+    fields.forEach((field) => {
+      if (field === 'id') {
+        return;
+      }
+      if (field === 'display_name') {
+        record.display_name = this.displayName(row.id);
+        return;
+      }
+      const definition = this.field(field);
+      const value = this.value(row, field, ctx);
+      if (definition.type === 'many2one') {
+        record[field] = value ? [value, this.store.table(definition.comodel).displayName(value)] : false;
+      } else {
+        record[field] = value === undefined ? false : value;
+      }
+    });
+    return record;
+  }
+
+  readableFields() {
+    return Object.keys(this.fields);
+  }
+
+  parseOrder(order) {
+    const terms = (order || this.spec.order || 'id').split(',').map((term) => {
+      const [field, direction] = term.trim().split(/\s+/);
+      this.field(field);
+      return { field, descending: (direction || '').toLowerCase() === 'desc' };
+    });
+    if (!terms.some((term) => term.field === 'id')) {
+      terms.push({ field: 'id', descending: false });
+    }
+    return terms;
+  }
+
+  sortKey(row, field, ctx) {
+    const definition = this.fields[field];
+    const value = this.value(row, field, ctx);
+    if (definition.type === 'many2one') {
+      return value ? this.store.table(definition.comodel).displayName(value) : null;
+    }
+    return value === false || value === undefined ? null : value;
+  }
+
+  comparator(terms, ctx) {
+    const compareKeys = this.keyComparator(terms);
+    return (left, right) => compareKeys(
+      terms.map(({ field }) => this.sortKey(left, field, ctx)),
+      terms.map(({ field }) => this.sortKey(right, field, ctx)),
+    );
+  }
+
+  keyComparator(terms) {
+    return (left, right) => {
+      for (let index = 0; index < terms.length; index += 1) {
+        const { descending } = terms[index];
+        const a = left[index];
+        const b = right[index];
+        if (a === b) {
+          continue;
+        }
+        // PostgreSQL과 같이 NULL은 오름차순에서 마지막, 내림차순에서 처음
+        if (a === null) {
+          return descending ? -1 : 1;
+        }
+        if (b === null) {
+          return descending ? 1 : -1;
+        }
+        return descending ? -compareValues(a, b) : compareValues(a, b);
+      }
+      return 0;
+    };
+  }
+
+  // 정렬 키를 레코드마다 한 번만 계산 (many2one 이름 조회 등)
+  sortRows(rows, terms, ctx) {
+    const keyed = [...rows].map((row) => ({
+      id: row.id,
+      keys: terms.map(({ field }) => this.sortKey(row, field, ctx)),
+    }));
+    const compareKeys = this.keyComparator(terms);
+    keyed.sort((left, right) => compareKeys(left.keys, right.keys));
+    return keyed.map((entry) => entry.id);
+  }
+
+  sortedIds(terms, ctx) {
+    const key = JSON.stringify(terms);
+    if (!this.sortCache.has(key)) {
+      this.sortCache.set(key, this.sortRows(this.rows.values(), terms, ctx));
+    }
+    return this.sortCache.get(key);
+  }
+}
+
+class Store {
+  constructor(models) {
+    this.tables = new Map();
+    this.dependents = new Map();
+    Object.entries(models).forEach(([name, spec]) => {
+      this.tables.set(name, new Table(this, name, spec));
+      (spec.dependsOn || []).forEach((dependency) => {
+        if (!this.dependents.has(dependency)) {
+          this.dependents.set(dependency, []);
+        }
+        this.dependents.get(dependency).push(name);
+      });
+    });
+  }
+
+  table(model) {
+    const table = this.tables.get(model);
+    if (!table) {
+      throw new OdooError(`Object ${model} doesn't exist`, 'builtins.KeyError');
+    }
+    if (table.spec.derive) {
+      this.refreshDerived(table);
+    }
+    return table;
+  }
+
+  // 다른 모델에서 집계되는 테이블(hr.payslip.summary)은 원본이 바뀐 뒤 처음 조회할 때 다시 생성
+  refreshDerived(table) {
+    const source = this.tables.get(table.spec.derive.from);
+    if (table.derivedFrom === source.generation) {
+      return;
+    }
+    table.derivedFrom = source.generation;
+    table.rows.clear();
+    table.hashIndexes.forEach((index) => index.clear());
+    table.nextId = 1;
+    table.spec.derive.build(this).forEach((vals) => table.insert(vals, {}));
+    table.touch();
+  }
+
+  // 다른 모델 값으로 계산되는 필드(집계, 관련 필드)의 캐시 무효화
+  touched(model) {
+    (this.dependents.get(model) || []).forEach((dependent) => {
+      const table = this.tables.get(dependent);
+      table.memo.clear();
+      table.sortCache.clear();
+      table.rangeIndexes.clear();
+    });
+  }
+
+  // 도메인 ------------------------------------------------------------------
+
+  parseDomain(domain) {
+    const tokens = domain || [];
+    let position = 0;
+    const parseTerm = () => {
+      const token = tokens[position];
+      position += 1;
+      if (token === '&' || token === '|') {
+        const left = parseTerm();
+        const right = parseTerm();
+        return { type: token === '&' ? 'and' : 'or', children: [left, right] };
+      }
+      if (token === '!') {
+        return { type: 'not', child: parseTerm() };
+      }
+      if (!Array.isArray(token) || token.length !== 3) {
+        throw new OdooError(`Invalid domain term ${JSON.stringify(token)}`, 'builtins.ValueError');
+      }
+      return { type: 'leaf', leaf: token };
+    };
+    const terms = [];
+    while (position < tokens.length) {
+      terms.push(parseTerm());
+    }
+    // 최상위 조건들은 암묵적 AND, 중첩된 AND는 하나로 펼쳐 인덱스 조건을 먼저 평가
+    const flatten = (node) => (node.type === 'and' ? node.children.flatMap(flatten) : [node]);
+    return { type: 'and', children: terms.flatMap(flatten) };
+  }
+
+  search(model, domain, ctx) {
+    const table = this.table(model);
+    return this.evaluate(table, this.parseDomain(domain), ALL, ctx);
+  }
+
+  allIds(table) {
+    return new Set(table.rows.keys());
+  }
+
+  leafCost(table, node) {
+    if (node.type !== 'leaf') {
+      return 3;
+    }
+    const [field, operator] = node.leaf;
+    if (typeof field !== 'string' || field.includes('.') || (table.spec.search && table.spec.search[field])) {
+      return 2;
+    }
+    const definition = table.fields[field];
+    if (field === 'id' || (table.hashIndexes.has(field) && !NEGATIVE_OPERATORS.has(operator))) {
+      return 0;
+    }
+    if (definition && !definition.compute && RANGE_INDEXED.has(definition.type) && ['>', '>=', '<', '<='].includes(operator)) {
+      return 1;
+    }
+    return 4;
+  }
+
+  evaluate(table, node, candidates, ctx) {
+    if (node.type === 'and') {
+      const children = [...node.children].sort((a, b) => this.leafCost(table, a) - this.leafCost(table, b));
+      let result = candidates;
+      for (const child of children) {
+        result = this.evaluate(table, child, result, ctx);
+        if (result !== ALL && result.size === 0) {
+          break;
+        }
+      }
+      return result;
+    }
+    if (node.type === 'or') {
+      const result = new Set();
+      node.children.forEach((child) => {
+        const matched = this.evaluate(table, child, candidates, ctx);
+        (matched === ALL ? this.allIds(table) : matched).forEach((id) => result.add(id));
+      });
+      return result;
+    }
+    if (node.type === 'not') {
+      const base = candidates === ALL ? this.allIds(table) : candidates;
+      const excluded = this.evaluate(table, node.child, base, ctx);
+      return new Set([...base].filter((id) => !excluded.has(id)));
+    }
+    return this.evaluateLeaf(table, node.leaf, candidates, ctx);
+  }
+
+  intersect(candidates, ids) {
+    if (candidates === ALL) {
+      return ids;
+    }
+    const [small, large] = candidates.size < ids.size ? [candidates, ids] : [ids, candidates];
+    const result = new Set();
+    small.forEach((id) => {
+      if (large.has(id)) {
+        result.add(id);
+      }
+    });
+    return result;
+  }
+
+  subtract(table, candidates, ids) {
+    const base = candidates === ALL ? this.allIds(table) : candidates;
+    const result = new Set();
+    base.forEach((id) => {
+      if (!ids.has(id)) {
+        result.add(id);
+      }
+    });
+    return result;
+  }
+
+  evaluateLeaf(table, leaf, candidates, ctx) {
+    let [field, operator, value] = leaf;
+    operator = String(operator).toLowerCase();
+
+    // (1, '=', 1) / (0, '=', 1)
+    if (typeof field === 'number') {
+      return field === value ? candidates : new Set();
+    }
+    if (operator === 'child_of' || operator === 'parent_of') {
+      // 계층 구조는 모의 데이터에서 사용하지 않으므로 in으로 처리
+      operator = 'in';
+      value = Array.isArray(value) ? value : [value];
+    }
+
+    // 검색 가능한 계산 필드는 모델이 정의한 도메인으로 변환
+    const searcher = table.spec.search && table.spec.search[field];
+    if (searcher) {
+      return this.evaluate(table, this.parseDomain(searcher(operator, value, ctx, this)), candidates, ctx);
+    }
+
+    // 경로 조건 (category_id.approver_ids): 연결 모델을 먼저 검색한 뒤 in 조건으로 변환
+    if (field.includes('.')) {
+      const [head, ...rest] = field.split('.');
+      const definition = table.field(head);
+      const matched = this.search(definition.comodel, [[rest.join('.'), operator, value]], ctx);
+      const comodelIds = matched === ALL ? this.allIds(this.table(definition.comodel)) : matched;
+      return this.evaluateLeaf(table, [head, 'in', [...comodelIds]], candidates, ctx);
+    }
+
+    if (field === 'id') {
+      const ids = new Set(Array.isArray(value) ? value : [value]);
+      return ['in', '='].includes(operator) ? this.intersect(candidates, ids) : this.subtract(table, candidates, ids);
+    }
+
+    const definition = table.field(field);
+
+    // many2one 이름 검색: ('department_id', 'ilike', '개발')
+    if (definition.type === 'many2one' && typeof value === 'string' && operator.includes('like')) {
+      const matched = this.search(definition.comodel, [[definition.recName || 'name', operator, value]], ctx);
+      const comodelIds = matched === ALL ? this.allIds(this.table(definition.comodel)) : matched;
+      return this.evaluateLeaf(table, [field, 'in', [...comodelIds]], candidates, ctx);
+    }
+
+    if (table.hashIndexes.has(field) && ['=', '!=', 'in', 'not in'].includes(operator)) {
+      const values = Array.isArray(value) ? value : [value];
+      const ids = new Set();
+      values.forEach((key) => table.idsWhere(field, key).forEach((id) => ids.add(id)));
+      return ['=', 'in'].includes(operator) ? this.intersect(candidates, ids) : this.subtract(table, candidates, ids);
+    }
+
+    if (!definition.compute && RANGE_INDEXED.has(definition.type) && ['>', '>=', '<', '<='].includes(operator)) {
+      const bound = definition.type === 'datetime' ? toDatetimeString(value) : value;
+      return this.intersect(candidates, table.idsInRange(field, operator, bound));
+    }
+
+    const predicate = this.predicate(definition, operator, value);
+    const result = new Set();
+    const scan = candidates === ALL ? table.rows.keys() : candidates;
+    for (const id of scan) {
+      if (predicate(table.value(table.rows.get(id), field, ctx))) {
+        result.add(id);
+      }
+    }
+    return result;
+  }
+
+  predicate(definition, operator, value) {
+    const bound = definition.type === 'datetime' ? toDatetimeString(value) : value;
+    const isEmpty = (current) => current === false || current === null || current === undefined || current === '';
+    switch (operator) {
+      case '=':
+        return bound === false ? isEmpty : (current) => current === bound;
+      case '!=':
+        return bound === false ? (current) => !isEmpty(current) : (current) => current !== bound;
+      case 'in':
+        return (current) => value.includes(current) || (value.includes(false) && isEmpty(current));
+      case 'not in':
+        return (current) => !value.includes(current);
+      case '>':
+        return (current) => !isEmpty(current) && current > bound;
+      case '>=':
+        return (current) => !isEmpty(current) && current >= bound;
+      case '<':
+        return (current) => !isEmpty(current) && current < bound;
+      case '<=':
+        return (current) => !isEmpty(current) && current <= bound;
+      case 'like':
+      case 'ilike':
+      case '=like':
+      case '=ilike': {
+        const pattern = likeToRegExp(value, operator);
+        return (current) => !isEmpty(current) && pattern.test(String(current));
+      }
+      case 'not like':
+      case 'not ilike': {
+        const pattern = likeToRegExp(value, operator.replace('not ', ''));
+        return (current) => isEmpty(current) || !pattern.test(String(current));
+      }
+      default:
+        throw new OdooError(`Invalid domain operator '${operator}'`, 'builtins.ValueError');
+    }
+  }
+
+  // ORM 메서드 ---------------------------------------------------------------
+
+  searchIds(model, domain, { order, limit, offset = 0 } = {}, ctx) {
+    const table = this.table(model);
+    const matched = this.search(model, domain, ctx);
+    const terms = table.parseOrder(order);
+    const end = limit ? offset + limit : undefined;
+    const orderKey = JSON.stringify(terms);
+
+    if (matched === ALL) {
+      return table.sortedIds(terms, ctx).slice(offset, end);
+    }
+    // 결과가 작으면 결과만 정렬, 크면 정렬 캐시를 순회하며 필요한 개수만 선택
+    if (!table.sortCache.has(orderKey) && matched.size * 4 < table.size) {
+      return table.sortRows([...matched].map((id) => table.rows.get(id)), terms, ctx).slice(offset, end);
+    }
+    const ids = [];
+    let skipped = 0;
+    for (const id of table.sortedIds(terms, ctx)) {
+      if (!matched.has(id)) {
+        continue;
+      }
+      if (skipped < offset) {
+        skipped += 1;
+        continue;
+      }
+      ids.push(id);
+      if (end !== undefined && ids.length >= limit) {
+        break;
+      }
+    }
+    return ids;
+  }
+
+  read(model, ids, fields, ctx) {
+    const table = this.table(model);
+    const names = fields && fields.length ? fields : table.readableFields();
+    return ids.filter((id) => table.rows.has(id)).map((id) => table.format(table.rows.get(id), names, ctx));
+  }
+
+  searchRead(model, domain, fields, options, ctx) {
+    return this.read(model, this.searchIds(model, domain, options, ctx), fields, ctx);
+  }
+
+  searchCount(model, domain, ctx) {
+    const matched = this.search(model, domain, ctx);
+    return matched === ALL ? this.table(model).size : matched.size;
+  }
+
+  // base.search_page (simple_hr_api)와 같은 키셋 페이지네이션
+  searchPage(model, domain, fields, limit = 80, cursor = null, ctx) {
+    const table = this.table(model);
+    const terms = table.parseOrder();
+    if (new Set(terms.map((term) => term.descending)).size > 1) {
+      throw new OdooError(`${model} cannot be paginated on a mixed direction order`);
+    }
+    if (cursor && cursor.length !== terms.length) {
+      throw new OdooError(`Invalid cursor for ${model}`);
+    }
+    const matched = this.search(model, domain, ctx);
+    const sorted = table.sortedIds(terms, ctx);
+    const compare = table.comparator(terms, ctx);
+
+    // 커서 다음 위치를 이분 탐색
+    let start = 0;
+    if (cursor) {
+      const cursorRow = {};
+      terms.forEach((term, index) => {
+        cursorRow[term.field] = table.fields[term.field].type === 'datetime'
+          ? toDatetimeString(cursor[index]) : cursor[index];
+      });
+      let high = sorted.length;
+      while (start < high) {
+        const middle = (start + high) >> 1;
+        if (compare(table.rows.get(sorted[middle]), cursorRow) <= 0) {
+          start = middle + 1;
+        } else {
+          high = middle;
+        }
+      }
+    }
+    const ids = [];
+    for (let position = start; position < sorted.length && ids.length <= limit; position += 1) {
+      if (matched === ALL || matched.has(sorted[position])) {
+        ids.push(sorted[position]);
+      }
+    }
+    const hasMore = ids.length > limit;
+    const page = ids.slice(0, limit);
+    const last = table.rows.get(page[page.length - 1]);
+    return {
+      records: this.read(model, page, fields, ctx),
+      next_cursor: hasMore ? terms.map((term) => table.value(last, term.field, ctx)) : null,
+    };
+  }
+
+  // read_group: 'field:agg' / 'alias:agg(field)' 집계, 날짜 그룹은 ':day' ':week' ':month' ':year'
+  readGroup(model, domain, fields, groupby, { lazy = true, orderby, limit, offset = 0 } = {}, ctx) {
+    const table = this.table(model);
+    const groupbys = (Array.isArray(groupby) ? groupby : [groupby]).filter(Boolean);
+    const active = lazy ? groupbys.slice(0, 1) : groupbys;
+    const matched = this.search(model, domain, ctx);
+    const ids = matched === ALL ? [...table.rows.keys()] : [...matched];
+
+    const aggregates = [];
+    (fields || []).forEach((spec) => {
+      const match = /^(\w+)(?::(\w+)(?:\((\w+)\))?)?$/.exec(spec);
+      if (!match) {
+        return;
+      }
+      const [, alias, func, source] = match;
+      const field = source || alias;
+      if (active.some((group) => group.split(':')[0] === field) || field === '__count') {
+        return;
+      }
+      const definition = table.fields[field];
+      if (!definition) {
+        throw new OdooError(`Invalid field '${field}' on model '${model}'`, 'builtins.ValueError');
+      }
+      const aggregator = func || (['integer', 'float'].includes(definition.type) && field !== 'id' ? 'sum' : null);
+      if (aggregator) {
+        aggregates.push({ alias, field, aggregator });
+      }
+    });
+
+    const groupKey = (row, spec) => {
+      const [field, granularity] = spec.split(':');
+      const definition = table.field(field);
+      const value = table.value(row, field, ctx);
+      if (['date', 'datetime'].includes(definition.type) && value) {
+        return this.dateGroup(value, granularity || 'month');
+      }
+      return value === undefined ? false : value;
+    };
+
+    const groups = new Map();
+    ids.forEach((id) => {
+      const row = table.rows.get(id);
+      const keys = active.map((spec) => groupKey(row, spec));
+      const key = JSON.stringify(keys);
+      if (!groups.has(key)) {
+        groups.set(key, { keys, rows: [] });
+      }
+      groups.get(key).rows.push(row);
+    });
+
+    // 그룹 없이 집계만 하면 레코드가 없어도 그룹 하나를 반환
+    if (active.length === 0 && groups.size === 0) {
+      groups.set('[]', { keys: [], rows: [] });
+    }
+    const countKey = lazy && active.length ? `${active[0].split(':')[0]}_count` : '__count';
+    let result = [...groups.values()].map(({ keys, rows }) => {
+      const group = { [countKey]: rows.length };
+      const groupDomain = [...(domain || [])];
+      active.forEach((spec, index) => {
+        const [field] = spec.split(':');
+        const definition = table.fields[field];
+        const key = keys[index];
+        if (definition.type === 'many2one') {
+          group[spec] = key ? [key, this.table(definition.comodel).displayName(key)] : false;
+          groupDomain.push([field, '=', key]);
+        } else if (key && typeof key === 'object') {
+          group[spec] = key.label;
+          groupDomain.push('&', [field, '>=', key.from], [field, '<', key.to]);
+        } else {
+          group[spec] = key;
+          groupDomain.push([field, '=', key]);
+        }
+      });
+      aggregates.forEach(({ alias, field, aggregator }) => {
+        group[alias] = this.aggregate(rows.map((row) => table.value(row, field, ctx)), aggregator);
+      });
+      group.__domain = groupDomain;
+      if (lazy && groupbys.length > 1) {
+        group.__context = { group_by: groupbys.slice(1) };
+      }
+      return group;
+    });
+
+    const orderTerms = (orderby || active.join(',')).split(',').filter(Boolean).map((term) => {
+      const [field, direction] = term.trim().split(/\s+/);
+      return { field, descending: (direction || '').toLowerCase() === 'desc' };
+    });
+    const sortValue = (value) => (Array.isArray(value) ? value[1] : value);
+    result.sort((left, right) => {
+      for (const { field, descending } of orderTerms) {
+        const a = sortValue(left[field]);
+        const b = sortValue(right[field]);
+        if (a !== b) {
+          const order = a === false ? 1 : b === false ? -1 : compareValues(a, b);
+          return descending ? -order : order;
+        }
+      }
+      return 0;
+    });
+    result = result.slice(offset, limit ? offset + limit : undefined);
+    return result;
+  }
+
+  dateGroup(value, granularity) {
+    const date = new Date(`${value.slice(0, 10)}T00:00:00Z`);
+    const iso = (day) => day.toISOString().slice(0, 10);
+    const months = ['January', 'February', 'March', 'April', 'May', 'June', 'July',
+      'August', 'September', 'October', 'November', 'December'];
+    if (granularity === 'day') {
+      const next = new Date(date);
+      next.setUTCDate(next.getUTCDate() + 1);
+      return { label: `${date.getUTCDate()} ${months[date.getUTCMonth()].slice(0, 3)} ${date.getUTCFullYear()}`, from: iso(date), to: iso(next) };
+    }
+    if (granularity === 'week') {
+      const start = new Date(date);
+      start.setUTCDate(start.getUTCDate() - ((start.getUTCDay() + 6) % 7));
+      const next = new Date(start);
+      next.setUTCDate(next.getUTCDate() + 7);
+      return { label: `W${iso(start)}`, from: iso(start), to: iso(next) };
+    }
+    if (granularity === 'year') {
+      const year = date.getUTCFullYear();
+      return { label: String(year), from: `${year}-01-01`, to: `${year + 1}-01-01` };
+    }
+    const start = new Date(Date.UTC(date.getUTCFullYear(), date.getUTCMonth(), 1));
+    const next = new Date(Date.UTC(date.getUTCFullYear(), date.getUTCMonth() + 1, 1));
+    return { label: `${months[start.getUTCMonth()]} ${start.getUTCFullYear()}`, from: iso(start), to: iso(next) };
+  }
+
+  aggregate(values, aggregator) {
+    const present = values.filter((value) => value !== false && value !== null && value !== undefined);
+    switch (aggregator) {
+      case 'sum':
+        return present.reduce((total, value) => total + value, 0);
+      case 'avg':
+        return present.length ? present.reduce((total, value) => total + value, 0) / present.length : false;
+      case 'min':
+        return present.length ? present.reduce((a, b) => (b < a ? b : a)) : false;
+      case 'max':
+        return present.length ? present.reduce((a, b) => (b > a ? b : a)) : false;
+      case 'count':
+        return present.length;
+      case 'count_distinct':
+        return new Set(present.map((value) => JSON.stringify(value))).size;
+      default:
+        throw new OdooError(`Invalid aggregation function '${aggregator}'`, 'builtins.ValueError');
+    }
+  }
+
+  create(model, valsList, ctx) {
+    const table = this.table(model);
+    const list = table.spec.beforeCreate ? table.spec.beforeCreate(valsList, this, ctx) : valsList;
+    const rows = list.map((vals) => table.insert(vals, ctx));
+    table.touch();
+    if (table.spec.afterCreate) {
+      table.spec.afterCreate(rows, this, ctx);
+    }
+    return rows.map((row) => row.id);
+  }
+
+  write(model, ids, vals) {
+    this.table(model).update(ids, vals);
+    return true;
+  }
+
+  unlink(model, ids) {
+    this.table(model).remove(ids);
+    return true;
+  }
+
+  nameSearch(model, name = '', domain = [], operator = 'ilike', limit = 100, ctx) {
+    const table = this.table(model);
+    const fullDomain = name ? [...domain, [table.spec.recName || 'name', operator, name]] : domain;
+    return this.searchIds(model, fullDomain, { limit }, ctx).map((id) => [id, table.displayName(id)]);
+  }
+
+  fieldsGet(model, attributes) {
+    const table = this.table(model);
+    const result = {};
+    Object.entries(table.fields).forEach(([name, definition]) => {
+      const description = {
+        type: definition.type,
+        string: definition.string || name,
+        store: !definition.compute && definition.type !== 'one2many',
+        readonly: Boolean(definition.compute) || name === 'id',
+        required: Boolean(definition.required),
+      };
+      if (definition.comodel) {
+        description.relation = definition.comodel;
+      }
+      if (definition.selection) {
+        description.selection = definition.selection;
+      }
+      result[name] = attributes && attributes.length
+        ? Object.fromEntries(Object.entries(description).filter(([key]) => attributes.includes(key)))
+        : description;
+    });
+    return result;
+  }
+}
+
+module.exports = { Store, OdooError, ALL, toDatetimeString };
@@ -0,0 +1,53 @@
+#!/bin/bash
+
+# 개발 프로파일(docker-compose.yml, workers = 0)과 운영 프로파일(docker-compose.prod.yml)에
+# 같은 JSON-RPC 부하를 차례로 걸고 처리량과 p99를 비교
+# 사용법: ./scripts/loadtest/compare-profiles.sh [rpc-loadtest.js 옵션...]
+#   예) ./scripts/loadtest/compare-profiles.sh --concurrency=40 --duration=60
+# 두 프로파일은 같은 DB 볼륨을 사용하므로 hr_populate 로 넣은 데이터가 그대로 쓰임
+
+cd "$(dirname "$0")/../.." || exit 1
+
+GREEN='\033[0;32m'
+RED='\033[0;31m'
+BLUE='\033[0;34m'
+NC='\033[0m'
+
+RESULTS="scripts/loadtest/results-$(date +%Y%m%d-%H%M%S).jsonl"
+URL="http://localhost:8069"
+
+wait_for_odoo() {
+    for _ in $(seq 1 60); do
+        if curl -sf -o /dev/null "$URL/web/login"; then
+            return 0
+        fi
+        sleep 2
+    done
+    return 1
+}
+
+run_profile() {
+    local label=$1
+    local compose_file=$2
+    shift 2
+
+    echo -e "${BLUE}ℹ️  [$label] $compose_file 실행${NC}"
+    docker-compose -f docker-compose.yml -f docker-compose.prod.yml down --remove-orphans > /dev/null 2>&1
+    docker-compose -f "$compose_file" up -d || return 1
+    if ! wait_for_odoo; then
+        echo -e "${RED}❌ [$label] Odoo가 응답하지 않습니다${NC}"
+        return 1
+    fi
+    node scripts/loadtest/rpc-loadtest.js --url="$URL" --label="$label" --output="$RESULTS" "$@"
+}
+
+run_profile dev docker-compose.yml "$@" || exit 1
+run_profile prod docker-compose.prod.yml "$@" || exit 1
+docker-compose -f docker-compose.prod.yml down
+
+echo ""
+echo -e "${GREEN}✅ 비교 결과 ($RESULTS)${NC}"
+node -e '
+const lines = require("fs").readFileSync(process.argv[1], "utf8").trim().split("\n").map(JSON.parse);
+console.table(Object.fromEntries(lines.map((run) => [run.label, run.total])));
+' "$RESULTS"
@@ -0,0 +1,371 @@
+#!/usr/bin/env node
+// JSON-RPC 부하 테스트
+// 프론트엔드 화면들이 실제로 보내는 call_kw 요청 조합을 가상 사용자 N명이 반복 재생하고
+// 처리량(req/s)과 지연 시간(p50/p95/p99)을 보고
+//
+// 사용법:
+//   node scripts/loadtest/rpc-loadtest.js --url=http://localhost:8069 --concurrency=20 --duration=60
+//
+// 옵션 (기본값):
+//   --url=http://localhost:8069   Odoo 주소 (CORS 프록시를 거치지 않고 직접 호출)
+//   --db=odoo_hr --login=admin --password=admin
+//   --concurrency=20              가상 사용자 수 (사용자마다 세션을 따로 로그인)
+//   --duration=30                 측정 시간(초)
+//   --warmup=5                    측정 전 워밍업 시간(초), 이 구간의 결과는 버림
+//   --think=0                     화면 사이의 대기 시간(ms)
+//   --batch                       한 화면의 호출을 RpcTransport처럼 call_kw_batch 하나로 묶어 전송
+//   --label=dev                   결과에 기록할 이름 (compare-profiles.sh가 프로파일 이름을 전달)
+//   --output=results.jsonl        결과를 JSON 한 줄로 추가 기록
+
+const http = require('http');
+const https = require('https');
+
+const options = parseArgs(process.argv.slice(2), {
+  url: 'http://localhost:8069',
+  db: 'odoo_hr',
+  login: 'admin',
+  password: 'admin',
+  concurrency: 20,
+  duration: 30,
+  warmup: 5,
+  think: 0,
+  batch: false,
+  label: '',
+  output: '',
+});
+
+const REQUEST_FIELDS = [
+  'id', 'name', 'category_id', 'request_owner_id', 'employee_id',
+  'date_start', 'date_end', 'reason', 'amount', 'state', 'create_date',
+];
+
+// 화면별 호출 조합과 비중 (frontend/src/pages 의 useQuery 호출 기준)
+const SCENARIOS = [
+  {
+    name: 'dashboard',
+    weight: 25,
+    run: (user) => user.page([['simple.hr.dashboard', 'get_kpis', [], {}]]),
+  },
+  {
+    name: 'employees',
+    weight: 20,
+    run: (user) => user.page([
+      ['hr.employee', 'search_read', [], {
+        domain: [], fields: ['name', 'job_title', 'department_id', 'work_email', 'work_phone'], limit: 100, offset: 0,
+      }],
+    ]),
+  },
+  {
+    name: 'approvals',
+    weight: 20,
+    run: async (user) => {
+      const [page] = await user.page([
+        ['approval.request', 'search_page', [], { domain: [], fields: REQUEST_FIELDS, limit: 80, cursor: null }],
+        ['approval.request', 'read_group', [[], ['state'], ['state']], { lazy: true }],
+      ]);
+      // 절반은 목록을 스크롤해 다음 페이지까지 조회
+      if (page && page.next_cursor && Math.random() < 0.5) {
+        await user.page([
+          ['approval.request', 'search_page', [], { domain: [], fields: REQUEST_FIELDS, limit: 80, cursor: page.next_cursor }],
+        ]);
+      }
+    },
+  },
+  {
+    name: 'payroll',
+    weight: 15,
+    run: (user) => user.page([
+      ['hr.payslip', 'search_read', [], {
+        domain: [], fields: ['employee_id', 'date_from', 'date_to', 'state', 'net_wage'], limit: 100, offset: 0,
+      }],
+      ['hr.employee', 'search_read', [], { domain: [], fields: ['name'], limit: 100, offset: 0 }],
+    ]),
+  },
+  {
+    name: 'payroll_summary',
+    weight: 5,
+    run: (user) => user.page([
+      ['hr.payslip.summary', 'get_dashboard_figures', [], { date_from: null, date_to: null }],
+    ]),
+  },
+  {
+    name: 'departments',
+    weight: 10,
+    run: (user) => user.page([
+      ['hr.department', 'search_read', [], {
+        domain: [], fields: ['name', 'manager_id', 'member_ids'], limit: 100, offset: 0,
+      }],
+      ['hr.employee', 'search_read', [], {
+        domain: [], fields: ['name', 'job_title', 'department_id'], limit: 100, offset: 0,
+      }],
+    ]),
+  },
+  {
+    name: 'approval_write',
+    weight: 5,
+    run: async (user) => {
+      if (!user.categoryId) {
+        return;
+      }
+      // 결재 요청을 만들고 바로 삭제해 데이터가 쌓이지 않게 함
+      const [requestId] = await user.page([
+        ['approval.request', 'create', [{ category_id: user.categoryId, reason: 'load test' }], {}],
+      ]);
+      await user.page([['approval.request', 'unlink', [[requestId]], {}]]);
+    },
+  },
+];
+
+const TOTAL_WEIGHT = SCENARIOS.reduce((total, scenario) => total + scenario.weight, 0);
+
+function parseArgs(argv, defaults) {
+  const parsed = { ...defaults };
+  argv.forEach((arg) => {
+    const match = arg.match(/^--([^=]+)(?:=(.*))?$/);
+    if (!match || !(match[1] in defaults)) {
+      console.error(`❌ 알 수 없는 옵션: ${arg}`);
+      process.exit(1);
+    }
+    const [, key, value] = match;
+    if (typeof defaults[key] === 'boolean') {
+      parsed[key] = value === undefined || value === 'true';
+    } else if (typeof defaults[key] === 'number') {
+      parsed[key] = Number(value);
+    } else {
+      parsed[key] = value;
+    }
+  });
+  return parsed;
+}
+
+function pickScenario() {
+  let roll = Math.random() * TOTAL_WEIGHT;
+  for (const scenario of SCENARIOS) {
+    roll -= scenario.weight;
+    if (roll < 0) {
+      return scenario;
+    }
+  }
+  return SCENARIOS[SCENARIOS.length - 1];
+}
+
+function percentile(sorted, ratio) {
+  if (sorted.length === 0) {
+    return 0;
+  }
+  const index = Math.min(sorted.length - 1, Math.ceil(ratio * sorted.length) - 1);
+  return sorted[Math.max(0, index)];
+}
+
+class Stats {
+  constructor() {
+    this.latencies = [];
+    this.errors = 0;
+  }
+
+  add(latency, failed) {
+    this.latencies.push(latency);
+    if (failed) {
+      this.errors += 1;
+    }
+  }
+
+  summary(seconds) {
+    const sorted = [...this.latencies].sort((a, b) => a - b);
+    const round = (value) => Math.round(value * 10) / 10;
+    return {
+      requests: sorted.length,
+      errors: this.errors,
+      rps: round(sorted.length / seconds),
+      p50: round(percentile(sorted, 0.5)),
+      p95: round(percentile(sorted, 0.95)),
+      p99: round(percentile(sorted, 0.99)),
+      max: round(sorted.length ? sorted[sorted.length - 1] : 0),
+    };
+  }
+}
+
+class VirtualUser {
+  constructor(base, agent, recorder) {
+    this.base = base;
+    this.agent = agent;
+    this.recorder = recorder;
+    this.cookie = '';
+    this.nextId = 1;
+    this.categoryId = null;
+    this.scenario = null;
+  }
+
+  post(path, params) {
+    const body = JSON.stringify({ jsonrpc: '2.0', method: 'call', params, id: this.nextId++ });
+    const transport = this.base.protocol === 'https:' ? https : http;
+    return new Promise((resolve, reject) => {
+      const request = transport.request({
+        hostname: this.base.hostname,
+        port: this.base.port,
+        path,
+        method: 'POST',
+        agent: this.agent,
+        headers: {
+          'Content-Type': 'application/json',
+          'Content-Length': Buffer.byteLength(body),
+          ...(this.cookie ? { Cookie: this.cookie } : {}),
+        },
+      }, (response) => {
+        const chunks = [];
+        response.on('data', (chunk) => chunks.push(chunk));
+        response.on('end', () => {
+          const setCookie = response.headers['set-cookie'];
+          const session = setCookie && setCookie.map((value) => value.split(';')[0]).find((value) => value.startsWith('session_id='));
+          if (session) {
+            this.cookie = session;
+          }
+          if (response.statusCode !== 200) {
+            reject(new Error(`HTTP ${response.statusCode}`));
+            return;
+          }
+          try {
+            const data = JSON.parse(Buffer.concat(chunks).toString());
+            if (data.error) {
+              reject(new Error(data.error.data ? data.error.data.message : data.error.message));
+            } else {
+              resolve(data.result);
+            }
+          } catch (error) {
+            reject(error);
+          }
+        });
+      });
+      request.on('error', reject);
+      request.end(body);
+    });
+  }
+
+  async login() {
+    const result = await this.post('/web/session/authenticate', {
+      db: options.db,
+      login: options.login,
+      password: options.password,
+    });
+    if (!result || !result.uid) {
+      throw new Error('로그인 실패');
+    }
+    const categories = await this.post('/web/dataset/call_kw', {
+      model: 'approval.category', method: 'search_read', args: [], kwargs: { domain: [], fields: ['id'], limit: 1 },
+    });
+    this.categoryId = categories.length ? categories[0].id : null;
+  }
+
+  // 측정 단위는 HTTP 요청 하나: 배치 모드에서는 화면 하나가 요청 하나
+  async timed(path, params) {
+    const start = process.hrtime.bigint();
+    let failed = false;
+    try {
+      return await this.post(path, params);
+    } catch (error) {
+      failed = true;
+      this.recorder.error(error);
+      return undefined;
+    } finally {
+      this.recorder.record(this.scenario, Number(process.hrtime.bigint() - start) / 1e6, failed);
+    }
+  }
+
+  async page(calls) {
+    if (options.batch && calls.length > 1) {
+      const outcomes = await this.timed('/simple_hr_api/call_kw_batch', {
+        calls: calls.map(([model, method, args, kwargs]) => ({ model, method, args, kwargs })),
+      });
+      return (outcomes || []).map((outcome) => outcome.result);
+    }
+    // 프론트엔드와 같이 한 화면의 호출은 동시에 전송
+    return Promise.all(calls.map(([model, method, args, kwargs]) => (
+      this.timed('/web/dataset/call_kw', { model, method, args, kwargs })
+    )));
+  }
+}
+
+async function main() {
+  const base = new URL(options.url);
+  const agent = new (base.protocol === 'https:' ? https : http).Agent({
+    keepAlive: true,
+    maxSockets: options.concurrency * 2,
+  });
+
+  const total = new Stats();
+  const perScenario = new Map(SCENARIOS.map((scenario) => [scenario.name, new Stats()]));
+  const errorMessages = new Map();
+  let measuring = false;
+
+  const recorder = {
+    record(scenario, latency, failed) {
+      if (measuring) {
+        total.add(latency, failed);
+        perScenario.get(scenario).add(latency, failed);
+      }
+    },
+    error(error) {
+      if (measuring) {
+        errorMessages.set(error.message, (errorMessages.get(error.message) || 0) + 1);
+      }
+    },
+  };
+
+  console.log(`🔐 가상 사용자 ${options.concurrency}명 로그인: ${options.url} (${options.db})`);
+  const users = await Promise.all(Array.from({ length: options.concurrency }, async () => {
+    const user = new VirtualUser(base, agent, recorder);
+    await user.login();
+    return user;
+  }));
+
+  let stopped = false;
+  const loops = users.map(async (user) => {
+    while (!stopped) {
+      const scenario = pickScenario();
+      user.scenario = scenario.name;
+      await scenario.run(user).catch((error) => recorder.error(error));
+      if (options.think > 0) {
+        await new Promise((resolve) => setTimeout(resolve, options.think));
+      }
+    }
+  });
+
+  console.log(`⏳ 워밍업 ${options.warmup}초...`);
+  await new Promise((resolve) => setTimeout(resolve, options.warmup * 1000));
+  measuring = true;
+  const startedAt = Date.now();
+  console.log(`🚀 측정 ${options.duration}초...`);
+  await new Promise((resolve) => setTimeout(resolve, options.duration * 1000));
+  measuring = false;
+  const seconds = (Date.now() - startedAt) / 1000;
+  stopped = true;
+  await Promise.all(loops);
+  agent.destroy();
+
+  const result = {
+    label: options.label,
+    url: options.url,
+    concurrency: options.concurrency,
+    duration: Math.round(seconds),
+    batch: options.batch,
+    total: total.summary(seconds),
+    scenarios: Object.fromEntries([...perScenario].map(([name, stats]) => [name, stats.summary(seconds)])),
+    errors: Object.fromEntries(errorMessages),
+  };
+
+  console.log('');
+  console.log(`📊 결과${options.label ? ` [${options.label}]` : ''} (ms)`);
+  console.table({ total: result.total, ...result.scenarios });
+  if (errorMessages.size) {
+    console.log('❌ 오류:', result.errors);
+  }
+  if (options.output) {
+    require('fs').appendFileSync(options.output, `${JSON.stringify(result)}\n`);
+    console.log(`💾 ${options.output} 에 기록`);
+  }
+}
+
+main().catch((error) => {
+  console.error('❌ 부하 테스트 실패:', error.message);
+  process.exit(1);
+});
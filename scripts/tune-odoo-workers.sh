@@ -0,0 +1,54 @@
+#!/bin/bash
+
+# 운영 프로파일(config/odoo.prod.conf)의 워커 수와 메모리 제한을 호스트 사양에 맞춰 갱신
+# 사용법: ./scripts/tune-odoo-workers.sh [CPU 수] [메모리(MB)]
+#   인자를 생략하면 nproc, /proc/meminfo 값을 사용
+#
+# 계산 방식
+#   workers           = 2 * CPU + 1
+#   max_cron_threads  = CPU가 4개 이상이면 2, 아니면 1
+#   limit_memory_hard = Odoo에 할당할 메모리(전체의 80%) / (workers + cron + gevent 1)
+#   limit_memory_soft = hard의 80%
+#   db_maxconn        = 워커 하나가 동시에 여는 연결 수 (PgBouncer가 실제 서버 연결을 공유)
+
+CONF="$(dirname "$0")/../config/odoo.prod.conf"
+
+GREEN='\033[0;32m'
+RED='\033[0;31m'
+NC='\033[0m'
+
+CPUS=${1:-$(nproc)}
+MEM_MB=${2:-$(awk '/MemTotal/ {print int($2 / 1024)}' /proc/meminfo)}
+
+if [ ! -f "$CONF" ]; then
+    echo -e "${RED}❌ 설정 파일이 없습니다: $CONF${NC}"
+    exit 1
+fi
+
+WORKERS=$((CPUS * 2 + 1))
+if [ "$CPUS" -ge 4 ]; then
+    CRON=2
+else
+    CRON=1
+fi
+PROCESSES=$((WORKERS + CRON + 1))
+HARD_MB=$((MEM_MB * 80 / 100 / PROCESSES))
+# 워커 하나가 요청 중간에 종료되지 않도록 최소값 보장
+if [ "$HARD_MB" -lt 512 ]; then
+    HARD_MB=512
+fi
+SOFT_MB=$((HARD_MB * 80 / 100))
+
+sed -i \
+    -e "s/^workers = .*/workers = $WORKERS/" \
+    -e "s/^max_cron_threads = .*/max_cron_threads = $CRON/" \
+    -e "s/^limit_memory_hard = .*/limit_memory_hard = $((HARD_MB * 1024 * 1024))/" \
+    -e "s/^limit_memory_soft = .*/limit_memory_soft = $((SOFT_MB * 1024 * 1024))/" \
+    -e "s/^; HTTP 워커 (prefork): .*/; HTTP 워커 (prefork): CPU ${CPUS}개 기준 2 * CPU + 1/" \
+    "$CONF"
+
+echo -e "${GREEN}✅ $CONF 갱신 완료${NC}"
+echo "   CPU $CPUS개, 메모리 ${MEM_MB}MB"
+echo "   workers = $WORKERS, max_cron_threads = $CRON"
+echo "   limit_memory_soft = ${SOFT_MB}MB, limit_memory_hard = ${HARD_MB}MB"
+echo "   PgBouncer max_client_conn 은 workers * db_maxconn 이상이어야 합니다: $((WORKERS * 16))"